@@ -12,7 +12,7 @@ from nous.api.http.deps import (
     _resolve_persona_from_request,
     _safe_get_context,
 )
-from nous.config.settings import Settings
+from nous.config.settings import get_settings as _get_settings
 from nous.infrastructure.logging.structured import get_logger
 
 if TYPE_CHECKING:
@@ -109,7 +109,7 @@ def register_admin_routes(mcp) -> None:
             if not file_bytes:
                 return JSONResponse({"error": "Uploaded file is empty"}, status_code=400)
 
-            settings = Settings()
+            settings = _get_settings()
             import_dir = Path(settings.import_dir)
             import_dir.mkdir(parents=True, exist_ok=True)
             zip_path = import_dir / f"_upload_{persona}.zip"
@@ -139,7 +139,7 @@ def register_admin_routes(mcp) -> None:
     @mcp.custom_route("/api/export/{persona}", methods=["GET"])
     async def export_data(request: Request) -> StreamingResponse:
         persona = _resolve_persona_from_request(request)
-        settings = Settings()
+        settings = _get_settings()
         persona_dir = Path(settings.data_dir) / persona
         if not persona_dir.exists():
             return JSONResponse({"error": f"Persona '{persona}' not found"}, status_code=404)
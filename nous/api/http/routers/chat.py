@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import json
 from typing import TYPE_CHECKING
 
@@ -179,12 +180,13 @@ def register_chat_routes(mcp) -> None:
         try:
             reflection_result = ctx.memory_service.get_by_tags(["reflection"])
             if reflection_result.is_ok and reflection_result.value:
-                sorted_refs = sorted(
+                # Only the 5 newest are shown; select them instead of sorting every reflection
+                newest_refs = heapq.nlargest(
+                    5,
                     reflection_result.value,
                     key=lambda m: getattr(m, "created_at", None) or "",
-                    reverse=True,
                 )
-                insights = [m.content for m in sorted_refs[:5]]
+                insights = [m.content for m in newest_refs]
         except Exception as e:
             logger.warning("get_chat_commitments: insights failed: %s", e)
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import weakref
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -18,12 +19,19 @@ from nous.application.event_bus import (
 from nous.domain.memory.session_event import SessionEvent
 from nous.infrastructure.logging.structured import get_logger
 from nous.infrastructure.sqlite.session_event_repo import SessionEventRepository
+from nous.migration.versions.v024_session_events import upgrade as ensure_session_events_schema
 
 if TYPE_CHECKING:
     from starlette.requests import Request
 
+    from nous.infrastructure.sqlite.connection import SQLiteConnection
+
 logger = get_logger(__name__)
 
+# Connections whose session_events schema has been checked; the fallback DDL
+# runs once per connection instead of on every ingest request.
+_session_events_ready: weakref.WeakSet[SQLiteConnection] = weakref.WeakSet()
+
 _ALL_EVENT_TYPES = frozenset(
     {
         EVENT_MEMORY_CREATED,
@@ -167,25 +175,10 @@ def register_events_routes(mcp) -> None:
             if token != api_key:
                 return JSONResponse({"error": "Invalid API key"}, status_code=401)
 
-        # 5. Ensure database schema exists (session_events table)
-        db = ctx.connection.get_memory_db()
-        db.execute("""
-            CREATE TABLE IF NOT EXISTS session_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                persona TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                summary TEXT NOT NULL,
-                detail TEXT,
-                metadata_json TEXT,
-                created_at TEXT NOT NULL DEFAULT (datetime('now'))
-            )
-        """)
-        db.execute("CREATE INDEX IF NOT EXISTS idx_session_events_session ON session_events(session_id, timestamp)")
-        db.execute("CREATE INDEX IF NOT EXISTS idx_session_events_persona ON session_events(persona, timestamp)")
-        db.execute("CREATE INDEX IF NOT EXISTS idx_session_events_type ON session_events(event_type, timestamp)")
-        db.commit()
+        # 5. Ensure database schema exists (session_events table, safety fallback to v024)
+        if ctx.connection not in _session_events_ready:
+            ensure_session_events_schema(ctx.connection.get_memory_db())
+            _session_events_ready.add(ctx.connection)
 
         # 6. Process events
         repo = SessionEventRepository(ctx.connection)
@@ -14,6 +14,7 @@ from nous.api.http.deps import (
     _strength_to_dict,
 )
 from nous.infrastructure.logging.structured import get_logger
+from nous.infrastructure.qdrant.adapter import memory_payload
 
 if TYPE_CHECKING:
     from starlette.requests import Request
@@ -256,7 +257,7 @@ def register_memory_routes(mcp) -> None:
             mem = result.value
             if ctx.vector_store is not None:
                 with contextlib.suppress(Exception):
-                    ctx.vector_store.upsert(persona, mem.key, mem.content)
+                    ctx.vector_store.upsert(persona, mem.key, mem.content, metadata=memory_payload(mem))
             return JSONResponse(
                 {"status": "ok", "memory": _memory_to_dict(mem)},
                 status_code=201,
@@ -293,7 +294,10 @@ def register_memory_routes(mcp) -> None:
             mem = result.value
             if "content" in updates and ctx.vector_store is not None:
                 with contextlib.suppress(Exception):
-                    ctx.vector_store.upsert(persona, mem.key, mem.content)
+                    ctx.vector_store.upsert(persona, mem.key, mem.content, metadata=memory_payload(mem))
+            elif updates.keys() & {"importance", "emotion", "tags"} and ctx.vector_store is not None:
+                with contextlib.suppress(Exception):
+                    ctx.vector_store.set_payload(persona, mem.key, memory_payload(mem))
             return JSONResponse({"status": "ok", "memory": _memory_to_dict(mem)})
         except Exception as exc:
             logger.exception("Unexpected error: %s", exc)
@@ -14,14 +14,44 @@ from nous.api.http.deps import (
     _safe_get_context,
 )
 from nous.application.use_cases import AppContextRegistry
-from nous.config.settings import Settings
+from nous.config.settings import get_settings
 from nous.infrastructure.logging.structured import get_logger
+from nous.infrastructure.qdrant.adapter import memory_payload
 
 if TYPE_CHECKING:
     from starlette.requests import Request
 
 logger = get_logger(__name__)
 
+# Dashboard goals/promises: status priority (active first) and the tags that carry a status
+_STATUS_PRIORITY = {"active": 0, "fulfilled": 1, "achieved": 1, "cancelled": 2}
+_GOAL_STATUSES = frozenset({"active", "achieved", "cancelled"})
+_PROMISE_STATUSES = frozenset({"active", "fulfilled", "cancelled"})
+_MAX_COMMITMENTS = 30
+
+
+def _commitment_rows(memories: list, statuses: frozenset[str]) -> list[dict]:
+    """Dashboard rows for goals or promises, active first and newest first within a status.
+
+    The status tag is resolved once per memory and shared by the sort key and the row.
+    """
+    with_status = [(next((t for t in (m.tags or []) if t in statuses), "active"), m) for m in memories]
+    with_status.sort(
+        key=lambda sm: (
+            _STATUS_PRIORITY.get(sm[0], 99),
+            -(sm[1].created_at.timestamp() if sm[1].created_at else 0),
+        )
+    )
+    return [
+        {
+            "content": m.content,
+            "status": status,
+            "created_at": m.created_at.isoformat() if m.created_at else None,
+            "key": m.key,
+        }
+        for status, m in with_status[:_MAX_COMMITMENTS]
+    ]
+
 
 def register_persona_routes(mcp) -> None:
     @mcp.custom_route("/health", methods=["GET"])
@@ -41,7 +71,7 @@ def register_persona_routes(mcp) -> None:
 
     @mcp.custom_route("/api/personas", methods=["GET"])
     async def list_personas(request: Request) -> JSONResponse:
-        settings = Settings()
+        settings = get_settings()
         data_dir = settings.data_dir
         data_path = Path(data_dir)
         if data_path.exists():
@@ -55,7 +85,7 @@ def register_persona_routes(mcp) -> None:
         from nous.api.http.dashboard import render_dashboard
 
         # Check if any personas exist; show setup screen if none.
-        settings = Settings()
+        settings = get_settings()
         data_path = Path(settings.data_dir)
         persona_count = 0
         if data_path.exists():
@@ -129,52 +159,10 @@ def register_persona_routes(mcp) -> None:
                 "max": round(max(strength_values), 3) if strength_values else None,
             }
 
-            # Helper: sort goals/promises by status priority (active first), then by recency
-            _status_priority = {"active": 0, "fulfilled": 1, "achieved": 1, "cancelled": 2}
-            _max_commitments = 30
-
             goals_result = ctx.memory_repo.get_by_tags(["goal"])
-            _goals_raw = goals_result.value if goals_result.is_ok else []
-            _goals_sorted = sorted(
-                _goals_raw,
-                key=lambda m: (
-                    _status_priority.get(
-                        next((t for t in (m.tags or []) if t in ("active", "achieved", "cancelled")), "active"),
-                        99,
-                    ),
-                    -(m.created_at.timestamp() if m.created_at else 0),
-                ),
-            )
-            goals = [
-                {
-                    "content": m.content,
-                    "status": next((t for t in (m.tags or []) if t in ("active", "achieved", "cancelled")), "active"),
-                    "created_at": m.created_at.isoformat() if m.created_at else None,
-                    "key": m.key,
-                }
-                for m in _goals_sorted[:_max_commitments]
-            ]
+            goals = _commitment_rows(goals_result.value if goals_result.is_ok else [], _GOAL_STATUSES)
             promises_result = ctx.memory_repo.get_by_tags(["promise"])
-            _promises_raw = promises_result.value if promises_result.is_ok else []
-            _promises_sorted = sorted(
-                _promises_raw,
-                key=lambda m: (
-                    _status_priority.get(
-                        next((t for t in (m.tags or []) if t in ("active", "fulfilled", "cancelled")), "active"),
-                        99,
-                    ),
-                    -(m.created_at.timestamp() if m.created_at else 0),
-                ),
-            )
-            promises = [
-                {
-                    "content": m.content,
-                    "status": next((t for t in (m.tags or []) if t in ("active", "fulfilled", "cancelled")), "active"),
-                    "created_at": m.created_at.isoformat() if m.created_at else None,
-                    "key": m.key,
-                }
-                for m in _promises_sorted[:_max_commitments]
-            ]
+            promises = _commitment_rows(promises_result.value if promises_result.is_ok else [], _PROMISE_STATUSES)
 
             try:
                 total_count = stats.get("total_count", 0)
@@ -264,7 +252,7 @@ def register_persona_routes(mcp) -> None:
             )
             if res.is_ok:
                 if ctx.vector_store:
-                    ctx.vector_store.upsert(persona, res.value.key, msg.content)
+                    ctx.vector_store.upsert(persona, res.value.key, msg.content, metadata=memory_payload(res.value))
                 imported += 1
             else:
                 skipped += 1
@@ -284,7 +272,7 @@ def register_persona_routes(mcp) -> None:
                 {"error": "Persona name must contain only alphanumeric characters, hyphens, and underscores"},
                 status_code=400,
             )
-        settings = Settings()
+        settings = get_settings()
         persona_dir = Path(settings.data_dir) / persona_name
         if persona_dir.exists():
             return JSONResponse({"error": f"Persona '{persona_name}' already exists"}, status_code=409)
@@ -303,7 +291,7 @@ def register_persona_routes(mcp) -> None:
     @mcp.custom_route("/api/personas/{persona}", methods=["DELETE"])
     async def delete_persona(request: Request) -> JSONResponse:
         persona = _resolve_persona_from_request(request)
-        settings = Settings()
+        settings = get_settings()
         persona_dir = (Path(settings.data_dir) / persona).resolve()
         if not str(persona_dir).startswith(str(Path(settings.data_dir).resolve()) + "/"):
             return JSONResponse({"error": "Invalid persona name"}, status_code=400)
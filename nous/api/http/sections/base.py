@@ -75,8 +75,9 @@ def render_utilities_js() -> str:
 def render_layout_shell(nav_html: str, tab_contents: str, tab_js: str, initial_persona: str | None = None) -> str:
     """Compose the full HTML page.
 
-    Uses string concatenation (NOT f-strings) because the embedded
-    JavaScript relies on ``${}`` template literals.
+    Joins the pieces (NOT f-strings) because the embedded JavaScript relies
+    on ``${}`` template literals; a single join copies the large tab HTML/JS
+    once instead of once per ``+``.
     """
     # Inject initial persona as a JS variable so the SPA can pre-select it
     if initial_persona:
@@ -87,51 +88,59 @@ def render_layout_shell(nav_html: str, tab_contents: str, tab_js: str, initial_p
     else:
         persona_init_script = ""
 
-    return (
-        "<!DOCTYPE html>\n"
-        '<html lang="ja" class="dark">\n' + render_head() + "\n<body>\n"
-        "    <!-- Background Orbs -->\n"
-        '    <div class="orb orb-1"></div>\n'
-        '    <div class="orb orb-2"></div>\n'
-        '    <div class="orb orb-3"></div>\n'
-        "\n"
-        "    <!-- ============================================================\n"
-        "         HEADER\n"
-        "         ============================================================ -->\n"
-        '    <header class="app-header">\n'
-        '        <div style="display:flex;align-items:center;gap:10px;">\n'
-        '            <span style="font-size:1.6rem;"><i data-lucide="brain"></i></span>\n'
-        "            <h1>Nous v" + __version__ + " Dashboard</h1>\n"
-        "        </div>\n"
-        '        <div class="header-controls">\n'
-        '            <select id="persona-select" class="glass-input" title="Select persona">\n'
-        '                <option value="">Loading...</option>\n'
-        "            </select>\n"
-        '            <select id="auto-refresh" class="glass-input" title="Auto refresh interval">\n'
-        '                <option value="0">Auto: Off</option>\n'
-        '                <option value="30">30s</option>\n'
-        '                <option value="60">1min</option>\n'
-        '                <option value="300">5min</option>\n'
-        "            </select>\n"
-        '            <button id="refresh-btn" class="glass-btn" title="Refresh now"><i data-lucide="refresh-cw"></i></button>\n'
-        '            <button id="dark-toggle" class="glass-btn" title="Toggle theme"><i data-lucide="moon"></i></button>\n'
-        "        </div>\n"
-        "    </header>\n"
-        "\n" + nav_html + "\n"
-        "\n"
-        '    <main class="main-content">\n' + tab_contents + "\n"
-        "    </main>\n"
-        "\n"
-        "    <!-- Memory Detail Modal -->\n"
-        '    <div id="mem-modal-overlay" class="mem-modal-overlay" onclick="if(event.target===this)closeMemModal()">\n'
-        '        <div class="mem-modal" id="mem-modal-content"></div>\n'
-        "    </div>\n"
-        "\n"
-        "    <!-- Toast container -->\n"
-        '    <div id="toast-container" class="toast-container"></div>\n'
-        "\n" + persona_init_script + render_utilities_js() + "\n"
-        "<script>\n" + tab_js + "\n"
-        "</script>\n"
-        "</body>\n"
-        "</html>"
+    return "".join(
+        (
+            '<!DOCTYPE html>\n<html lang="ja" class="dark">\n',
+            render_head(),
+            "\n<body>\n"
+            "    <!-- Background Orbs -->\n"
+            '    <div class="orb orb-1"></div>\n'
+            '    <div class="orb orb-2"></div>\n'
+            '    <div class="orb orb-3"></div>\n'
+            "\n"
+            "    <!-- ============================================================\n"
+            "         HEADER\n"
+            "         ============================================================ -->\n"
+            '    <header class="app-header">\n'
+            '        <div style="display:flex;align-items:center;gap:10px;">\n'
+            '            <span style="font-size:1.6rem;"><i data-lucide="brain"></i></span>\n'
+            "            <h1>Nous v",
+            __version__,
+            " Dashboard</h1>\n"
+            "        </div>\n"
+            '        <div class="header-controls">\n'
+            '            <select id="persona-select" class="glass-input" title="Select persona">\n'
+            '                <option value="">Loading...</option>\n'
+            "            </select>\n"
+            '            <select id="auto-refresh" class="glass-input" title="Auto refresh interval">\n'
+            '                <option value="0">Auto: Off</option>\n'
+            '                <option value="30">30s</option>\n'
+            '                <option value="60">1min</option>\n'
+            '                <option value="300">5min</option>\n'
+            "            </select>\n"
+            '            <button id="refresh-btn" class="glass-btn" title="Refresh now"><i data-lucide="refresh-cw"></i></button>\n'
+            '            <button id="dark-toggle" class="glass-btn" title="Toggle theme"><i data-lucide="moon"></i></button>\n'
+            "        </div>\n"
+            "    </header>\n"
+            "\n",
+            nav_html,
+            '\n\n    <main class="main-content">\n',
+            tab_contents,
+            "\n"
+            "    </main>\n"
+            "\n"
+            "    <!-- Memory Detail Modal -->\n"
+            '    <div id="mem-modal-overlay" class="mem-modal-overlay" onclick="if(event.target===this)closeMemModal()">\n'
+            '        <div class="mem-modal" id="mem-modal-content"></div>\n'
+            "    </div>\n"
+            "\n"
+            "    <!-- Toast container -->\n"
+            '    <div id="toast-container" class="toast-container"></div>\n'
+            "\n",
+            persona_init_script,
+            render_utilities_js(),
+            "\n<script>\n",
+            tab_js,
+            "\n</script>\n</body>\n</html>",
+        )
     )
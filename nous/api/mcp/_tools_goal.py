@@ -144,7 +144,8 @@ async def _tool_goal_manage(
                 )
                 return {"ok": False, "error": tag_result.error}
             candidates = tag_result.value or []
-            match = next((m for m in candidates if content.strip().lower() == m.content.strip().lower()), None)
+            target = content.strip().lower()
+            match = next((m for m in candidates if m.content.strip().lower() == target), None)
             if match is None:
                 await ctx.event_bus.publish(
                     "tool.called",
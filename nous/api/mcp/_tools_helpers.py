@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 from typing import TYPE_CHECKING
 
-from nous.domain.shared.time_utils import relative_time_str
+from nous.domain.shared.time_utils import get_now, relative_time_str
 
 if TYPE_CHECKING:
     from nous.domain.persona.emotion_decay import EmotionDecayResult
@@ -111,6 +112,18 @@ def _build_time_comment(time_since: str, relationship_status: str | None) -> str
     return None
 
 
+def _one_line_snippet(content: str, width: int = 100) -> str:
+    """Single-line preview of content; truncates before replacing so long memories aren't scanned in full."""
+    if len(content) > width:
+        return content[: width - 3].replace("\n", " ") + "..."
+    return content.replace("\n", " ")
+
+
+def _age_suffix(dt, now) -> str:
+    """Return a ``" (3d ago)"`` style suffix for ``dt``, or ``""`` when it is missing."""
+    return f" ({relative_time_str(dt, now)})" if dt else ""
+
+
 def _format_lightweight_response(
     state: PersonaState,
     top_memories: list,
@@ -129,6 +142,8 @@ def _format_lightweight_response(
 ) -> str:
     """Lightweight context (~700-900 tokens): persona + conversation continuity + body state."""
     lines: list[str] = []
+    # Every "(… ago)" label below is relative to the same instant
+    now = get_now()
 
     # ── Self-referential header: "YOU ARE this persona RIGHT NOW" ──
     lines.append(f"=== YOU ARE: {state.persona} (right now) ===")
@@ -173,7 +188,7 @@ def _format_lightweight_response(
                 if val is not None:
                     parts.append(f"{label}:{val:.0%}")
             if parts:
-                ts = relative_time_str(record.timestamp) if getattr(record, "timestamp", None) else ""
+                ts = relative_time_str(record.timestamp, now) if getattr(record, "timestamp", None) else ""
                 ctx_str = f" ({record.context})" if getattr(record, "context", None) else ""
                 lines.append(f"    [{ts}{ctx_str}] {' | '.join(parts)}")
 
@@ -231,25 +246,17 @@ def _format_lightweight_response(
     active_promises = [p for p in promises if "active" in (p.tags or [])]
     if active_goals or active_promises:
         lines.append("\n⚠️ YOUR ACTIVE COMMITMENTS:")
-        for g in active_goals:
-            ts = relative_time_str(g.created_at) if getattr(g, "created_at", None) else ""
-            ts_str = f" ({ts})" if ts else ""
-            lines.append(f"  🎯 {g.content[:100]}{ts_str}")
-        for p in active_promises:
-            ts = relative_time_str(p.created_at) if getattr(p, "created_at", None) else ""
-            ts_str = f" ({ts})" if ts else ""
-            lines.append(f"  🤝 {p.content[:100]}{ts_str}")
+        lines.extend(f"  🎯 {g.content[:100]}{_age_suffix(getattr(g, 'created_at', None), now)}" for g in active_goals)
+        lines.extend(
+            f"  🤝 {p.content[:100]}{_age_suffix(getattr(p, 'created_at', None), now)}" for p in active_promises
+        )
 
     # Recent memories — conversation continuity across sessions
     if recent:
         lines.append("\n--- Your Recent Memories ---")
-        for m in recent[:5]:
-            snippet = m.content.replace("\n", " ")
-            if len(snippet) > 100:
-                snippet = snippet[:97] + "..."
-            ts = relative_time_str(m.created_at) if getattr(m, "created_at", None) else ""
-            ts_str = f" ({ts})" if ts else ""
-            lines.append(f"- {snippet}{ts_str}")
+        lines.extend(
+            f"- {_one_line_snippet(m.content)}{_age_suffix(getattr(m, 'created_at', None), now)}" for m in recent[:5]
+        )
 
         # Synthesize current context from recent memory tags (no LLM call needed)
         recent_tags: set[str] = set()
@@ -259,7 +266,7 @@ def _format_lightweight_response(
                 if t_clean not in ("active", "cancelled", "achieved", "fulfilled", "mental_state"):
                     recent_tags.add(t_clean)
         if recent_tags:
-            top_tags = sorted(recent_tags)[:6]
+            top_tags = heapq.nsmallest(6, recent_tags)
             lines.append(f"📌 Context tags: {', '.join(top_tags)}")
 
     # Essential Story
@@ -270,9 +277,7 @@ def _format_lightweight_response(
         for shown, m in enumerate(top_memories):
             tag_str = ", ".join((m.tags or [])[:2])
             tag_part = f" [{tag_str}]" if tag_str else ""
-            snippet = m.content.replace("\n", " ")
-            if len(snippet) > 100:
-                snippet = snippet[:97] + "..."
+            snippet = _one_line_snippet(m.content)
             line = f"- {snippet}{tag_part}"
             if used + len(line) > char_budget:
                 lines.append(f"  ... ({len(top_memories) - shown} more)")
@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import TYPE_CHECKING
 
 from nous.domain.search.engine import SearchQuery
 from nous.domain.value_objects import _VALID_EMOTIONS, normalize_importance
+from nous.infrastructure.qdrant.adapter import memory_payload
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from nous.application.use_cases import AppContext
+    from nous.domain.memory.entities import Memory
+    from nous.domain.shared.result import Result
+
+
+def _find_memory_by_query(ctx: AppContext, query: str) -> Memory | None:
+    """Best search match for ``query``; used by update/delete when no key is given."""
+    search_result = ctx.search_engine.search(SearchQuery(text=query, top_k=1))
+    if not search_result.is_ok or not search_result.value:
+        return None
+    return search_result.value[0].memory
 
 
 async def _tool_memory_create(
@@ -76,7 +88,7 @@ async def _tool_memory_create(
     )
     if result.is_ok:
         if not defer_vector and ctx.vector_store:
-            ctx.vector_store.upsert(persona, result.value.key, content)
+            ctx.vector_store.upsert(persona, result.value.key, content, metadata=memory_payload(result.value))
         await ctx.event_bus.publish(
             "memory.created",
             {
@@ -105,7 +117,7 @@ async def _tool_memory_read(
             try:
                 ctx.memory_service.boost_recall(memory_key)
             except Exception as e:
-                logger.warning(f"boost_recall failed: {e}")
+                logger.warning("boost_recall failed: %s", e)
             m = result.value
             emotion_line = f"Emotion: {m.emotion}"
             if m.emotion_intensity:
@@ -138,9 +150,9 @@ async def _tool_memory_read(
         )
         return f"Error: {result.error}"
     else:
-        memories_result = ctx.memory_service.get_recent(limit=limit + offset)
+        memories_result = ctx.memory_service.get_recent(limit=limit, offset=offset)
         if memories_result.is_ok:
-            items = memories_result.value[offset : offset + limit]
+            items = memories_result.value
             count_result = ctx.memory_service.count_memories()
             total_count = count_result.value if count_result.is_ok else len(items)
             return json.dumps(
@@ -192,14 +204,10 @@ async def _tool_memory_update(
     query: search query to resolve memory_key (alternative to direct memory_key)."""
     # query から key を解決（builtin互換）
     if query and not memory_key:
-        search_result = ctx.search_engine.search(SearchQuery(text=query, top_k=1))
-        if not search_result.is_ok or not search_result.value:
+        found = _find_memory_by_query(ctx, query)
+        if found is None:
             return json.dumps({"ok": False, "error": f"No memory found for query: {query}"}, ensure_ascii=False)
-        item = search_result.value[0]
-        mem = item[0] if isinstance(item, tuple) else item
-        memory_key = getattr(mem, "key", "")
-        if not memory_key:
-            return json.dumps({"ok": False, "error": "memory key not found"}, ensure_ascii=False)
+        memory_key = found.key
 
     # builtin からの new_content フォールバック
     if content is None and new_content is not None:
@@ -259,7 +267,9 @@ async def _tool_memory_update(
     result = ctx.memory_service.update_memory(memory_key, **updates)
     if result.is_ok:
         if ctx.vector_store and "content" in updates:
-            ctx.vector_store.upsert(persona, memory_key, updates["content"])
+            ctx.vector_store.upsert(persona, memory_key, updates["content"], metadata=memory_payload(result.value))
+        elif ctx.vector_store and updates.keys() & {"importance", "emotion", "tags"}:
+            ctx.vector_store.set_payload(persona, memory_key, memory_payload(result.value))
         await ctx.event_bus.publish(
             "memory.updated",
             {
@@ -286,9 +296,8 @@ async def _tool_memory_delete(
     key = memory_key
     content_preview = "..."
     if not key and query:
-        search_result = ctx.search_engine.search(SearchQuery(text=query, top_k=1))
-        if search_result.is_ok and search_result.value:
-            m = search_result.value[0].memory
+        m = _find_memory_by_query(ctx, query)
+        if m is not None:
             key = m.key
             content_preview = m.content[:100]
             snippet = f"\nContent: 「{m.content[:80]}{'...' if len(m.content) > 80 else ''}」"
@@ -319,7 +328,7 @@ async def _tool_memory_delete(
     return f"Error: {result.error}"
 
 
-async def _tool_memory_search(
+async def _memory_search_payload(
     ctx: AppContext,
     persona: str,
     query: str,
@@ -332,10 +341,14 @@ async def _tool_memory_search(
     recency_weight: float = 0.0,
     vector_weight: float = 1.0,
     keyword_weight: float = 0.5,
-) -> str:
-    """Search memories with hybrid retrieval."""
+) -> dict:
+    """Search memories with hybrid retrieval and return the response as a dict.
+
+    In-process callers (the chat tool loop) use this directly; the MCP tool
+    serializes it once with ``json.dumps``.
+    """
     if top_k is not None and (top_k < 1 or top_k > 200):
-        return json.dumps({"ok": False, "error": "top_k must be between 1 and 200"}, ensure_ascii=False)
+        return {"ok": False, "error": "top_k must be between 1 and 200"}
     top_k = min(top_k or 5, 200)
     # Clamp RRF weights to [0.0, 1.0]
     importance_weight = max(0.0, min(1.0, importance_weight))
@@ -354,8 +367,7 @@ async def _tool_memory_search(
         vector_weight=vector_weight,
         keyword_weight=keyword_weight,
     )
-    ctx.search_engine.set_persona(persona)
-    result = ctx.search_engine.search(search_query)
+    result, count_result = await asyncio.to_thread(_run_memory_search, ctx, persona, search_query)
     if not result.is_ok:
         await ctx.event_bus.publish(
             "tool.called",
@@ -367,7 +379,7 @@ async def _tool_memory_search(
                 "success": False,
             },
         )
-        return json.dumps({"ok": False, "error": str(result.error)}, ensure_ascii=False)
+        return {"ok": False, "error": str(result.error)}
     if not result.value:
         await ctx.event_bus.publish(
             "tool.called",
@@ -379,10 +391,8 @@ async def _tool_memory_search(
                 "success": True,
             },
         )
-        count_result = ctx.memory_service.count_memories()
         total_count = count_result.value if count_result.is_ok else 0
-        return json.dumps({"ok": True, "memories": [], "total_count": total_count}, ensure_ascii=False)
-    ctx.memory_service.log_search(query, "hybrid", len(result.value))
+        return {"ok": True, "memories": [], "total_count": total_count}
 
     # Normalize scores to 0-1 for intuitive LLM consumption
     scores = [sr.score for sr in result.value]
@@ -412,9 +422,55 @@ async def _tool_memory_search(
             "success": True,
         },
     )
-    count_result = ctx.memory_service.count_memories()
     total_count = count_result.value if count_result.is_ok else len(result.value)
-    return json.dumps({"ok": True, "memories": memories, "total_count": total_count}, ensure_ascii=False)
+    return {"ok": True, "memories": memories, "total_count": total_count}
+
+
+def _run_memory_search(ctx: AppContext, persona: str, search_query: SearchQuery) -> tuple[Result, Result]:
+    """Blocking half of memory_search: engine query, search log and row count.
+
+    Runs via ``asyncio.to_thread`` so SQLite scans and embedding work do not
+    stall other tool calls on the event loop.
+    """
+    ctx.search_engine.set_persona(persona)
+    result = ctx.search_engine.search(search_query)
+    if not result.is_ok:
+        return result, result
+    if result.value:
+        ctx.memory_service.log_search(search_query.text, "hybrid", len(result.value))
+    return result, ctx.memory_service.count_memories()
+
+
+async def _tool_memory_search(
+    ctx: AppContext,
+    persona: str,
+    query: str,
+    top_k: int = 5,
+    tags: list[str] | None = None,
+    date_range: str | None = None,
+    min_importance: float | None = None,
+    emotion: str | None = None,
+    importance_weight: float = 0.0,
+    recency_weight: float = 0.0,
+    vector_weight: float = 1.0,
+    keyword_weight: float = 0.5,
+) -> str:
+    """Search memories with hybrid retrieval."""
+    payload = await _memory_search_payload(
+        ctx,
+        persona,
+        query=query,
+        top_k=top_k,
+        tags=tags,
+        date_range=date_range,
+        min_importance=min_importance,
+        emotion=emotion,
+        importance_weight=importance_weight,
+        recency_weight=recency_weight,
+        vector_weight=vector_weight,
+        keyword_weight=keyword_weight,
+    )
+    return json.dumps(payload, ensure_ascii=False)
 
 
 async def _tool_memory_stats(ctx: AppContext, persona: str, top_n: int = 20) -> str:
@@ -6,7 +6,8 @@ import json
 import logging
 from typing import TYPE_CHECKING
 
-from nous.domain.shared.time_utils import get_now, relative_time_str
+from nous.domain.memory.entities import Memory
+from nous.domain.shared.time_utils import generate_memory_key, get_now, relative_time_str
 
 logger = logging.getLogger(__name__)
 
@@ -140,6 +141,41 @@ async def _tool_get_context(ctx: AppContext, persona: str) -> str:
     return result_text
 
 
+def _save_new_commitments(ctx: AppContext, texts, kind: str, emotion: str) -> None:
+    """Save each goal/promise text as an active ``kind`` memory unless one with that content exists.
+
+    ``texts`` is a list or a JSON-encoded list (a plain string is one entry).
+    Active entries are read once; texts saved here join that set, so a text
+    repeated within one call is stored once.
+    """
+    if isinstance(texts, str):
+        try:
+            texts = json.loads(texts)
+        except Exception:
+            texts = [texts] if texts else []
+    texts = [t for t in texts or [] if t]
+    if not texts:
+        return
+    tags = [kind, "active"]
+    existing = ctx.memory_service.get_by_tags(tags)
+    seen = {m.content for m in (existing.value or [])}
+    for text in texts:
+        if text in seen:
+            continue
+        seen.add(text)
+        now = get_now()
+        mem = Memory(
+            key=generate_memory_key(now=now),
+            content=text,
+            created_at=now,
+            updated_at=now,
+            tags=list(tags),
+            importance=0.8,
+            emotion=emotion,
+        )
+        ctx.memory_service.save_memory(mem)
+
+
 async def _tool_update_context(
     ctx: AppContext,
     persona: str,
@@ -214,52 +250,9 @@ async def _tool_update_context(
         promises_from_pi = pi.pop("promises", None)
 
         if goals_from_pi is not None:
-            if isinstance(goals_from_pi, str):
-                try:
-                    goals_from_pi = json.loads(goals_from_pi)
-                except Exception:
-                    goals_from_pi = [goals_from_pi] if goals_from_pi else []
-            for goal_text in goals_from_pi or []:
-                if goal_text:
-                    existing = ctx.memory_service.get_by_tags(["goal", "active"])
-                    existing_contents = [m.content for m in (existing.value or [])]
-                    if goal_text not in existing_contents:
-                        from nous.domain.memory.entities import Memory as _Memory
-                        from nous.domain.shared.time_utils import generate_memory_key, get_now
-
-                        mem = _Memory(
-                            key=generate_memory_key(),
-                            content=goal_text,
-                            created_at=get_now(),
-                            tags=["goal", "active"],
-                            importance=0.8,
-                            emotion="anticipation",
-                        )
-                        ctx.memory_service.save_memory(mem)
-
+            _save_new_commitments(ctx, goals_from_pi, "goal", emotion="anticipation")
         if promises_from_pi is not None:
-            if isinstance(promises_from_pi, str):
-                try:
-                    promises_from_pi = json.loads(promises_from_pi)
-                except Exception:
-                    promises_from_pi = [promises_from_pi] if promises_from_pi else []
-            for promise_text in promises_from_pi or []:
-                if promise_text:
-                    existing = ctx.memory_service.get_by_tags(["promise", "active"])
-                    existing_contents = [m.content for m in (existing.value or [])]
-                    if promise_text not in existing_contents:
-                        from nous.domain.memory.entities import Memory as _Memory
-                        from nous.domain.shared.time_utils import generate_memory_key, get_now
-
-                        mem = _Memory(
-                            key=generate_memory_key(),
-                            content=promise_text,
-                            created_at=get_now(),
-                            tags=["promise", "active"],
-                            importance=0.8,
-                            emotion="trust",
-                        )
-                        ctx.memory_service.save_memory(mem)
+            _save_new_commitments(ctx, promises_from_pi, "promise", emotion="trust")
 
         if pi:
             result = ctx.persona_service.update_persona_info(persona, pi)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import logging
 import re
 from typing import TYPE_CHECKING
@@ -119,260 +120,280 @@ async def _tool_sandbox_execute(
         return f"Sandbox error: {e}"
 
 
-async def _tool_sandbox_files(
-    ctx: AppContext,
-    persona: str,
-    operation: str,
-    path: str = "",
-    content: str | None = None,
-) -> dict:
-    from nous.config.settings import get_settings
-
-    settings = get_settings()
-    if not settings.sandbox.enabled:
-        await ctx.event_bus.publish(
-            "tool.called",
-            {
-                "persona": persona,
-                "tool_name": "sandbox_files",
-                "params_summary": f"operation={operation}, path={path}",
-                "result_summary": "Sandbox is not enabled",
-                "success": False,
-            },
-        )
-        return {"ok": False, "error": "Sandbox is not enabled."}
-    from nous.application.sandbox.service import get_sandbox_session
-
-    sandbox_session = await get_sandbox_session(persona)
-
-    # Resolve default path to persona home
-    home = f"/home/{sandbox_session.username}"
-    if not path or path == "/sandbox":  # backward compat for old invocations
-        path = home
-
-    # Security: must stay within persona home directory
-    if not path.startswith(home + "/") and path != home:
-        await ctx.event_bus.publish(
-            "tool.called",
-            {
-                "persona": persona,
-                "tool_name": "sandbox_files",
-                "params_summary": f"operation={operation}, path={path}",
-                "result_summary": f"path must be under {home}",
-                "success": False,
-            },
-        )
-        return {"ok": False, "error": f"path must be under {home}"}
-
-    import base64 as _b64
-
-    if operation == "list":
-        files = await sandbox_session.list_files(path)
-        file_list = [{"name": f.name, "path": f.path, "is_dir": f.is_dir, "size": f.size} for f in files]
-        result = {"ok": True, "files": file_list}
+async def _files_list(ctx: AppContext, persona: str, sandbox_session, path: str, content: str | None) -> dict:
+    files = await sandbox_session.list_files(path)
+    file_list = [{"name": f.name, "path": f.path, "is_dir": f.is_dir, "size": f.size} for f in files]
+    result = {"ok": True, "files": file_list}
+    await ctx.event_bus.publish(
+        "tool.called",
+        {
+            "persona": persona,
+            "tool_name": "sandbox_files",
+            "params_summary": f"operation=list, path={path}",
+            "result_summary": f"Listed {len(file_list)} files",
+            "success": True,
+        },
+    )
+    return result
+
+
+async def _files_read(ctx: AppContext, persona: str, sandbox_session, path: str, content: str | None) -> dict:
+    try:
+        img_data = await sandbox_session.read_image(path)
+        # read_image returns "application/octet-stream" for non-images → fallback to text
+        if img_data.get("content_type") == "application/octet-stream":
+            raise ValueError("not an image, falling back to text read")
+        resp: dict = {
+            "ok": True,
+            "content_type": img_data["content_type"],
+            "content_base64": img_data["content_base64"],
+            "size": img_data["size"],
+        }
+        if img_data.get("resized"):
+            resp["resized"] = True
+            resp["orig_dims"] = img_data.get("orig_dims", "")
         await ctx.event_bus.publish(
             "tool.called",
             {
                 "persona": persona,
                 "tool_name": "sandbox_files",
-                "params_summary": f"operation=list, path={path}",
-                "result_summary": f"Listed {len(file_list)} files",
+                "params_summary": f"operation=read, path={path}",
+                "result_summary": f"Read image ({img_data['size']} bytes)",
                 "success": True,
             },
         )
-        return result
-    elif operation == "read":
-        try:
-            img_data = await sandbox_session.read_image(path)
-            # read_image returns "application/octet-stream" for non-images → fallback to text
-            if img_data.get("content_type") == "application/octet-stream":
-                raise ValueError("not an image, falling back to text read")
-            resp: dict = {
-                "ok": True,
-                "content_type": img_data["content_type"],
-                "content_base64": img_data["content_base64"],
-                "size": img_data["size"],
-            }
-            if img_data.get("resized"):
-                resp["resized"] = True
-                resp["orig_dims"] = img_data.get("orig_dims", "")
+        return resp
+    except Exception:
+        raw = await sandbox_session.read_file(path)
+        is_image = False
+        content_type = None
+        if len(raw) >= 4:
+            if raw[:4] == b"\x89PNG":
+                is_image, content_type = True, "image/png"
+            elif raw[:2] == b"\xff\xd8":
+                is_image, content_type = True, "image/jpeg"
+            elif raw[:3] == b"GIF":
+                is_image, content_type = True, "image/gif"
+            elif len(raw) >= 12 and raw[:4] == b"RIFF" and raw[8:12] == b"WEBP":
+                is_image, content_type = True, "image/webp"
+        if is_image:
+            b64_str = base64.b64encode(raw).decode("ascii")
+            result = {"ok": True, "content_type": content_type, "content_base64": b64_str, "size": len(raw)}
             await ctx.event_bus.publish(
                 "tool.called",
                 {
                     "persona": persona,
                     "tool_name": "sandbox_files",
                     "params_summary": f"operation=read, path={path}",
-                    "result_summary": f"Read image ({img_data['size']} bytes)",
+                    "result_summary": f"Read image ({len(raw)} bytes)",
                     "success": True,
                 },
             )
-            return resp
-        except Exception:
-            raw = await sandbox_session.read_file(path)
-            is_image = False
-            content_type = None
-            if len(raw) >= 4:
-                if raw[:4] == b"\x89PNG":
-                    is_image, content_type = True, "image/png"
-                elif raw[:2] == b"\xff\xd8":
-                    is_image, content_type = True, "image/jpeg"
-                elif raw[:3] == b"GIF":
-                    is_image, content_type = True, "image/gif"
-                elif len(raw) >= 12 and raw[:4] == b"RIFF" and raw[8:12] == b"WEBP":
-                    is_image, content_type = True, "image/webp"
-            if is_image:
-                b64_str = _b64.b64encode(raw).decode("ascii")
-                result = {"ok": True, "content_type": content_type, "content_base64": b64_str, "size": len(raw)}
-                await ctx.event_bus.publish(
-                    "tool.called",
-                    {
-                        "persona": persona,
-                        "tool_name": "sandbox_files",
-                        "params_summary": f"operation=read, path={path}",
-                        "result_summary": f"Read image ({len(raw)} bytes)",
-                        "success": True,
-                    },
-                )
-                return result
-            max_read = 8192
-            truncated = len(raw) > max_read
-            text = raw[:max_read].decode("utf-8", errors="replace")
-            if truncated:
-                result = {"ok": True, "content": text, "truncated": True, "total_bytes": len(raw)}
-                await ctx.event_bus.publish(
-                    "tool.called",
-                    {
-                        "persona": persona,
-                        "tool_name": "sandbox_files",
-                        "params_summary": f"operation=read, path={path}",
-                        "result_summary": f"Read file ({len(raw)} bytes, truncated)",
-                        "success": True,
-                    },
-                )
-                return result
-            result = {"ok": True, "content": text}
+            return result
+        max_read = 8192
+        truncated = len(raw) > max_read
+        text = raw[:max_read].decode("utf-8", errors="replace")
+        if truncated:
+            result = {"ok": True, "content": text, "truncated": True, "total_bytes": len(raw)}
             await ctx.event_bus.publish(
                 "tool.called",
                 {
                     "persona": persona,
                     "tool_name": "sandbox_files",
                     "params_summary": f"operation=read, path={path}",
-                    "result_summary": f"Read file ({len(raw)} bytes)",
+                    "result_summary": f"Read file ({len(raw)} bytes, truncated)",
                     "success": True,
                 },
             )
             return result
-    elif operation == "write":
-        if not content:
-            await ctx.event_bus.publish(
-                "tool.called",
-                {
-                    "persona": persona,
-                    "tool_name": "sandbox_files",
-                    "params_summary": f"operation=write, path={path}",
-                    "result_summary": "content is required for write",
-                    "success": False,
-                },
-            )
-            return {"ok": False, "error": "content is required for write"}
-        b64 = _b64.b64encode(content.encode()).decode()
-        write_code = (
-            f"import base64, os\n"
-            f"_d = base64.b64decode({b64!r})\n"
-            f"os.makedirs(os.path.dirname({path!r}) or '.', exist_ok=True)\n"
-            f"open({path!r}, 'wb').write(_d)\n"
-            f"print('written', len(_d), 'bytes')"
-        )
-        exec_result = await sandbox_session.execute(write_code)
-        result = {"ok": True, "path": path, "stdout": exec_result.stdout.strip()}
+        result = {"ok": True, "content": text}
         await ctx.event_bus.publish(
             "tool.called",
             {
                 "persona": persona,
                 "tool_name": "sandbox_files",
-                "params_summary": f"operation=write, path={path}",
-                "result_summary": f"Wrote {len(content)} bytes to {path}",
+                "params_summary": f"operation=read, path={path}",
+                "result_summary": f"Read file ({len(raw)} bytes)",
                 "success": True,
             },
         )
         return result
-    elif operation == "append":
-        if not content:
-            await ctx.event_bus.publish(
-                "tool.called",
-                {
-                    "persona": persona,
-                    "tool_name": "sandbox_files",
-                    "params_summary": f"operation=append, path={path}",
-                    "result_summary": "content is required for append",
-                    "success": False,
-                },
-            )
-            return {"ok": False, "error": "content is required for append"}
-        try:
-            existing = await sandbox_session.read_file(path)
-        except Exception:
-            existing = b""
-        combined = existing + content.encode()
-        b64 = _b64.b64encode(combined).decode()
-        write_code = (
-            f"import base64, os\n"
-            f"_d = base64.b64decode({b64!r})\n"
-            f"os.makedirs(os.path.dirname({path!r}) or '.', exist_ok=True)\n"
-            f"open({path!r}, 'wb').write(_d)\n"
-            f"print('appended', len(_d), 'total bytes')"
+
+
+async def _files_write(ctx: AppContext, persona: str, sandbox_session, path: str, content: str | None) -> dict:
+    if not content:
+        await ctx.event_bus.publish(
+            "tool.called",
+            {
+                "persona": persona,
+                "tool_name": "sandbox_files",
+                "params_summary": f"operation=write, path={path}",
+                "result_summary": "content is required for write",
+                "success": False,
+            },
         )
-        exec_result = await sandbox_session.execute(write_code)
-        result = {"ok": True, "path": path, "stdout": exec_result.stdout.strip()}
+        return {"ok": False, "error": "content is required for write"}
+    b64 = base64.b64encode(content.encode()).decode()
+    write_code = (
+        f"import base64, os\n"
+        f"_d = base64.b64decode({b64!r})\n"
+        f"os.makedirs(os.path.dirname({path!r}) or '.', exist_ok=True)\n"
+        f"open({path!r}, 'wb').write(_d)\n"
+        f"print('written', len(_d), 'bytes')"
+    )
+    exec_result = await sandbox_session.execute(write_code)
+    result = {"ok": True, "path": path, "stdout": exec_result.stdout.strip()}
+    await ctx.event_bus.publish(
+        "tool.called",
+        {
+            "persona": persona,
+            "tool_name": "sandbox_files",
+            "params_summary": f"operation=write, path={path}",
+            "result_summary": f"Wrote {len(content)} bytes to {path}",
+            "success": True,
+        },
+    )
+    return result
+
+
+async def _files_append(ctx: AppContext, persona: str, sandbox_session, path: str, content: str | None) -> dict:
+    if not content:
         await ctx.event_bus.publish(
             "tool.called",
             {
                 "persona": persona,
                 "tool_name": "sandbox_files",
                 "params_summary": f"operation=append, path={path}",
-                "result_summary": f"Appended {len(content)} bytes to {path} (total {len(combined)} bytes)",
+                "result_summary": "content is required for append",
+                "success": False,
+            },
+        )
+        return {"ok": False, "error": "content is required for append"}
+    try:
+        existing = await sandbox_session.read_file(path)
+    except Exception:
+        existing = b""
+    combined = existing + content.encode()
+    b64 = base64.b64encode(combined).decode()
+    write_code = (
+        f"import base64, os\n"
+        f"_d = base64.b64decode({b64!r})\n"
+        f"os.makedirs(os.path.dirname({path!r}) or '.', exist_ok=True)\n"
+        f"open({path!r}, 'wb').write(_d)\n"
+        f"print('appended', len(_d), 'total bytes')"
+    )
+    exec_result = await sandbox_session.execute(write_code)
+    result = {"ok": True, "path": path, "stdout": exec_result.stdout.strip()}
+    await ctx.event_bus.publish(
+        "tool.called",
+        {
+            "persona": persona,
+            "tool_name": "sandbox_files",
+            "params_summary": f"operation=append, path={path}",
+            "result_summary": f"Appended {len(content)} bytes to {path} (total {len(combined)} bytes)",
+            "success": True,
+        },
+    )
+    return result
+
+
+async def _files_delete(ctx: AppContext, persona: str, sandbox_session, path: str, content: str | None) -> dict:
+    deleted = await sandbox_session.delete_file(path)
+    if deleted:
+        result = {"ok": True, "path": path}
+        await ctx.event_bus.publish(
+            "tool.called",
+            {
+                "persona": persona,
+                "tool_name": "sandbox_files",
+                "params_summary": f"operation=delete, path={path}",
+                "result_summary": f"Deleted {path}",
                 "success": True,
             },
         )
         return result
-    elif operation == "delete":
-        deleted = await sandbox_session.delete_file(path)
-        if deleted:
-            result = {"ok": True, "path": path}
-            await ctx.event_bus.publish(
-                "tool.called",
-                {
-                    "persona": persona,
-                    "tool_name": "sandbox_files",
-                    "params_summary": f"operation=delete, path={path}",
-                    "result_summary": f"Deleted {path}",
-                    "success": True,
-                },
-            )
-            return result
+    await ctx.event_bus.publish(
+        "tool.called",
+        {
+            "persona": persona,
+            "tool_name": "sandbox_files",
+            "params_summary": f"operation=delete, path={path}",
+            "result_summary": f"Delete failed for {path}",
+            "success": False,
+        },
+    )
+    return {"ok": False, "error": "delete failed", "path": path}
+
+
+# operation → handler; looked up once instead of walking an if/elif chain
+_FILE_OPS = {
+    "list": _files_list,
+    "read": _files_read,
+    "write": _files_write,
+    "append": _files_append,
+    "delete": _files_delete,
+}
+
+
+async def _tool_sandbox_files(
+    ctx: AppContext,
+    persona: str,
+    operation: str,
+    path: str = "",
+    content: str | None = None,
+) -> dict:
+    from nous.config.settings import get_settings
+
+    settings = get_settings()
+    if not settings.sandbox.enabled:
         await ctx.event_bus.publish(
             "tool.called",
             {
                 "persona": persona,
                 "tool_name": "sandbox_files",
-                "params_summary": f"operation=delete, path={path}",
-                "result_summary": f"Delete failed for {path}",
+                "params_summary": f"operation={operation}, path={path}",
+                "result_summary": "Sandbox is not enabled",
                 "success": False,
             },
         )
-        return {"ok": False, "error": "delete failed", "path": path}
-    else:
+        return {"ok": False, "error": "Sandbox is not enabled."}
+    from nous.application.sandbox.service import get_sandbox_session
+
+    sandbox_session = await get_sandbox_session(persona)
+
+    # Resolve default path to persona home
+    home = f"/home/{sandbox_session.username}"
+    if not path or path == "/sandbox":  # backward compat for old invocations
+        path = home
+
+    # Security: must stay within persona home directory
+    if not path.startswith(home + "/") and path != home:
         await ctx.event_bus.publish(
             "tool.called",
             {
                 "persona": persona,
                 "tool_name": "sandbox_files",
                 "params_summary": f"operation={operation}, path={path}",
-                "result_summary": f"Unknown operation: {operation}",
+                "result_summary": f"path must be under {home}",
                 "success": False,
             },
         )
-        return {"ok": False, "error": f"Unknown operation: {operation}. Use list/read/write/append/delete."}
+        return {"ok": False, "error": f"path must be under {home}"}
+
+    handler = _FILE_OPS.get(operation)
+    if handler is not None:
+        return await handler(ctx, persona, sandbox_session, path, content)
+    await ctx.event_bus.publish(
+        "tool.called",
+        {
+            "persona": persona,
+            "tool_name": "sandbox_files",
+            "params_summary": f"operation={operation}, path={path}",
+            "result_summary": f"Unknown operation: {operation}",
+            "success": False,
+        },
+    )
+    return {"ok": False, "error": f"Unknown operation: {operation}. Use list/read/write/append/delete."}
 
 
 async def _tool_sandbox_reset(ctx: AppContext, persona: str, level: str = "files") -> str:
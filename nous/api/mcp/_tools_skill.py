@@ -85,7 +85,7 @@ async def _tool_invoke_skill(ctx: AppContext, persona: str, name: str, task: str
             },
         )
         return {"ok": False, "error": f"Provider init failed: {e}"}
-    text = ""
+    chunks: list[str] = []
     try:
         async for event in provider.stream(
             messages=[LLMMessage(role="user", content=task)],
@@ -95,7 +95,7 @@ async def _tool_invoke_skill(ctx: AppContext, persona: str, name: str, task: str
             max_tokens=max_tokens,
         ):
             if isinstance(event, TextDeltaEvent):
-                text += event.content
+                chunks.append(event.content)
             elif isinstance(event, DoneEvent):
                 break
     except Exception as e:
@@ -110,6 +110,7 @@ async def _tool_invoke_skill(ctx: AppContext, persona: str, name: str, task: str
             },
         )
         return {"ok": False, "error": f"Skill execution failed: {e}"}
+    text = "".join(chunks)
     result = {"ok": True, "result": text or "(no response)"}
     await ctx.event_bus.publish(
         "tool.called",
@@ -33,6 +33,7 @@ from nous.api.mcp._tools_item import (  # noqa: E402, F401
     _tool_item,
 )
 from nous.api.mcp._tools_memory import (  # noqa: E402, F401
+    _memory_search_payload,
     _tool_memory_create,
     _tool_memory_delete,
     _tool_memory_read,
@@ -71,6 +72,12 @@ TOOL_DISPATCH: dict[str, Any] = {
     "invoke_skill": _tool_invoke_skill,
 }
 
+# Structured variants for in-process callers: return the response dict
+# instead of a JSON string, so it is not serialized and parsed back.
+TOOL_PAYLOAD_DISPATCH: dict[str, Any] = {
+    "memory_search": _memory_search_payload,
+}
+
 
 # MCP registration — thin wrappers around core implementations
 # =============================================================================
@@ -204,6 +211,7 @@ def register_tools(mcp: FastMCP) -> None:
     ) -> str:
         """Search memories with hybrid retrieval. Use when conversation references past events
         or you need context about the user. date_range: "7d","30d","昨日".
+        tags: only memories carrying every listed tag.
         importance_weight/recency_weight: RRF scoring boosts (0.0-1.0).
         vector_weight/keyword_weight: RRF source weights for semantic/keyword signals."""
         p = _resolve_persona()
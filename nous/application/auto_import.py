@@ -40,16 +40,31 @@ def run_auto_import(
     if not zip_files:
         return {}
 
+    from nous.application.use_cases import AppContextRegistry
+
+    # Contexts are only reused when the registry builds them on this same data_dir
+    registry_settings = AppContextRegistry.configured_settings()
+    shares_registry_db = registry_settings is not None and registry_settings.data_dir == settings.data_dir
+
     results: dict[str, dict[str, int]] = {}
 
     for zip_path in zip_files:
         persona: str = zip_path.stem
         logger.info("Auto-importing '%s' from %s", persona, zip_path)
 
-        connection = SQLiteConnection(settings.data_dir, persona)
         try:
-            connection.initialize_schema()
-            MigrationEngine(connection).run_all()
+            ctx = AppContextRegistry.get(persona) if shares_registry_db else None
+        except Exception:
+            logger.error("Failed to open context for '%s'", persona, exc_info=True)
+            continue
+
+        # The persona's context has already opened, initialized and migrated the DB;
+        # import and vector sync share its connection instead of reopening the file.
+        connection = ctx.connection if ctx is not None else SQLiteConnection(settings.data_dir, persona)
+        try:
+            if ctx is None:
+                connection.initialize_schema()
+                MigrationEngine(connection).run_all()
 
             importer = LegacyImporter(connection, persona)
             result = importer.import_from_zip(str(zip_path))
@@ -66,17 +81,13 @@ def run_auto_import(
 
             # ------ vector store sync (best-effort) ------
             try:
-                from nous.application.use_cases import (
-                    AppContextRegistry,
-                )
-
-                ctx = AppContextRegistry.get(persona)
-                if ctx.vector_store is not None:
-                    ctx.vector_store.rebuild_collection(persona)
+                sync_ctx = ctx if ctx is not None else AppContextRegistry.get(persona)
+                if sync_ctx.vector_store is not None:
+                    sync_ctx.vector_store.rebuild_collection(persona)
                     rows = connection.get_memory_db().execute("SELECT key, content FROM memories").fetchall()
                     memories_for_vector: list[tuple[str, str]] = [(row["key"], row["content"]) for row in rows]
                     if memories_for_vector:
-                        upsert_result = ctx.vector_store.upsert_batch(persona, memories_for_vector)
+                        upsert_result = sync_ctx.vector_store.upsert_batch(persona, memories_for_vector)
                         if upsert_result.is_ok:
                             logger.info(
                                 "Vector store synced for '%s': %d points",
@@ -116,6 +127,7 @@ def run_auto_import(
             )
             continue
         finally:
-            connection.close()
+            if ctx is None:
+                connection.close()
 
     return results
@@ -6,7 +6,7 @@ import json
 from typing import TYPE_CHECKING
 
 from nous.domain.search.engine import SearchQuery
-from nous.infrastructure.llm.base import LLMMessage
+from nous.infrastructure.llm.base import DoneEvent, ErrorEvent, LLMMessage, TextDeltaEvent
 from nous.infrastructure.llm.factory import get_provider
 from nous.infrastructure.logging.structured import get_logger
 
@@ -131,9 +131,7 @@ class MemoryLLM:
             assistant_response=assistant_response[:500],
         )
 
-        from nous.infrastructure.llm.base import DoneEvent, ErrorEvent, TextDeltaEvent
-
-        text = ""
+        chunks: list[str] = []
         try:
             async for event in provider.stream(
                 messages=[LLMMessage(role="user", content=prompt)],
@@ -143,14 +141,14 @@ class MemoryLLM:
                 max_tokens=config.extract_max_tokens,
             ):
                 if isinstance(event, TextDeltaEvent):
-                    text += event.content
+                    chunks.append(event.content)
                 elif isinstance(event, (DoneEvent, ErrorEvent)):
                     break
         except Exception as e:
             logger.warning("MemoryLLM: LLM call failed: %s", e)
             return {}
 
-        return _parse_memory_llm_result(text)
+        return _parse_memory_llm_result("".join(chunks))
 
 
 def _parse_memory_llm_result(text: str) -> dict:
@@ -216,16 +214,19 @@ async def _build_memory_llm_context(ctx: AppContext) -> tuple[str, str, str]:
                 lines.append(f"{field}: {val}")
 
     # アクティブな goal (scope=self と scope=interpersonal を統合)
+    # interpersonal は goal+active の部分集合なので 1 回の取得で振り分ける（重複行も出さない）
     commit_lines: list[str] = []
-    for tag_pair, label in [
-        (["goal", "active"], "goal (self)"),
-        (["goal", "active", "interpersonal"], "goal (interpersonal)"),
-    ]:
-        mem_result = ctx.memory_service.get_by_tags(tag_pair)
-        if mem_result.is_ok and mem_result.value:
-            for m in mem_result.value[:5]:
+    mem_result = ctx.memory_service.get_by_tags(["goal", "active"])
+    if mem_result.is_ok and mem_result.value:
+        by_label: dict[str, list[str]] = {"goal (self)": [], "goal (interpersonal)": []}
+        for m in mem_result.value:
+            label = "goal (interpersonal)" if "interpersonal" in (getattr(m, "tags", None) or ()) else "goal (self)"
+            bucket = by_label[label]
+            if len(bucket) < 5:
                 key = getattr(m, "key", None) or getattr(m, "id", "")
-                commit_lines.append(f"  [{label}] key={key} : {m.content[:100]}")
+                bucket.append(f"  [{label}] key={key} : {m.content[:100]}")
+        for bucket in by_label.values():
+            commit_lines.extend(bucket)
     commitments_str = "\n".join(commit_lines)
 
     # 装備品（context に含める）
@@ -534,7 +535,7 @@ async def run_context_housekeeping(ctx: AppContext, config: ChatConfig) -> dict:
 
     from nous.infrastructure.llm.base import DoneEvent, ErrorEvent, TextDeltaEvent
 
-    text = ""
+    chunks: list[str] = []
     try:
         async for event in provider.stream(
             messages=[LLMMessage(role="user", content=prompt)],
@@ -544,13 +545,14 @@ async def run_context_housekeeping(ctx: AppContext, config: ChatConfig) -> dict:
             max_tokens=512,
         ):
             if isinstance(event, TextDeltaEvent):
-                text += event.content
+                chunks.append(event.content)
             elif isinstance(event, (DoneEvent, ErrorEvent)):
                 break
     except Exception as e:
         logger.warning("run_context_housekeeping: LLM call failed: %s", e)
         return {"error": str(e)}
 
+    text = "".join(chunks)
     # JSON解析
     raw = text.strip()
     if raw.startswith("```"):
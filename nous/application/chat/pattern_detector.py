@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import json
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -154,7 +155,7 @@ async def maybe_run_mental_model(
                 continue
 
             # Collect recent N memories (up to 20 for LLM context)
-            recent = sorted(memories, key=lambda m: m.created_at, reverse=True)[:20]
+            recent = heapq.nlargest(20, memories, key=lambda m: m.created_at)
             memory_lines = "\n".join(f"- [{m.importance:.1f}] {m.content[:200]}" for m in recent)
 
             prompt = _PROMPT_TEMPLATE.format(type_tag=type_tag, memories=memory_lines)
@@ -167,7 +168,7 @@ async def maybe_run_mental_model(
 
             from nous.infrastructure.llm.base import DoneEvent, ErrorEvent, TextDeltaEvent
 
-            text = ""
+            chunks: list[str] = []
             try:
                 async for event in provider.stream(
                     messages=[LLMMessage(role="user", content=prompt)],
@@ -177,13 +178,14 @@ async def maybe_run_mental_model(
                     max_tokens=512,
                 ):
                     if isinstance(event, TextDeltaEvent):
-                        text += event.content
+                        chunks.append(event.content)
                     elif isinstance(event, (DoneEvent, ErrorEvent)):
                         break
             except Exception as e:
                 logger.warning("PatternDetector: LLM call failed for %s: %s", type_tag, e)
                 continue
 
+            text = "".join(chunks)
             models = _parse_models(text)
             if not models:
                 logger.debug("PatternDetector: no models parsed for %s", type_tag)
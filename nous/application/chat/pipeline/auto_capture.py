@@ -11,6 +11,7 @@ import re
 from typing import TYPE_CHECKING
 
 from nous.infrastructure.logging.structured import get_logger
+from nous.infrastructure.qdrant.adapter import memory_payload
 
 if TYPE_CHECKING:
     from nous.application.use_cases import AppContext
@@ -172,7 +173,9 @@ async def run_auto_capture(
                     # Also upsert to vector store if available
                     if ctx.vector_store:
                         try:
-                            ctx.vector_store.upsert(persona, result.value.key, text)
+                            ctx.vector_store.upsert(
+                                persona, result.value.key, text, metadata=memory_payload(result.value)
+                            )
                         except Exception:
                             logger.debug("VectorStore upsert failed for auto-captured memory")
             except Exception as e:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from nous.infrastructure.llm.base import LLMMessage
 from nous.infrastructure.llm.token_counter import TokenCounter
 from nous.infrastructure.logging.structured import get_logger
 
@@ -11,7 +12,6 @@ if TYPE_CHECKING:
     from nous.application.chat.pipeline.context import ChatTurnContext
     from nous.application.use_cases import AppContext
     from nous.domain.chat_config import ChatConfig
-    from nous.infrastructure.llm.base import LLMMessage
 
 logger = get_logger(__name__)
 
@@ -165,8 +165,6 @@ class CompressStep:
         We keep the most recent 3 assistant turns' tool results intact.
         Tool results before that are replaced with '[cleared]'.
         """
-        from nous.infrastructure.llm.base import LLMMessage
-
         # Find indices of assistant messages
         assistant_indices = [i for i, m in enumerate(messages) if m.role == "assistant"]
 
@@ -203,8 +201,6 @@ class CompressStep:
         Keeps the most recent N turns intact; truncates everything before that.
         Tool messages are left as-is (handled by _clear_old_tool_results).
         """
-        from nous.infrastructure.llm.base import LLMMessage
-
         keep_count = keep_recent_turns * 2  # user + assistant = one turn
         if len(messages) <= keep_count:
             return messages
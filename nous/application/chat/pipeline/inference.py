@@ -12,7 +12,7 @@ from nous.application.chat.events import (
     ToolCallSSE,
     ToolResultSSE,
 )
-from nous.infrastructure.llm.base import LLMMessage
+from nous.infrastructure.llm.base import ErrorEvent, LLMMessage, TextDeltaEvent, ToolCallEvent
 from nous.infrastructure.llm.factory import get_provider
 from nous.infrastructure.logging.structured import get_logger
 
@@ -39,8 +39,6 @@ class InferenceStep:
         registry: ToolRegistry,
         effective_temp: float | None = None,
     ) -> AsyncIterator[TextDeltaSSE | ToolCallSSE | ToolResultSSE | ErrorSSE]:
-        from nous.infrastructure.llm.base import ErrorEvent, TextDeltaEvent, ToolCallEvent
-
         api_key = config.get_effective_api_key()
         if not api_key:
             yield ErrorSSE(message="APIキーが設定されていません。チャット設定でAPIキーを入力してください。")
@@ -78,25 +76,29 @@ class InferenceStep:
         temperature = effective_temp if effective_temp is not None else config.temperature
         while turn_ctx.tool_call_count <= config.max_tool_calls:
             pending_tool_calls: list[ToolCallEvent] = []
-            current_text = ""
-
-            async for event in provider.stream(
-                messages=messages,
-                system=turn_ctx.system_prompt,
-                tools=all_tools,
-                temperature=temperature,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-            ):
-                if isinstance(event, TextDeltaEvent):
-                    current_text += event.content
-                    turn_ctx.full_response += event.content
-                    yield TextDeltaSSE(content=event.content)
-                elif isinstance(event, ToolCallEvent):
-                    pending_tool_calls.append(event)
-                elif isinstance(event, ErrorEvent):
-                    yield ErrorSSE(message=event.message)
-                    return
+            # Deltas are joined once per round instead of re-concatenating per token
+            text_parts: list[str] = []
+
+            try:
+                async for event in provider.stream(
+                    messages=messages,
+                    system=turn_ctx.system_prompt,
+                    tools=all_tools,
+                    temperature=temperature,
+                    max_tokens=config.max_tokens,
+                    top_p=config.top_p,
+                ):
+                    if isinstance(event, TextDeltaEvent):
+                        text_parts.append(event.content)
+                        yield TextDeltaSSE(content=event.content)
+                    elif isinstance(event, ToolCallEvent):
+                        pending_tool_calls.append(event)
+                    elif isinstance(event, ErrorEvent):
+                        yield ErrorSSE(message=event.message)
+                        return
+            finally:
+                current_text = "".join(text_parts)
+                turn_ctx.full_response += current_text
 
             if not pending_tool_calls:
                 break
@@ -87,15 +87,6 @@ class PostProcessStep:
             tool_calls=turn_ctx.tool_calls_log if turn_ctx.tool_calls_log else None,
         )
 
-        # SessionSummarizedSSE: await collected summary tasks
-        for task in _summary_tasks:
-            try:
-                summary = await task
-                if summary:
-                    yield SessionSummarizedSSE(summary=summary)
-            except Exception as e:
-                logger.warning("SessionSummarizedSSE failed: %s", e)
-
         # Auto-capture: セッション会話から重要情報を記憶として抽出
         try:
             if ctx.settings.auto_capture.enabled and session._messages:
@@ -127,6 +118,16 @@ class PostProcessStep:
             except Exception as e:
                 logger.warning("PostProcessStep: run_memory_llm failed: %s", e)
 
+        # SessionSummarizedSSE: the summary tasks started at eviction have been
+        # running alongside MemoryLLM, so this wait no longer adds their latency to it
+        for task in _summary_tasks:
+            try:
+                summary = await task
+                if summary:
+                    yield SessionSummarizedSSE(summary=summary)
+            except Exception as e:
+                logger.warning("SessionSummarizedSSE failed: %s", e)
+
         # Housekeeping: active goals+promises が threshold 超えたら自動整理
         housekeeping_threshold = getattr(config, "housekeeping_threshold", 10)
         try:
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import math
+import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -23,15 +25,18 @@ logger = get_logger(__name__)
 _RECENCY_LAMBDA = 0.5  # half-life ≈ 1.4 days
 
 
-def _compute_recency_decay(created_at: datetime | None) -> float:
-    """Compute recency decay: exp(-λ * days_elapsed) with λ=0.5."""
+def _compute_recency_decay(created_at: datetime | None, now_ts: float | None = None) -> float:
+    """Compute recency decay: exp(-λ * days_elapsed) with λ=0.5.
+
+    ``now_ts`` (POSIX seconds) lets a caller scoring many memories read the clock once.
+    """
     if created_at is None:
         return 0.5
-    now = datetime.now(tz=UTC)
-    # Ensure tz-aware comparison
-    if created_at.tzinfo is None:
-        created_at = created_at.replace(tzinfo=UTC)
-    days_elapsed = max(0.0, (now - created_at).total_seconds() / 86400.0)
+    if now_ts is None:
+        now_ts = time.time()
+    # Naive datetimes are treated as UTC
+    created_ts = (created_at if created_at.tzinfo is not None else created_at.replace(tzinfo=UTC)).timestamp()
+    days_elapsed = max(0.0, (now_ts - created_ts) / 86400.0)
     return math.exp(-_RECENCY_LAMBDA * days_elapsed)
 
 
@@ -89,16 +94,16 @@ async def _search_memories(
 
     # Compute composite score for each unique memory
     scored: list[tuple[float, object]] = []
+    now_ts = time.time()
     for content, mem in mem_by_content.items():
         importance = float(getattr(mem, "importance", 0.5))
         created_at = getattr(mem, "created_at", None)
-        recency = _compute_recency_decay(created_at)
+        recency = _compute_recency_decay(created_at, now_ts)
         relevance = rrf_scores.get(content, 0.0)
         composite = recency_w * recency + importance_w * importance + relevance_w * relevance
         scored.append((composite, mem))
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    top = scored[:top_k]
+    top = heapq.nlargest(top_k, scored, key=lambda x: x[0])
 
     if not top:
         return "", {"queries": queries, "results": []}, []
@@ -143,16 +148,14 @@ async def _build_context_section(
 
     last_conv = getattr(state, "last_conversation_time", None)
     if last_conv:
-        time_since = relative_time_str(last_conv)
+        # One clock read serves the timestamp, the relative label and the elapsed note
+        time_since = relative_time_str(last_conv, now_jst)
         t1.append(f"Last conversation: {time_since}")
         # Elapsed time note (minimal - LLM uses this naturally)
         try:
-            _now = get_now()
             if last_conv.tzinfo is None:
-                from zoneinfo import ZoneInfo  # noqa: PLC0415
-
-                last_conv = last_conv.replace(tzinfo=ZoneInfo("Asia/Tokyo"))
-            elapsed_hours = (_now - last_conv).total_seconds() / 3600.0
+                last_conv = last_conv.replace(tzinfo=now_jst.tzinfo)
+            elapsed_hours = (now_jst - last_conv).total_seconds() / 3600.0
             if elapsed_hours >= 24:
                 days = elapsed_hours / 24
                 t1.append(f"About {days:.0f} day(s) since last conversation.")
@@ -298,13 +301,13 @@ async def _build_context_section(
     except Exception as e:
         logger.debug("Failed to fetch equipment: %s", e)
 
-    # Assemble 3-tier output
-    result = "【現在の状態】\n" + "\n".join(t1)
+    # Assemble 3-tier output (one join per tier, one for the whole)
+    tiers = ["\n".join(("【現在の状態】", *t1))]
     if t2:
-        result += "\n\n【身体・環境】\n" + "\n".join(t2)
+        tiers.append("\n".join(("【身体・環境】", *t2)))
     if t3:
-        result += "\n\n【参照情報】\n" + "\n".join(t3)
-    return result
+        tiers.append("\n".join(("【参照情報】", *t3)))
+    return "\n\n".join(tiers)
 
 
 class PrepareStep:
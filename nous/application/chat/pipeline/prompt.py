@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
+from nous.config.settings import get_settings
+from nous.domain.skill import SkillRepository
 from nous.infrastructure.logging.structured import get_logger
+from nous.infrastructure.sqlite.connection import get_global_skills_db
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from nous.application.chat.pipeline.context import ChatTurnContext
     from nous.application.use_cases import AppContext
     from nous.domain.chat_config import ChatConfig
@@ -14,6 +20,28 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _skills_section(db: sqlite3.Connection, names: tuple[str, ...], version: tuple) -> tuple[str, tuple[dict, ...]]:
+    """Skill list section of the system prompt and its raw skill dicts.
+
+    Memoized per enabled-skill tuple; ``version`` (row count, newest
+    ``updated_at`` and the connection's change counter) invalidates entries
+    when skills are edited.
+    """
+    skill_repo = SkillRepository(db)
+    skills = [s for s in (skill_repo.get(n) for n in names) if s]
+    # L1: name + short description only (~100 tokens/skill)
+    skill_lines = [f"- {s.name}: {(s.description or '')[:120]}" for s in skills]
+    section = ""
+    if skill_lines:
+        section = (
+            "\n--- 利用可能なSkill ---\n"
+            + "\n".join(skill_lines)
+            + "\n\n各スキルの詳細な使い方は invoke_skill ツールで読み込めます。"
+        )
+    return section, tuple(s.model_dump() for s in skills)
+
+
 class PromptBuildStep:
     """systemプロンプトを組み立てる。"""
 
@@ -40,27 +68,12 @@ class PromptBuildStep:
         skills_raw: list[dict] = []
         if config.enabled_skills:
             try:
-                from nous.config.settings import get_settings
-                from nous.domain.skill import SkillRepository
-                from nous.infrastructure.sqlite.connection import get_global_skills_db
-
-                skill_repo = SkillRepository(get_global_skills_db(get_settings().data_root))
-                skills = [skill_repo.get(n) for n in config.enabled_skills]
-                skill_lines = []
-                for s in skills:
-                    if not s:
-                        continue
-                    # L1: name + short description only (~100 tokens/skill)
-                    desc = (s.description or "")[:120]
-                    line = f"- {s.name}: {desc}"
-                    skill_lines.append(line)
-                skills_raw = [s.model_dump() for s in skills if s]
-                if skill_lines:
-                    parts.append(
-                        "\n--- 利用可能なSkill ---\n"
-                        + "\n".join(skill_lines)
-                        + "\n\n各スキルの詳細な使い方は invoke_skill ツールで読み込めます。"
-                    )
+                db = get_global_skills_db(get_settings().data_root)
+                version = tuple(db.execute("SELECT COUNT(*), MAX(updated_at), total_changes() FROM skills").fetchone())
+                section, cached_raw = _skills_section(db, tuple(config.enabled_skills), version)
+                skills_raw = list(cached_raw)
+                if section:
+                    parts.append(section)
             except Exception as e:
                 logger.warning("PromptBuildStep: skills load failed: %s", e)
 
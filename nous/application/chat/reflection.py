@@ -106,9 +106,13 @@ async def maybe_run_reflection(
     if not api_key or not extract_model:
         return []
 
-    # 最近24時間以内の記憶を最大20件取得
+    # 最近24時間以内の記憶を重要度順に最大20件取得（なければ直近10件）
     cutoff = now - timedelta(hours=24)
-    recent_result = ctx.memory_service.get_recent(limit=20)
+    period_result = ctx.memory_service.get_by_period(cutoff, limit=20)
+    if period_result.is_ok and period_result.value:
+        recent_result = period_result
+    else:
+        recent_result = ctx.memory_service.get_recent(limit=10)
     if not recent_result.is_ok or not recent_result.value:
         # フォールバック: スマートサーチで最近記憶を取得
         search_result = ctx.search_engine.search(SearchQuery(text="記憶 事実 出来事", top_k=20, mode="hybrid"))
@@ -118,7 +122,7 @@ async def maybe_run_reflection(
                 mem = item[0] if isinstance(item, tuple) else item
                 memories.append(mem)
     else:
-        memories = [m for m in recent_result.value if m.created_at >= cutoff] or recent_result.value[:10]
+        memories = recent_result.value
 
     if not memories:
         return []
@@ -134,7 +138,7 @@ async def maybe_run_reflection(
 
     from nous.infrastructure.llm.base import DoneEvent, ErrorEvent, TextDeltaEvent
 
-    text = ""
+    chunks: list[str] = []
     try:
         async for event in provider.stream(
             messages=[LLMMessage(role="user", content=prompt)],
@@ -144,13 +148,14 @@ async def maybe_run_reflection(
             max_tokens=512,
         ):
             if isinstance(event, TextDeltaEvent):
-                text += event.content
+                chunks.append(event.content)
             elif isinstance(event, (DoneEvent, ErrorEvent)):
                 break
     except Exception as e:
         logger.warning("ReflectionEngine: LLM call failed: %s", e)
         return []
 
+    text = "".join(chunks)
     insights = _parse_insights(text)
     if not insights:
         return []
@@ -111,14 +111,15 @@ class ChatService:
                 ).to_sse()
 
             # Collect and stream LLM response
-            full_response = ""
+            from nous.application.chat.events import TextDeltaSSE
+
+            response_chunks: list[str] = []
             async for event in InferenceStep().run(ctx, config, messages, turn_ctx, registry, effective_temp=effective_temp):
                 yield event.to_sse()
                 # Collect text deltas for chat.llm_response event
-                from nous.application.chat.events import TextDeltaSSE
-
                 if isinstance(event, TextDeltaSSE):
-                    full_response += event.content
+                    response_chunks.append(event.content)
+            full_response = "".join(response_chunks)
 
             # Publish chat.llm_response event
             if full_response:
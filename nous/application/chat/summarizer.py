@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
-from nous.infrastructure.llm.base import LLMMessage
+from nous.infrastructure.llm.base import DoneEvent, ErrorEvent, LLMMessage, TextDeltaEvent
 from nous.infrastructure.llm.factory import get_provider
 from nous.infrastructure.logging.structured import get_logger
 
 if TYPE_CHECKING:
     from nous.application.use_cases import AppContext
     from nous.domain.chat_config import ChatConfig
+    from nous.infrastructure.llm.base import LLMProvider
 
 logger = get_logger(__name__)
 
+# Summarization budgets. The calls run while the chat turn is still finishing,
+# so they are bounded: characters per turn and per call (~4 chars/token),
+# output tokens per call, and total wall time. Rate-limit retries honouring
+# Retry-After are handled by the provider SDK clients.
+_TURN_CHAR_LIMIT = 300
+_INPUT_CHAR_BUDGET = 4000
+_MAX_OUTPUT_TOKENS = 256
+_TIMEOUT_SECONDS = 20.0
+# Summary calls in flight at once, so a long eviction does not burst the provider's rate limit
+_MAX_CONCURRENT_CALLS = 3
+
 _SUMMARIZE_PROMPT = """\
 以下の会話を2〜3文の日本語で簡潔に要約してください。
 重要な情報・決定事項・感情的な出来事を優先してください。
@@ -25,6 +38,70 @@ _SUMMARIZE_PROMPT = """\
 要約文のみ。JSON不要。
 """
 
+_MERGE_PROMPT = """\
+以下は一つの会話を区切りごとに要約したものです。全体を2〜3文の日本語で簡潔に要約してください。
+重要な情報・決定事項・感情的な出来事を優先してください。
+
+【区切りごとの要約】
+{conversation}
+
+【出力】
+要約文のみ。JSON不要。
+"""
+
+
+def _pack_lines(lines: list[str], min_per_batch: int = 1) -> list[list[str]]:
+    """Pack lines, in order, into batches within the input budget.
+
+    A batch is closed only once it holds ``min_per_batch`` lines, so an
+    oversized line still shares its batch when merging must make progress.
+    """
+    batches: list[list[str]] = []
+    current: list[str] = []
+    used = 0
+    for line in lines:
+        if len(current) >= min_per_batch and used + len(line) > _INPUT_CHAR_BUDGET:
+            batches.append(current)
+            current, used = [], 0
+        current.append(line)
+        used += len(line)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _pack_turns(turns: list[dict]) -> list[list[str]]:
+    """Format turns as lines and pack them, in order, into batches within the input budget."""
+    lines: list[str] = []
+    for turn in turns:
+        role = turn.get("role", "unknown")
+        content = turn.get("content", "")
+        if role == "user":
+            lines.append(f"User: {content[:_TURN_CHAR_LIMIT]}")
+        elif role == "assistant":
+            lines.append(f"Assistant: {content[:_TURN_CHAR_LIMIT]}")
+    return _pack_lines(lines)
+
+
+async def _summarize(provider: LLMProvider, template: str, lines: list[str]) -> str:
+    """One bounded LLM call over ``lines``; returns the stripped text ("" when nothing came back)."""
+    if not lines:
+        return ""
+    prompt = template.format(conversation="\n".join(lines))
+    chunks: list[str] = []
+    async for event in provider.stream(
+        messages=[LLMMessage(role="user", content=prompt)],
+        system="",
+        tools=[],
+        temperature=0.0,
+        max_tokens=_MAX_OUTPUT_TOKENS,
+    ):
+        if isinstance(event, TextDeltaEvent):
+            chunks.append(event.content)
+        elif isinstance(event, (DoneEvent, ErrorEvent)):
+            break
+    return "".join(chunks).strip()
+
 
 async def summarize_and_store(
     ctx: AppContext,
@@ -52,46 +129,42 @@ async def summarize_and_store(
     if not api_key or not model:
         return None
 
-    conversation_lines = []
-    for turn in turns:
-        role = turn.get("role", "unknown")
-        content = turn.get("content", "")
-        if role == "user":
-            conversation_lines.append(f"User: {content[:300]}")
-        elif role == "assistant":
-            conversation_lines.append(f"Assistant: {content[:300]}")
-
-    if not conversation_lines:
+    batches = _pack_turns(turns)
+    if not batches:
         return None
 
-    prompt = _SUMMARIZE_PROMPT.format(conversation="\n".join(conversation_lines))
-
     try:
         provider = get_provider(config.provider, api_key, model, config.get_effective_base_url())
     except Exception as e:
         logger.warning("SessionSummarizer: provider init failed: %s", e)
         return None
 
-    from nous.infrastructure.llm.base import DoneEvent, ErrorEvent, TextDeltaEvent
-
-    text = ""
     try:
-        async for event in provider.stream(
-            messages=[LLMMessage(role="user", content=prompt)],
-            system="",
-            tools=[],
-            temperature=0.0,
-            max_tokens=256,
-        ):
-            if isinstance(event, TextDeltaEvent):
-                text += event.content
-            elif isinstance(event, (DoneEvent, ErrorEvent)):
-                break
+        async with asyncio.timeout(_TIMEOUT_SECONDS):
+            if len(batches) == 1:
+                summary = await _summarize(provider, _SUMMARIZE_PROMPT, batches[0])
+            else:
+                # Long evictions: summarize budget-sized batches concurrently, then
+                # merge the partial summaries level by level until one remains
+                limiter = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+
+                async def _bounded(template: str, batch: list[str]) -> str:
+                    async with limiter:
+                        return await _summarize(provider, template, batch)
+
+                partials = await asyncio.gather(*(_bounded(_SUMMARIZE_PROMPT, b) for b in batches))
+                partials = [p for p in partials if p]
+                while len(groups := _pack_lines(partials, min_per_batch=2)) > 1:
+                    merged = await asyncio.gather(*(_bounded(_MERGE_PROMPT, g) for g in groups))
+                    partials = [p for p in merged if p]
+                summary = await _summarize(provider, _MERGE_PROMPT, partials)
+    except TimeoutError:
+        logger.warning("SessionSummarizer: LLM call exceeded %.0fs, skipping summary", _TIMEOUT_SECONDS)
+        return None
     except Exception as e:
         logger.warning("SessionSummarizer: LLM call failed: %s", e)
         return None
 
-    summary = text.strip()
     if not summary:
         return None
 
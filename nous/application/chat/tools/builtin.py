@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING, Any
 
-from nous.api.mcp.tools import TOOL_DISPATCH
+from nous.api.mcp.tools import TOOL_DISPATCH, TOOL_PAYLOAD_DISPATCH
 from nous.application.chat.tools.definitions import _NOUS_TOOL_NAMES
 from nous.config.runtime_config import RuntimeConfigManager
 from nous.config.settings import get_settings
@@ -391,7 +391,7 @@ async def _handle_mcp_dispatch(tool_name: str, ctx: AppContext, config: ChatConf
     if tool_name.startswith("sandbox_") and not getattr(config, "sandbox_enabled", False):
         return {"status": "error", "message": "Sandbox is disabled. Enable it in chat settings."}
 
-    func = TOOL_DISPATCH.get(tool_name)
+    func = TOOL_PAYLOAD_DISPATCH.get(tool_name) or TOOL_DISPATCH.get(tool_name)
     if func is None:
         return {"status": "error", "message": f"Unknown tool: {tool_name}"}
 
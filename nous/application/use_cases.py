@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from nous.domain.equipment.service import EquipmentService
 from nous.domain.memory.service import MemoryService
 from nous.domain.persona.service import PersonaService
+from nous.domain.search.cache import SearchResultCache
 from nous.domain.search.engine import SearchEngine
 from nous.domain.search.ranker import ChainedRanker, ForgettingCurveRanker, RRFRanker, TopicAffinityRanker
 from nous.domain.shared.errors import SearchError
@@ -33,8 +34,8 @@ class SQLiteKeywordSearch:
     def __init__(self, repo: SQLiteMemoryRepository) -> None:
         self.repo = repo
 
-    def search(self, query: str, limit: int = 10, date_from=None, date_to=None):
-        result = self.repo.search_keyword(query, limit, date_from=date_from, date_to=date_to)
+    def search(self, query: str, limit: int = 10, date_from=None, date_to=None, tags: list[str] | None = None):
+        result = self.repo.search_keyword(query, limit, date_from=date_from, date_to=date_to, tags=tags)
         if result.is_ok:
             return Success(result.value)
         return Failure(SearchError(str(result.error)))
@@ -48,32 +49,87 @@ class QdrantSemanticSearch:
         self.memory_repo = memory_repo
         self.persona: str = ""
 
-    def search(self, query: str, limit: int = 10, date_from=None, date_to=None):
-        # Fetch extra results to compensate for date post-filtering
-        fetch_limit = limit * 3 if (date_from or date_to) else limit
-        result = self.vector_store.search(self.persona, query, fetch_limit)
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        date_from=None,
+        date_to=None,
+        min_importance: float | None = None,
+        emotion: str | None = None,
+        tags: list[str] | None = None,
+    ):
+        fetch_limit, query_filter = self._vector_query(limit, date_from, date_to, min_importance, emotion, tags)
+        if query_filter is not None:
+            result = self.vector_store.search(self.persona, query, fetch_limit, query_filter=query_filter)
+        else:
+            result = self.vector_store.search(self.persona, query, fetch_limit)
         if not result.is_ok:
             return Failure(SearchError(str(result.error)))
 
+        # Hydrate all hits with a single `WHERE key IN (...)` query; the date
+        # range is applied there on the numeric created_at_ts column.
+        mem_result = self.memory_repo.find_by_keys(
+            [key for key, _ in result.value], date_from=date_from, date_to=date_to
+        )
+        if not mem_result.is_ok:
+            return Failure(SearchError(str(mem_result.error)))
+        return Success(self._collect(result.value, mem_result.value, limit, min_importance, tags))
+
+    def search_many(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        date_from=None,
+        date_to=None,
+        min_importance: float | None = None,
+        emotion: str | None = None,
+        tags: list[str] | None = None,
+    ):
+        """Batched :meth:`search`: one embedding batch, one Qdrant request and one hydration query.
+
+        Returns one result list per query, in query order.
+        """
+        fetch_limit, query_filter = self._vector_query(limit, date_from, date_to, min_importance, emotion, tags)
+        result = self.vector_store.search_batch(self.persona, queries, fetch_limit, query_filter=query_filter)
+        if not result.is_ok:
+            return Failure(SearchError(str(result.error)))
+
+        keys = list(dict.fromkeys(key for hits in result.value for key, _ in hits))
+        mem_result = self.memory_repo.find_by_keys(keys, date_from=date_from, date_to=date_to)
+        if not mem_result.is_ok:
+            return Failure(SearchError(str(mem_result.error)))
+        return Success([self._collect(hits, mem_result.value, limit, min_importance, tags) for hits in result.value])
+
+    def _vector_query(self, limit, date_from, date_to, min_importance, emotion, tags):
+        """Fetch limit and payload filter (None when unfiltered) for a vector search."""
+        # Fetch extra results for payload-less points let through the tag and
+        # date filters (they are rejected again below / in SQL)
+        has_dates = date_from is not None or date_to is not None
+        fetch_limit = limit * 2 if tags or has_dates else limit
+        # Importance/emotion/tags/date range are pushed down as a Qdrant payload filter
+        if min_importance is None and emotion is None and not tags and not has_dates:
+            return fetch_limit, None
+        query_filter = self.vector_store.build_filter(
+            min_importance=min_importance, emotion=emotion, tags=tags, date_from=date_from, date_to=date_to
+        )
+        return fetch_limit, query_filter
+
+    @staticmethod
+    def _collect(hits, memories, limit, min_importance, tags) -> list[tuple]:
         search_results: list[tuple] = []
-        for key, score in result.value:
-            mem_result = self.memory_repo.find_by_key(key)
-            if mem_result.is_ok and mem_result.value:
-                memory = mem_result.value
-                # Post-filter by date range
-                if date_from or date_to:
-                    created = memory.created_at
-                    # Strip timezone from filter bounds for naive comparison.
-                    # date_from/date_to from parse_date_range are JST-aware,
-                    # but memory.created_at from SQLite is timezone-naive.
-                    if date_from and created < date_from.replace(tzinfo=None):
-                        continue
-                    if date_to and created > date_to.replace(tzinfo=None):
-                        continue
+        for key, score in hits:
+            memory = memories.get(key)
+            if memory is not None:
+                # Points upserted without payload metadata pass the Qdrant filter
+                if min_importance is not None and memory.importance < min_importance:
+                    continue
+                if tags and not set(tags).issubset(memory.tags):
+                    continue
                 search_results.append((memory, score))
                 if len(search_results) >= limit:
                     break
-        return Success(search_results)
+        return search_results
 
 
 class AppContext:
@@ -198,7 +254,9 @@ class AppContext:
                 mgr = QdrantClientManager(self.settings.qdrant.url, self.settings.qdrant.api_key)
                 if mgr.health_check():
                     emb = self.embedding_model
-                    vs = QdrantVectorStore(mgr, emb, self.settings.qdrant.collection_prefix)
+                    vs = QdrantVectorStore(
+                        mgr, emb, self.settings.qdrant.collection_prefix, quantization=self.settings.qdrant.quantization
+                    )
                     result = vs.ensure_collection(self.persona)
                     if result.is_ok:
                         self._vector_store = vs
@@ -224,13 +282,13 @@ class AppContext:
             keyword = SQLiteKeywordSearch(self.memory_repo)
             semantic = QdrantSemanticSearch(self.vector_store, self.memory_repo) if self.vector_store else None
 
-            def _strength_lookup(key: str) -> float:
-                result = self.memory_repo.get_strength(key)
-                if result.is_ok and result.value is not None:
-                    return result.value.strength
-                return 1.0
+            def _strength_lookup(keys: list[str]) -> dict[str, float]:
+                result = self.memory_repo.get_strength_values(keys)
+                return result.value if result.is_ok else {}
 
-            ranker = ChainedRanker(RRFRanker(), ForgettingCurveRanker(_strength_lookup), TopicAffinityRanker())
+            ranker = ChainedRanker(
+                RRFRanker(), ForgettingCurveRanker(batch_lookup=_strength_lookup), TopicAffinityRanker()
+            )
             self._search_engine = SearchEngine(
                 keyword,
                 semantic,
@@ -238,6 +296,7 @@ class AppContext:
                 memory_repo=self.memory_repo,
                 memorag_config=self.settings.memorag,
                 reranker=self._reranker,
+                result_cache=SearchResultCache(),
             )
         return self._search_engine
 
@@ -247,7 +306,9 @@ class AppContext:
             mgr = QdrantClientManager(self.settings.qdrant.url, self.settings.qdrant.api_key)
             if mgr.health_check():
                 emb = self.embedding_model
-                vs = QdrantVectorStore(mgr, emb, self.settings.qdrant.collection_prefix)
+                vs = QdrantVectorStore(
+                    mgr, emb, self.settings.qdrant.collection_prefix, quantization=self.settings.qdrant.quantization
+                )
                 result = vs.ensure_collection(self.persona)
                 if result.is_ok:
                     self._vector_store = vs
@@ -274,6 +335,11 @@ class AppContextRegistry:
     def configure(cls, settings: Settings) -> None:
         cls._settings = settings
 
+    @classmethod
+    def configured_settings(cls) -> Settings | None:
+        """Settings new contexts are built from, or None before configure()."""
+        return cls._settings
+
     @classmethod
     def get(cls, persona: str) -> AppContext:
         if persona in cls._contexts:
@@ -11,6 +11,10 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+_DUPLICATE_THRESHOLD = 0.95
+# Rows per similarity block; bounds the block at _SIMILARITY_CHUNK x len(memories)
+_SIMILARITY_CHUNK = 256
+
 
 class CleanupWorker:
     """Duplicate detection and cleanup worker."""
@@ -35,29 +39,40 @@ class CleanupWorker:
             time.sleep(self.interval)
 
     def _cleanup_cycle(self) -> None:
-        """Find and flag near-duplicate memories."""
-        vs = self.context.vector_store
-        if vs is None:
+        """Find and flag near-duplicate memories.
+
+        All contents are embedded in one batch and compared with chunked
+        matrix products, instead of one vector-store search per memory.
+        """
+        if self.context.vector_store is None:
             return
 
         result = self.context.memory_repo.find_all()
-        if not result.is_ok:
+        if not result.is_ok or not result.value:
             return
 
         memories = result.value
+        try:
+            vectors = self.context.embedding_model.encode_batch([m.content for m in memories])
+        except Exception as e:
+            logger.warning("Duplicate scan skipped, embedding failed: %s", e)
+            return
+
         seen_keys: set[str] = set()
-        for memory in memories:
-            if memory.key in seen_keys:
-                continue
-            search_result = vs.search(self.context.persona, memory.content, limit=5)
-            if not search_result.is_ok:
-                continue
-            for key, score in search_result.value:
-                if key != memory.key and score > 0.95:
-                    logger.info(
-                        "Potential duplicate detected: %s <-> %s (score=%.3f)",
-                        memory.key,
-                        key,
-                        score,
-                    )
-                    seen_keys.add(key)
+        for start in range(0, len(memories), _SIMILARITY_CHUNK):
+            # Vectors are normalised, so the dot product is the cosine similarity
+            similarities = vectors[start : start + _SIMILARITY_CHUNK] @ vectors.T
+            for offset, row in enumerate(similarities):
+                memory = memories[start + offset]
+                if memory.key in seen_keys:
+                    continue
+                for j in (row > _DUPLICATE_THRESHOLD).nonzero()[0]:
+                    key = memories[j].key
+                    if key != memory.key:
+                        logger.info(
+                            "Potential duplicate detected: %s <-> %s (score=%.3f)",
+                            memory.key,
+                            key,
+                            float(row[j]),
+                        )
+                        seen_keys.add(key)
@@ -13,8 +13,10 @@ Philosophy: "Memories don't disappear — they consolidate."
 
 from __future__ import annotations
 
+import heapq
 import threading
 import time
+from collections import Counter
 from typing import TYPE_CHECKING
 
 from nous.infrastructure.logging.structured import get_logger
@@ -78,12 +80,12 @@ class ConsolidationWorker:
 
     def _consolidate_persona(self, ctx, persona: str) -> None:
         """Consolidate archived memories for a single persona."""
-        # 1. Find all non-tombstoned memories, filter for archived
-        all_result = ctx.memory_repo.find_all()
-        if not all_result.is_ok or not all_result.value:
+        # 1. Find archived memories (filtered in SQL rather than loading every row)
+        archived_result = ctx.memory_repo.find_by_lifecycle_status("archived")
+        if not archived_result.is_ok:
             return
 
-        archived = [m for m in all_result.value if m.lifecycle_status == "archived"]
+        archived = archived_result.value
         if len(archived) < self.min_memories_per_group:
             logger.debug(
                 "ConsolidationWorker: %s has %d archived (< %d)", persona, len(archived), self.min_memories_per_group
@@ -105,16 +107,10 @@ class ConsolidationWorker:
         groups = self._group_by_entities(archived, mem_entities)
         logger.info("ConsolidationWorker: %s grouped into %d entity clusters", persona, len(groups))
 
-        # 4. Consolidate each group
+        # 4. Consolidate the largest eligible groups (ties keep grouping order)
         consolidated_count = 0
-        # Sort groups by size descending
-        sorted_groups = sorted(groups.items(), key=lambda x: -len(x[1]))
-        for entity_key, memories in sorted_groups:
-            if consolidated_count >= self.max_consolidated:
-                break
-            if len(memories) < self.min_memories_per_group:
-                continue
-
+        eligible = [item for item in groups.items() if len(item[1]) >= self.min_memories_per_group]
+        for entity_key, memories in heapq.nlargest(self.max_consolidated, eligible, key=lambda x: len(x[1])):
             content = self._build_consolidated(memories)
             if content:
                 self._save_consolidated(ctx, content, memories, entity_key)
@@ -135,29 +131,38 @@ class ConsolidationWorker:
 
         Memories that share entity IDs are grouped together.
         Ungrouped memories start their own singleton group.
+
+        An entity -> groups inverted index maps each memory straight to the
+        groups it shares entities with; the overlap with a group is the
+        number of the memory's entities posted to it, so groups sharing
+        nothing are never visited.
         """
         groups: dict[str, list] = {}
+        group_entities: dict[str, set[str]] = {}
+        entity_groups: dict[str, list[str]] = {}
+        group_order: dict[str, int] = {}
         assigned: set[str] = set()
 
         for mem in memories:
             if mem.key in assigned:
                 continue
+            entities = mem_entities.get(mem.key, set())
             # Find the best existing group or start a new one
-            best_group: str | None = None
-            best_overlap = 0
-            for group_key, group_mems in groups.items():
-                group_entities: set[str] = set()
-                for gm in group_mems:
-                    group_entities |= mem_entities.get(gm.key, set())
-                overlap = len(mem_entities.get(mem.key, set()) & group_entities)
-                if overlap > best_overlap:
-                    best_overlap = overlap
-                    best_group = group_key
-
-            if best_group is not None and best_overlap > 0:
-                groups[best_group].append(mem)
+            overlaps: Counter[str] = Counter()
+            for entity in entities:
+                overlaps.update(entity_groups.get(entity, ()))
+            if overlaps:
+                # Ties go to the earliest-created group
+                target = max(overlaps, key=lambda g: (overlaps[g], -group_order[g]))
+                groups[target].append(mem)
             else:
-                groups[mem.key] = [mem]
+                target = mem.key
+                groups[target] = [mem]
+                group_entities[target] = set()
+                group_order[target] = len(group_order)
+            for entity in entities - group_entities[target]:
+                entity_groups.setdefault(entity, []).append(target)
+            group_entities[target] |= entities
             assigned.add(mem.key)
 
         return groups
@@ -170,11 +175,11 @@ class ConsolidationWorker:
         if not memories:
             return None
 
-        memories_sorted = sorted(memories, key=lambda m: m.created_at or "", reverse=True)
         lines = [f"## Consolidated Memory Group ({len(memories)} merged)"]
 
-        for mem in memories_sorted[:20]:  # cap at 20 per group
-            date_str = mem.created_at[:10] if mem.created_at else "?"
+        # Newest 20 per group; a bounded heap instead of sorting the whole group
+        for mem in heapq.nlargest(20, memories, key=lambda m: m.created_at):
+            date_str = f"{mem.created_at:%Y-%m-%d}"
             content_preview = mem.content[:200] if mem.content else "(empty)"
             lines.append(f"- [{date_str}] {content_preview}")
 
@@ -9,6 +9,7 @@ from nous.domain.shared.time_utils import get_now
 
 if TYPE_CHECKING:
     from nous.application.use_cases import AppContext
+    from nous.domain.memory.entities import MemoryStrength
 
 
 class DecayWorker:
@@ -40,13 +41,14 @@ class DecayWorker:
             return
 
         now = get_now()
+        decayed: list[MemoryStrength] = []
         for strength in result.value:
             elapsed = (now - strength.last_decay).total_seconds() / 3600 if strength.last_decay else 24.0
 
             # LTM uses slower decay exponent
             decay_exp = 0.3 if strength.is_ltm else 0.5
             recall = strength.compute_recall(elapsed, decay_exponent=decay_exp)
-            score = strength.compute_strength_score()
+            score = strength.compute_strength_score(now=now)
             new_strength_val = recall * score
 
             # STM → LTM automatic promotion (before min_strength check)
@@ -71,4 +73,8 @@ class DecayWorker:
 
             strength.strength = new_strength_val
             strength.last_decay = now
-            self.context.memory_repo.save_strength(strength)
+            decayed.append(strength)
+
+        # One executemany + commit for the whole cycle instead of a commit per memory
+        if decayed:
+            self.context.memory_repo.save_strengths(decayed)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from nous.domain.shared.errors import DomainError, VectorStoreError
 from nous.domain.shared.result import Failure, Success
 from nous.infrastructure.logging.structured import get_logger
+from nous.infrastructure.qdrant.adapter import memory_payload
 
 if TYPE_CHECKING:
     from nous.application.use_cases import AppContext
@@ -28,20 +29,18 @@ class RebuildWorker:
         if vs is None:
             return Failure(VectorStoreError("Qdrant not available"))
 
-        count = 0
-        for memory in memories_result.value:
-            upsert_result = vs.upsert(
-                self.context.persona,
-                memory.key,
-                memory.content,
-                {
-                    "importance": memory.importance,
-                    "emotion": memory.emotion,
-                    "tags": ",".join(memory.tags),
-                },
-            )
-            if upsert_result.is_ok:
-                count += 1
-
-        logger.info("Vector store rebuilt: %d vectors", count)
-        return Success(count)
+        memories = memories_result.value
+        if not memories:
+            return Success(0)
+
+        # One batched embedding pass instead of a model call per memory
+        upsert_result = vs.upsert_batch(
+            self.context.persona,
+            [(memory.key, memory.content) for memory in memories],
+            metadata=[{**memory_payload(memory), "tags": ",".join(memory.tags)} for memory in memories],
+        )
+        if not upsert_result.is_ok:
+            return Failure(upsert_result.error)
+
+        logger.info("Vector store rebuilt: %d vectors", upsert_result.value)
+        return Success(upsert_result.value)
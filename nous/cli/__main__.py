@@ -190,7 +190,10 @@ def _handle_stats(args: argparse.Namespace, settings: Settings) -> None:
 def _handle_auto_import(args: argparse.Namespace, settings: Settings) -> None:
     """Run auto-import for all .zip files found in the given directory."""
     from nous.application.auto_import import run_auto_import
+    from nous.application.use_cases import AppContextRegistry
 
+    # the vector sync step builds its persona context from these settings
+    AppContextRegistry.configure(settings)
     results = run_auto_import(settings, import_dir=args.import_dir)
     if not results:
         print("No .zip files found in", args.import_dir)
@@ -7,6 +7,14 @@ from pydantic import BaseModel, Field, computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@functools.lru_cache(maxsize=1)
+def _known_timezones() -> frozenset[str]:
+    """Return the IANA zone names once; ``available_timezones()`` walks the tzdata tree on every call."""
+    from zoneinfo import available_timezones
+
+    return frozenset(available_timezones())
+
+
 class EmbeddingConfig(BaseModel):
     """Embedding model configuration."""
 
@@ -28,6 +36,7 @@ class QdrantConfig(BaseModel):
     url: str = "http://localhost:6333"
     api_key: str | None = None
     collection_prefix: str = "memory_"
+    quantization: bool = True  # int8 scalar quantization (new collections; added to existing ones on startup)
 
 
 class ServerConfig(BaseModel):
@@ -192,9 +201,7 @@ class Settings(BaseSettings):
     @field_validator("timezone")
     @classmethod
     def validate_timezone(cls, v: str) -> str:
-        from zoneinfo import available_timezones
-
-        if v not in available_timezones():
+        if v not in _known_timezones():
             raise ValueError(f"Invalid timezone: '{v}'. Use a valid IANA timezone (e.g., 'Asia/Tokyo').")
         return v
 
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import json
 import os
-import sqlite3
 import warnings
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, field_validator
 
@@ -11,6 +11,9 @@ from nous.config.runtime_config import RuntimeConfigManager
 from nous.domain.shared.time_utils import format_iso, get_now
 from nous.domain.value_objects import normalize_importance
 
+if TYPE_CHECKING:
+    import sqlite3
+
 # Backward-compat env var names for API keys per provider (legacy, without NOUS_ prefix)
 _ENV_API_KEYS: dict[str, str] = {
     "anthropic": "ANTHROPIC_API_KEY",
@@ -231,6 +234,36 @@ class ChatConfig(BaseModel):
         return d
 
 
+# Columns added after the original chat_settings schema: (name, type, default SQL)
+_LATE_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ("searxng_url", "TEXT", "'http://localhost:8080'"),
+    ("image_gen_enabled", "BOOLEAN", "0"),
+    ("image_gen_provider", "TEXT", "'openai'"),
+    ("image_gen_dalle_model", "TEXT", "'dall-e-3'"),
+    ("image_gen_stability_url", "TEXT", "''"),
+    ("enable_memory_tools", "BOOLEAN", "1"),
+    ("debug_mode", "BOOLEAN", "0"),
+    ("dynamic_temperature", "INTEGER", "1"),
+    ("emotion_temperature_scale", "REAL", "0.2"),
+    ("top_p", "REAL", "NULL"),
+)
+
+
+def _ensure_columns(db: sqlite3.Connection) -> None:
+    """Add any missing late columns (for DBs/test environments without migrations).
+
+    Reads the schema with a single PRAGMA instead of probing each column, since
+    this runs on every config load and save.
+    """
+    existing = {row[1] for row in db.execute("PRAGMA table_info(chat_settings)")}
+    if not existing:
+        return
+    for col, col_type, default in _LATE_COLUMNS:
+        if col not in existing:
+            default_sql = "NULL" if default == "NULL" else f"DEFAULT {default}"
+            db.execute(f"ALTER TABLE chat_settings ADD COLUMN {col} {col_type} {default_sql}")  # nosec B608
+
+
 class ChatConfigRepository:
     """SQLite CRUD for ChatConfig, stored in the persona's memory.sqlite."""
 
@@ -239,24 +272,7 @@ class ChatConfigRepository:
 
     def get(self, persona: str) -> ChatConfig:
         """Load config for persona, returning defaults if not found."""
-        # Ensure newer columns exist (auto-migration on read, same as save())
-        for col, col_type, default in (
-            ("searxng_url", "TEXT", "'http://localhost:8080'"),
-            ("image_gen_enabled", "BOOLEAN", "0"),
-            ("image_gen_provider", "TEXT", "'openai'"),
-            ("image_gen_dalle_model", "TEXT", "'dall-e-3'"),
-            ("image_gen_stability_url", "TEXT", "''"),
-            ("enable_memory_tools", "BOOLEAN", "1"),
-            ("debug_mode", "BOOLEAN", "0"),
-            ("dynamic_temperature", "INTEGER", "1"),
-            ("emotion_temperature_scale", "REAL", "0.2"),
-            ("top_p", "REAL", "NULL"),
-        ):
-            try:
-                self._db.execute(f"SELECT {col} FROM chat_settings LIMIT 0")  # nosec B608
-            except sqlite3.OperationalError:
-                default_sql = "NULL" if default == "NULL" else f"DEFAULT {default}"
-                self._db.execute(f"ALTER TABLE chat_settings ADD COLUMN {col} {col_type} {default_sql}")
+        _ensure_columns(self._db)
 
         try:
             row = self._db.execute(
@@ -357,22 +373,7 @@ class ChatConfigRepository:
 
     def save(self, config: ChatConfig) -> None:
         """Insert or replace config for persona."""
-        # Ensure newer columns exist (for test environments without migrations)
-        for col, col_type, default in (
-            ("image_gen_enabled", "BOOLEAN", "0"),
-            ("image_gen_provider", "TEXT", "'openai'"),
-            ("image_gen_dalle_model", "TEXT", "'dall-e-3'"),
-            ("image_gen_stability_url", "TEXT", "''"),
-            ("enable_memory_tools", "BOOLEAN", "1"),
-            ("debug_mode", "BOOLEAN", "0"),
-            ("dynamic_temperature", "INTEGER", "1"),
-            ("emotion_temperature_scale", "REAL", "0.2"),
-            ("top_p", "REAL", "NULL"),
-        ):
-            try:
-                self._db.execute(f"SELECT {col} FROM chat_settings LIMIT 0")  # nosec B608 — col from hardcoded tuple, not user input
-            except sqlite3.OperationalError:
-                self._db.execute(f"ALTER TABLE chat_settings ADD COLUMN {col} {col_type} DEFAULT {default}")
+        _ensure_columns(self._db)
 
         now = format_iso(get_now())
         self._db.execute(
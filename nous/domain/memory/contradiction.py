@@ -13,7 +13,7 @@ class VectorSearchProtocol(Protocol):
     """Protocol for vector similarity search."""
 
     def search(
-        self, persona: str, query: str, limit: int = 10
+        self, persona: str, query: str, limit: int = 10, score_threshold: float | None = None
     ) -> Result[list[tuple[str, float]], VectorStoreError]: ...
 
 
@@ -70,7 +70,8 @@ class ContradictionDetector:
     ) -> Result[ContradictionReport, DomainError]:
         """Find existing memories that potentially contradict the given content.
 
-        Returns memories with cosine similarity >= threshold.
+        Returns memories with cosine similarity >= threshold; the cutoff is
+        applied by the vector store so only qualifying hits are returned.
         These are "similar but different" candidates that may be contradictions.
         """
         if self._vector_store is None:
@@ -82,7 +83,7 @@ class ContradictionDetector:
                 )
             )
 
-        search_result = self._vector_store.search(persona, content, limit=10)
+        search_result = self._vector_store.search(persona, content, limit=10, score_threshold=self._threshold)
         if not search_result.is_ok:
             return Success(
                 ContradictionReport(
@@ -96,15 +97,14 @@ class ContradictionDetector:
         for key, score in search_result.value:
             if exclude_key and key == exclude_key:
                 continue
-            if score >= self._threshold:
-                candidates.append(
-                    ContradictionCandidate(
-                        memory_key=key,
-                        content="",  # Content populated by caller if needed
-                        similarity=score,
-                        created_at="",
-                    )
+            candidates.append(
+                ContradictionCandidate(
+                    memory_key=key,
+                    content="",  # Content populated by caller if needed
+                    similarity=score,
+                    created_at="",
                 )
+            )
 
         return Success(
             ContradictionReport(
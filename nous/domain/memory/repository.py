@@ -18,6 +18,10 @@ class MemoryRepository(Protocol):
 
     def find_by_key(self, key: str) -> Result[Memory | None, RepositoryError]: ...
 
+    def find_by_keys(
+        self, keys: list[str], date_from: datetime | None = None, date_to: datetime | None = None
+    ) -> Result[dict[str, Memory], RepositoryError]: ...
+
     def find_recent(self, limit: int = 10, offset: int = 0) -> Result[list[Memory], RepositoryError]: ...
 
     def find_by_tags(self, tags: list[str], limit: int = 10) -> Result[list[Memory], RepositoryError]: ...
@@ -28,17 +32,30 @@ class MemoryRepository(Protocol):
 
     def count(self) -> Result[int, RepositoryError]: ...
 
+    def data_version(self) -> Result[tuple, RepositoryError]: ...
+
     def search_keyword(
-        self, query: str, limit: int = 10, date_from: datetime | None = None, date_to: datetime | None = None
+        self,
+        query: str,
+        limit: int = 10,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        tags: list[str] | None = None,
     ) -> Result[list[tuple[Memory, float]], RepositoryError]: ...
 
     def find_all(self) -> Result[list[Memory], RepositoryError]: ...
 
+    def find_by_lifecycle_status(self, status: str) -> Result[list[Memory], RepositoryError]: ...
+
     # Memory strength
     def get_strength(self, key: str) -> Result[MemoryStrength | None, RepositoryError]: ...
 
+    def get_strength_values(self, keys: list[str]) -> Result[dict[str, float], RepositoryError]: ...
+
     def save_strength(self, strength: MemoryStrength) -> Result[None, RepositoryError]: ...
 
+    def save_strengths(self, strengths: list[MemoryStrength]) -> Result[int, RepositoryError]: ...
+
     def get_all_strengths(
         self,
     ) -> Result[list[MemoryStrength], RepositoryError]: ...
@@ -89,12 +106,18 @@ class MemoryRepository(Protocol):
     ) -> Result[int, RepositoryError]: ...
 
     # Context Intelligence C
+    def get_distributions(self) -> Result[dict, RepositoryError]: ...
+
     def get_memory_index(self) -> Result[dict, RepositoryError]: ...
 
     def find_relationship_highlights(self, limit: int = 5) -> Result[list, RepositoryError]: ...
 
     def find_top_by_importance(self, limit: int = 15) -> Result[list[Memory], RepositoryError]: ...
 
+    def find_by_period(
+        self, date_from: datetime, date_to: datetime | None = None, limit: int = 20, min_importance: float = 0.0
+    ) -> Result[list[Memory], RepositoryError]: ...
+
     # Goals / Promises / Pagination / Tags (used by HTTP routes via ctx.memory_repo)
     def get_goals(self) -> Result[list[dict], RepositoryError]: ...
 
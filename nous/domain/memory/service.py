@@ -78,7 +78,7 @@ class MemoryService:
 
         emotion = normalize_emotion(emotion)
         now = get_now()
-        key = generate_memory_key()
+        key = generate_memory_key(now=now)
         memory = Memory(
             key=key,
             content=content.strip(),
@@ -261,24 +261,15 @@ class MemoryService:
         if not count_result.is_ok:
             return Failure(count_result.error)
 
-        all_result = self._repo.find_all()
-        if not all_result.is_ok:
-            return Failure(all_result.error)
-
-        memories = all_result.value
-        tag_dist: dict[str, int] = {}
-        emotion_dist: dict[str, int] = {}
-        for m in memories:
-            for tag in m.tags:
-                tag_dist[tag] = tag_dist.get(tag, 0) + 1
-            emotion_dist[m.emotion] = emotion_dist.get(m.emotion, 0) + 1
+        dist_result = self._repo.get_distributions()
+        if not dist_result.is_ok:
+            return Failure(dist_result.error)
 
+        # Histograms arrive aggregated and sorted by count descending; truncate to top_n
         total_count = count_result.value
-        tagged_count = sum(1 for m in memories if m.tags)
-
-        # Sort by count descending and truncate to top_n
-        sorted_tags = sorted(tag_dist.items(), key=lambda x: -x[1])
-        sorted_emotions = sorted(emotion_dist.items(), key=lambda x: -x[1])
+        sorted_tags = dist_result.value["tags"]
+        sorted_emotions = dist_result.value["emotions"]
+        tagged_count = dist_result.value["tagged_count"]
         hidden_tags = max(0, len(sorted_tags) - top_n)
         hidden_emotions = max(0, len(sorted_emotions) - top_n)
 
@@ -382,6 +373,12 @@ class MemoryService:
         """Get memories ranked by importance descending."""
         return self._repo.find_top_by_importance(limit)
 
+    def get_by_period(
+        self, date_from: datetime, date_to: datetime | None = None, limit: int = 20, min_importance: float = 0.0
+    ) -> Result[list[Memory], DomainError]:
+        """Get memories created within a period, most important first."""
+        return self._repo.find_by_period(date_from, date_to, limit=limit, min_importance=min_importance)
+
     def get_relationship_highlights(self, limit: int = 5) -> Result[list, DomainError]:
         """Get important relationship memories."""
         return self._repo.find_relationship_highlights(limit)
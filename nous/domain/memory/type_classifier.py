@@ -202,9 +202,11 @@ _TYPE_MARKERS: dict[str, list[str]] = {
     "emotional": _EMOTIONAL_EN + _EMOTIONAL_JP,
 }
 
-# Pre-compiled marker patterns for performance
+# Pre-compiled marker patterns for performance. Markers are all lowercase and
+# are matched against lowercased text, so IGNORECASE (which disables the regex
+# engine's literal fast paths) is unnecessary.
 _COMPILED_MARKERS: dict[str, list[re.Pattern[str]]] = {
-    t: [re.compile(p, re.IGNORECASE) for p in markers] for t, markers in _TYPE_MARKERS.items()
+    t: [re.compile(p) for p in markers] for t, markers in _TYPE_MARKERS.items()
 }
 
 # Type tags — used to skip auto-classification when already present
@@ -264,32 +266,25 @@ _NEGATIVE_WORDS: frozenset[str] = frozenset(
         "問題",
     }
 )
-_RESOLUTION_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(p, re.IGNORECASE)
-    for p in [
-        r"\bfixed\b",
-        r"\bsolved\b",
-        r"\bresolved\b",
-        r"\bgot it working\b",
-        r"\bit works\b",
-        r"\bnailed it\b",
-        r"\bfigured (it )?out\b",
-        r"解決した",
-        r"動いた",
-        r"直した",
-        r"できた",
-    ]
-]
+# Resolution phrases as one alternation: a single scan instead of eleven, with the
+# shared word boundaries factored out of the English phrases
+_RESOLUTION_RE: re.Pattern[str] = re.compile(
+    r"\b(?:fixed|solved|resolved|got it working|it works|nailed it|figured (?:it )?out)\b"
+    r"|解決した|動いた|直した|できた",
+    re.IGNORECASE,
+)
 
-# Code line patterns — skip these lines when scoring
-_CODE_LINE_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"^\s*[`]{3}"),
-    re.compile(r"^\s*(import|from|def|class|function|const|let|var|return)\s"),
-    re.compile(r"^\s*[$#]\s"),
-    re.compile(r"^\s*(cd|source|echo|export|pip|npm|git|python|bash)\s"),
-    re.compile(r"^\s*(if|for|while|try|except|elif|else:)\b"),
-    re.compile(r"^\s*\w+\.\w+\("),
-]
+# Code line patterns — skip these lines when scoring (one anchored alternation)
+_CODE_LINE_RE: re.Pattern[str] = re.compile(
+    r"\s*(?:"
+    r"[`]{3}"
+    r"|(?:import|from|def|class|function|const|let|var|return)\s"
+    r"|[$#]\s"
+    r"|(?:cd|source|echo|export|pip|npm|git|python|bash)\s"
+    r"|(?:if|for|while|try|except|elif|else:)\b"
+    r"|\w+\.\w+\("
+    r")"
+)
 
 
 def _get_sentiment(text: str) -> str:
@@ -304,16 +299,15 @@ def _get_sentiment(text: str) -> str:
 
 
 def _has_resolution(text: str) -> bool:
-    return any(p.search(text) for p in _RESOLUTION_PATTERNS)
+    return _RESOLUTION_RE.search(text) is not None
 
 
 def _is_code_line(line: str) -> bool:
     stripped = line.strip()
     if not stripped:
         return False
-    for pat in _CODE_LINE_PATTERNS:
-        if pat.match(stripped):
-            return True
+    if _CODE_LINE_RE.match(stripped):
+        return True
     alpha_ratio = sum(1 for c in stripped if c.isalpha()) / max(len(stripped), 1)
     return alpha_ratio < 0.35 and len(stripped) > 10
 
@@ -334,8 +328,7 @@ def _extract_prose(text: str) -> str:
     return result if result else text
 
 
-def _score(text: str, patterns: list[re.Pattern[str]]) -> float:
-    text_lower = text.lower()
+def _score(text_lower: str, patterns: list[re.Pattern[str]]) -> float:
     return sum(len(p.findall(text_lower)) for p in patterns)
 
 
@@ -358,9 +351,10 @@ def classify(content: str, min_confidence: float = _MIN_CONFIDENCE) -> str | Non
     if len(prose.strip()) < 10:
         return None
 
+    prose_lower = prose.lower()
     scores: dict[str, float] = {}
     for type_name, patterns in _COMPILED_MARKERS.items():
-        s = _score(prose, patterns)
+        s = _score(prose_lower, patterns)
         if s > 0:
             scores[type_name] = s
 
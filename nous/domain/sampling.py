@@ -48,7 +48,8 @@ class EmotionDrivenSampler:
         Returns:
             クランプされた実効温度 [TEMPERATURE_MIN, TEMPERATURE_MAX]。
         """
-        modifier = _EMOTION_MODIFIERS.get(emotion.lower(), 0.0)
+        # Labels normally arrive lowercase already; skip the copy in that case
+        modifier = _EMOTION_MODIFIERS.get(emotion if emotion.islower() else emotion.lower(), 0.0)
         effective_modifier = modifier * intensity * scale
         effective_temp = base_temp + effective_modifier
         return max(TEMPERATURE_MIN, min(TEMPERATURE_MAX, effective_temp))
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import astuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from nous.domain.search.engine import SearchQuery, SearchResult
+
+
+class SearchResultCache:
+    """Small in-process LRU cache for search results.
+
+    Entries are tagged with a data version supplied by the caller (e.g. the
+    repository's latest write marker); an entry whose version no longer
+    matches is treated as a miss. ``ttl_seconds`` bounds staleness from
+    time-dependent ranking (recency decay, forgetting curve). Searches run on
+    worker threads, so every access to the entries is serialised by a lock.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 60.0) -> None:
+        self._max = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[Hashable, float, list[SearchResult]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(persona: str, query: SearchQuery) -> Hashable:
+        """Build a hashable cache key from the persona and every query parameter."""
+        return (persona, *(tuple(v) if isinstance(v, list) else v for v in astuple(query)))
+
+    def get(self, key: Hashable, version: Hashable) -> list[SearchResult] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            cached_version, stored_at, results = entry
+            if cached_version != version or time.monotonic() - stored_at > self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(results)
+
+    def put(self, key: Hashable, version: Hashable, results: list[SearchResult]) -> None:
+        with self._lock:
+            self._entries[key] = (version, time.monotonic(), list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
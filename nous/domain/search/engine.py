@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import heapq
 import re
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING
 
+from nous.domain.search.clue_generator import ClueGenerator
+from nous.domain.search.context_snapshot import MemoryContextSnapshot
 from nous.domain.shared.result import Failure, Result, Success
 from nous.domain.shared.time_utils import parse_date_range
 from nous.domain.value_objects import normalize_emotion
 
 if TYPE_CHECKING:
     from nous.domain.memory.entities import Memory
+    from nous.domain.search.cache import SearchResultCache
     from nous.domain.search.ranker import ResultRanker
     from nous.domain.search.strategies import (
         KeywordSearchStrategy,
@@ -22,6 +29,17 @@ from nous.infrastructure.logging.structured import get_logger
 
 logger = get_logger(__name__)
 
+# Runs the semantic branch of hybrid search (embedding + Qdrant round trip)
+# while the SQLite keyword/FTS queries execute on the calling thread.
+_SEMANTIC_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="semantic-search")
+
+# Smart-search sub-query separators: whitespace, Japanese commas/periods and brackets.
+# \s = regex whitespace; \uXXXX = actual Unicode chars resolved by Python
+_QUERY_SEPARATOR_RE = re.compile(
+    "[\\s\u3000\u3001\u3002\uff0c\uff0e\u300c\u300d\u3010\u3011()\uff08\uff09\uff3b\uff3d]+"
+)
+_MAX_EXPANDED_QUERIES = 4
+
 
 @dataclass
 class SearchQuery:
@@ -48,7 +66,7 @@ class SearchResult:
 
     memory: Memory
     score: float
-    source: str  # "semantic" | "keyword" | "fts" | "hybrid"
+    source: str  # "semantic" | "keyword" | "fts" | "hybrid" | "recent" | "tags"
     similarity_flag: bool = False  # True when cosine_similarity >= threshold
 
 
@@ -64,6 +82,7 @@ class SearchEngine:
         memorag_config=None,
         chat_config=None,
         reranker=None,
+        result_cache: SearchResultCache | None = None,
     ) -> None:
         self._keyword = keyword_search
         self._semantic = semantic_search
@@ -72,6 +91,7 @@ class SearchEngine:
         self._memorag_config = memorag_config
         self._chat_config = chat_config
         self._reranker = reranker
+        self._result_cache = result_cache
 
     def search(self, query: SearchQuery) -> Result[list[SearchResult], SearchError]:
         """Execute search using the specified mode.
@@ -83,36 +103,147 @@ class SearchEngine:
             - ``semantic``: Qdrant vector search only (semantic similarity).
             - ``smart``: Query expansion + multi-pass hybrid search merged with RRF.
             - Any other value: falls back to hybrid.
+
+        An empty query with no filters short-circuits to the most recently
+        updated memories, and an empty query filtered by ``tags`` (which must
+        all be present) is answered by the repository's tag lookup. When a
+        result cache is configured, identical queries
+        are served from it until the repository's data version changes or the
+        entry expires.
         """
+        if self._is_unfiltered_browse(query):
+            return self._recent_search(query)
+
+        cache_key, version = self._cache_lookup_key(query)
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key, version)
+            if cached is not None:
+                return Success(cached)
+
         # Parse date_range once for all strategies
         date_from, date_to = parse_date_range(query.date_range)
 
         mode = query.mode or "hybrid"
-        if mode == "keyword":
+        if self._is_tag_browse(query):
+            result = self._tag_search(query)
+        elif mode == "keyword":
             result = self._keyword_search(query, date_from, date_to)
         elif mode == "semantic":
             result = self._semantic_search(query, date_from, date_to)
         elif mode == "smart":
-            result = self._smart_search(query)
+            result = self._smart_search(query, date_from, date_to)
         elif mode == "memorag":
-            result = self._memorag_search(query)
+            result = self._memorag_search(query, date_from, date_to)
         else:
             result = self._hybrid_search(query, date_from, date_to)
 
         if not result.is_ok:
             return result
-        return Success(self._filter_by_emotion(result.value, query.emotion))
+        results = self._filter_by_importance(result.value, query.min_importance)
+        results = self._filter_by_emotion(results, query.emotion)
+        results = self._filter_by_tags(results, query.tags)[: query.top_k]
+        if cache_key is not None:
+            self._result_cache.put(cache_key, version, results)
+        return Success(results)
+
+    def _cache_lookup_key(self, query: SearchQuery) -> tuple[object, object]:
+        """Return (cache_key, data_version), or (None, None) when caching is unavailable."""
+        if self._result_cache is None or self._memory_repo is None or not hasattr(self._memory_repo, "data_version"):
+            return None, None
+        version_result = self._memory_repo.data_version()
+        if not version_result.is_ok:
+            return None, None
+        persona = self._semantic.persona if self._semantic is not None else ""
+        return self._result_cache.make_key(persona, query), version_result.value
+
+    def _is_unfiltered_browse(self, query: SearchQuery) -> bool:
+        """True for an empty query with no filters, i.e. a plain "latest N" request."""
+        return (
+            self._memory_repo is not None
+            and not query.text.strip()
+            and not query.tags
+            and not query.date_range
+            and query.min_importance is None
+            and query.emotion is None
+        )
+
+    def _recent_search(self, query: SearchQuery) -> Result[list[SearchResult], SearchError]:
+        """Serve an unfiltered browse straight from the repository's recency index."""
+        result = self._memory_repo.find_recent(limit=query.top_k)
+        if not result.is_ok:
+            return Failure(result.error)
+        return Success([SearchResult(memory=m, score=1.0, source="recent") for m in result.value])
+
+    def _is_tag_browse(self, query: SearchQuery) -> bool:
+        """True for an empty query narrowed only by tags (plus post-filters)."""
+        return (
+            self._memory_repo is not None
+            and hasattr(self._memory_repo, "get_by_tags")
+            and not query.text.strip()
+            and bool(query.tags)
+            and not query.date_range
+        )
+
+    def _tag_search(self, query: SearchQuery) -> Result[list[SearchResult], SearchError]:
+        """Serve a tag browse from the repository, which matches tags in SQL."""
+        result = self._memory_repo.get_by_tags(query.tags)
+        if not result.is_ok:
+            return Failure(result.error)
+        return Success([SearchResult(memory=m, score=1.0, source="tags") for m in result.value])
+
+    @staticmethod
+    def _filter_by_importance(
+        results: list[SearchResult],
+        min_importance: float | None,
+    ) -> list[SearchResult]:
+        """Post-filter results below min_importance (semantic hits are pre-filtered in Qdrant)."""
+        if min_importance is None:
+            return results
+        return [r for r in results if r.memory.importance >= min_importance]
 
     @staticmethod
     def _filter_by_emotion(
         results: list[SearchResult],
         emotion: str | None,
     ) -> list[SearchResult]:
-        """Post-filter results by emotion using normalized comparison."""
+        """Post-filter results by emotion using normalized comparison.
+
+        Results carry only a handful of distinct emotion labels, so each label
+        is normalized once and rows are kept by set membership.
+        """
         if emotion is None:
             return results
         target = normalize_emotion(emotion)
-        return [r for r in results if normalize_emotion(r.memory.emotion) == target]
+        matching = {e for e in {r.memory.emotion for r in results} if normalize_emotion(e) == target}
+        return [r for r in results if r.memory.emotion in matching]
+
+    @staticmethod
+    def _filter_by_tags(
+        results: list[SearchResult],
+        tags: list[str] | None,
+    ) -> list[SearchResult]:
+        """Post-filter results missing any of the requested tags (the built-in lookups filter in SQL/Qdrant)."""
+        if not tags:
+            return results
+        required = set(tags)
+        return [r for r in results if required.issubset(r.memory.tags or ())]
+
+    @staticmethod
+    def _semantic_filters(query: SearchQuery) -> dict:
+        """Filters the semantic strategy can push down to the vector store."""
+        filters: dict = {}
+        if query.min_importance is not None:
+            filters["min_importance"] = query.min_importance
+        if query.emotion is not None:
+            filters["emotion"] = query.emotion
+        if query.tags:
+            filters["tags"] = query.tags
+        return filters
+
+    @staticmethod
+    def _keyword_filters(query: SearchQuery) -> dict:
+        """Filters the keyword and FTS lookups apply in SQL, ahead of their LIMIT."""
+        return {"tags": query.tags} if query.tags else {}
 
     @staticmethod
     def _to_search_results(
@@ -126,7 +257,9 @@ class SearchEngine:
         self, query: SearchQuery, date_from=None, date_to=None
     ) -> Result[list[SearchResult], SearchError]:
         """Execute keyword-only search."""
-        result = self._keyword.search(query.text, limit=query.top_k, date_from=date_from, date_to=date_to)
+        result = self._keyword.search(
+            query.text, limit=query.top_k, date_from=date_from, date_to=date_to, **self._keyword_filters(query)
+        )
         if not result.is_ok:
             return Failure(result.error)
         return Success(self._to_search_results(result.value, "keyword"))
@@ -137,33 +270,56 @@ class SearchEngine:
         """Execute semantic-only search, falling back to keyword on unavailability or error."""
         if self._semantic is None:
             return self._keyword_search(query, date_from, date_to)
-        result = self._semantic.search(query.text, limit=query.top_k, date_from=date_from, date_to=date_to)
+        result = self._semantic.search(
+            query.text, limit=query.top_k, date_from=date_from, date_to=date_to, **self._semantic_filters(query)
+        )
         if not result.is_ok:
             return self._keyword_search(query, date_from, date_to)
         return Success(self._to_search_results(result.value, "semantic"))
 
     def _hybrid_search(
-        self, query: SearchQuery, date_from=None, date_to=None
+        self, query: SearchQuery, date_from=None, date_to=None, sem_future: Future | None = None
     ) -> Result[list[SearchResult], SearchError]:
-        """Execute hybrid search combining FTS5, plain keyword, and semantic results with RRF fusion."""
-        all_results: list[SearchResult] = []
-
-        # 1. Plain LIKE keyword search (existing)
-        kw_result = self._keyword.search(query.text, limit=query.top_k, date_from=date_from, date_to=date_to)
-        if kw_result.is_ok:
-            all_results.extend(self._to_search_results(kw_result.value, "keyword"))
+        """Execute hybrid search combining FTS5, plain keyword, and semantic results with RRF fusion.
+
+        The semantic search is started first on a worker thread so its latency
+        overlaps the indexed FTS query instead of adding to it. When semantic
+        search alone returns ``top_k`` hits that all clear
+        ``query.similarity_threshold``, the plain keyword scan is skipped.
+        ``sem_future`` supplies an already running semantic lookup (see
+        :meth:`_multi_hybrid_search`).
+        """
+        if sem_future is None and self._semantic is not None:
+            sem_future = _SEMANTIC_EXECUTOR.submit(
+                self._semantic.search,
+                query.text,
+                limit=query.top_k,
+                date_from=date_from,
+                date_to=date_to,
+                **self._semantic_filters(query),
+            )
 
-        # 2. FTS5 full-text search (BM25 ranked)
+        # 1. FTS5 full-text search (BM25 ranked)
+        fts_results: list[SearchResult] = []
         if self._memory_repo is not None and hasattr(self._memory_repo, "search_fts"):
             fts_result = self._memory_repo.search_fts(
-                query.text, top_k=query.top_k * 2, date_from=date_from, date_to=date_to
+                query.text,
+                top_k=query.top_k * 2,
+                date_from=date_from,
+                date_to=date_to,
+                **self._keyword_filters(query),
             )
             if fts_result.is_ok:
-                all_results.extend(self._to_search_results(fts_result.value, "fts"))
+                fts_results = self._to_search_results(fts_result.value, "fts")
 
-        # 3. Semantic vector search (Qdrant)
-        if self._semantic is not None:
-            sem_result = self._semantic.search(query.text, limit=query.top_k, date_from=date_from, date_to=date_to)
+        # 2. Semantic vector search (Qdrant), started above
+        sem_results: list[SearchResult] = []
+        if sem_future is not None:
+            try:
+                sem_result = sem_future.result()
+            except Exception as e:
+                logger.warning("Semantic search failed, using keyword results only: %s", e)
+                sem_result = Failure(e)
             if sem_result.is_ok:
                 sem_results = self._to_search_results(sem_result.value, "semantic")
                 # Apply similarity_flag for high-confidence matches
@@ -171,23 +327,31 @@ class SearchEngine:
                     for sr in sem_results:
                         if sr.score >= query.similarity_threshold:
                             sr.similarity_flag = True
-                all_results.extend(sem_results)
 
+        # 3. Plain LIKE keyword search, unless semantic already filled top_k with strong hits
+        kw_results: list[SearchResult] = []
+        confident = (
+            query.similarity_threshold > 0
+            and len(sem_results) >= query.top_k
+            and all(sr.similarity_flag for sr in sem_results)
+        )
+        if not confident:
+            kw_result = self._keyword.search(
+                query.text, limit=query.top_k, date_from=date_from, date_to=date_to, **self._keyword_filters(query)
+            )
+            if kw_result.is_ok:
+                kw_results = self._to_search_results(kw_result.value, "keyword")
+
+        all_results = kw_results + fts_results + sem_results
         if not all_results:
             return Success([])
 
         # 4. RRF ranking with source weights
         if self._ranker is not None:
             all_results = self._ranker.rank(all_results, query)
-        else:
-            all_results.sort(key=lambda x: x.score, reverse=True)
 
-        # Deduplicate by memory key, keeping highest score
-        seen: dict[str, SearchResult] = {}
-        for r in all_results:
-            if r.memory.key not in seen or r.score > seen[r.memory.key].score:
-                seen[r.memory.key] = r
-        deduped = sorted(seen.values(), key=lambda x: x.score, reverse=True)
+        # Deduplicate by memory key (best first); the reranker needs the full list
+        deduped = _dedupe_top(all_results)
 
         # 5. Rerank step: cross-encoder refinement (if available)
         if self._reranker is not None and self._reranker.enabled:
@@ -206,7 +370,8 @@ class SearchEngine:
                         new_score = score_map.get(r.memory.key)
                         if new_score is not None:
                             r.score = new_score
-                    deduped.sort(key=lambda x: x.score, reverse=True)
+                    # Only top_k are returned; select them rather than re-sorting everything
+                    deduped = heapq.nlargest(query.top_k, deduped, key=lambda x: x.score)
                 except Exception:
                     logger.warning("Reranker step failed, using pre-rerank scores")
 
@@ -226,39 +391,17 @@ class SearchEngine:
             return "smart"
         return "hybrid"
 
-    def _smart_search(self, query: SearchQuery) -> Result[list[SearchResult], SearchError]:
+    def _smart_search(
+        self, query: SearchQuery, date_from=None, date_to=None
+    ) -> Result[list[SearchResult], SearchError]:
         """Smart search: hybrid search with simple query expansion.
 
         Runs the original query plus extracted sub-queries, then merges
         results using RRF to surface the most relevant memories.
         """
-        all_results: list[SearchResult] = []
-
-        # 1. Run the original hybrid search
-        original = self._hybrid_search(query)
-        if original.is_ok:
-            all_results.extend(original.value)
-
-        # 2. Generate expanded sub-queries and run additional searches
-        sub_queries = _expand_query(query.text)
-        for sub_q in sub_queries:
-            if sub_q == query.text:
-                continue
-            sub = SearchQuery(
-                text=sub_q,
-                top_k=query.top_k,
-                mode="hybrid",
-                tags=query.tags,
-                date_range=query.date_range,
-                min_importance=query.min_importance,
-                importance_weight=query.importance_weight,
-                recency_weight=query.recency_weight,
-                vector_weight=query.vector_weight,
-                keyword_weight=query.keyword_weight,
-            )
-            result = self._hybrid_search(sub)
-            if result.is_ok:
-                all_results.extend(result.value)
+        # 1-2. Original query plus expanded sub-queries
+        texts = list(_expand_query(query.text))
+        all_results = self._multi_hybrid_search(query, texts, date_from, date_to)
 
         if not all_results:
             return Success([])
@@ -266,29 +409,19 @@ class SearchEngine:
         # 3. Re-rank merged results with RRF
         if self._ranker is not None:
             all_results = self._ranker.rank(all_results, query)
-        else:
-            all_results.sort(key=lambda x: x.score, reverse=True)
-
-        # Deduplicate by memory key, keeping highest score
-        seen: dict[str, SearchResult] = {}
-        for r in all_results:
-            if r.memory.key not in seen or r.score > seen[r.memory.key].score:
-                seen[r.memory.key] = r
-        deduped = sorted(seen.values(), key=lambda x: x.score, reverse=True)
-        return Success(deduped[: query.top_k])
 
-    def _memorag_search(self, query: SearchQuery) -> Result[list[SearchResult], SearchError]:
+        return Success(_dedupe_top(all_results, query.top_k))
+
+    def _memorag_search(
+        self, query: SearchQuery, date_from=None, date_to=None
+    ) -> Result[list[SearchResult], SearchError]:
         """MemoRAG search: Global Context → Clue generation → multi-query hybrid search.
 
         Falls back to smart search if LLM unavailable or clue generation fails.
         """
-        import asyncio
-
-        from nous.domain.search.context_snapshot import MemoryContextSnapshot
-
         cfg = self._memorag_config
         if self._memory_repo is None or cfg is None or not cfg.enabled:
-            return self._smart_search(query)
+            return self._smart_search(query, date_from, date_to)
 
         # 1. Load or build ContextSnapshot
         snapshot = MemoryContextSnapshot.load(self._memory_repo)
@@ -298,20 +431,16 @@ class SearchEngine:
                 snapshot.save(self._memory_repo)
             except Exception as e:
                 logger.warning("MemoRAG: snapshot build failed: %s", e)
-                return self._smart_search(query)
+                return self._smart_search(query, date_from, date_to)
 
         # 2. Generate clues (if LLM available)
         clues: list[str] = []
         if cfg.clue_generation_enabled and self._chat_config and self._chat_config.is_configured():
             try:
-                from nous.domain.search.clue_generator import ClueGenerator
-
                 generator = ClueGenerator()
                 try:
                     asyncio.get_running_loop()
-                    import concurrent.futures
-
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
+                    with ThreadPoolExecutor() as executor:
                         clues = executor.submit(
                             asyncio.run, generator.generate(snapshot.to_text(), query.text, self._chat_config)
                         ).result(timeout=12.0)
@@ -321,33 +450,11 @@ class SearchEngine:
                 logger.debug("MemoRAG: clue generation failed: %s", e)
 
         if not clues:
-            return self._smart_search(query)
+            return self._smart_search(query, date_from, date_to)
 
         # 3. Run hybrid search for original query + each clue
-        all_results: list[SearchResult] = []
-
-        original = self._hybrid_search(query)
-        if original.is_ok:
-            all_results.extend(original.value)
-
-        for clue in clues:
-            if not clue or clue == query.text:
-                continue
-            sub = SearchQuery(
-                text=clue,
-                top_k=query.top_k,
-                mode="hybrid",
-                tags=query.tags,
-                date_range=query.date_range,
-                min_importance=query.min_importance,
-                importance_weight=query.importance_weight,
-                recency_weight=query.recency_weight,
-                vector_weight=query.vector_weight,
-                keyword_weight=query.keyword_weight,
-            )
-            result = self._hybrid_search(sub)
-            if result.is_ok:
-                all_results.extend(result.value)
+        texts = [query.text, *(clue for clue in clues if clue and clue != query.text)]
+        all_results = self._multi_hybrid_search(query, texts, date_from, date_to)
 
         if not all_results:
             return Success([])
@@ -355,29 +462,86 @@ class SearchEngine:
         # 4. Re-rank with RRF
         if self._ranker is not None:
             all_results = self._ranker.rank(all_results, query)
-        else:
-            all_results.sort(key=lambda x: x.score, reverse=True)
 
-        seen: dict[str, SearchResult] = {}
-        for r in all_results:
-            if r.memory.key not in seen or r.score > seen[r.memory.key].score:
-                seen[r.memory.key] = r
-        deduped = sorted(seen.values(), key=lambda x: x.score, reverse=True)
-        return Success(deduped[: query.top_k])
+        return Success(_dedupe_top(all_results, query.top_k))
+
+    def _multi_hybrid_search(
+        self, query: SearchQuery, texts: list[str], date_from=None, date_to=None
+    ) -> list[SearchResult]:
+        """Hybrid-search each text with ``query``'s filters and concatenate the results.
+
+        With more than one text the semantic lookups go out as a single
+        ``search_many`` call (one embedding batch, one Qdrant batch request)
+        whose results are handed to each hybrid search as it runs.
+        """
+        sem_futures: list[Future | None] = [None] * len(texts)
+        if self._semantic is not None and len(texts) > 1:
+            sem_futures = self._submit_semantic_batch(query, texts, date_from, date_to)
+
+        all_results: list[SearchResult] = []
+        for text, sem_future in zip(texts, sem_futures, strict=True):
+            sub = query if text == query.text else replace(query, text=text, mode="hybrid")
+            result = self._hybrid_search(sub, date_from, date_to, sem_future=sem_future)
+            if result.is_ok:
+                all_results.extend(result.value)
+        return all_results
+
+    def _submit_semantic_batch(self, query: SearchQuery, texts: list[str], date_from, date_to) -> list[Future]:
+        """Start one batched semantic search and return a per-text future for its results."""
+        futures: list[Future] = [Future() for _ in texts]
+
+        def fan_out(batch: Future) -> None:
+            try:
+                result = batch.result()
+                if result.is_ok and len(result.value) != len(texts):
+                    raise ValueError(f"search_many returned {len(result.value)} result lists for {len(texts)} queries")
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                return
+            for i, future in enumerate(futures):
+                future.set_result(Success(result.value[i]) if result.is_ok else result)
+
+        _SEMANTIC_EXECUTOR.submit(
+            self._semantic.search_many,
+            texts,
+            limit=query.top_k,
+            date_from=date_from,
+            date_to=date_to,
+            **self._semantic_filters(query),
+        ).add_done_callback(fan_out)
+        return futures
+
+
+def _dedupe_top(results: list[SearchResult], top_k: int | None = None) -> list[SearchResult]:
+    """Keep the highest-scoring result per memory key, best first.
+
+    With ``top_k`` only that many are selected (``heapq.nlargest``) instead of
+    sorting every merged result to slice a handful.
+    """
+    seen: dict[str, SearchResult] = {}
+    for r in results:
+        if r.memory.key not in seen or r.score > seen[r.memory.key].score:
+            seen[r.memory.key] = r
+    if top_k is None:
+        return sorted(seen.values(), key=lambda x: x.score, reverse=True)
+    return heapq.nlargest(top_k, seen.values(), key=lambda x: x.score)
 
 
-def _expand_query(text: str) -> list[str]:
+@functools.lru_cache(maxsize=1024)
+def _expand_query(text: str) -> tuple[str, ...]:
     """Extract sub-queries from text for smart search expansion.
 
     Splits on Japanese punctuation and whitespace, keeping segments longer
     than 2 characters as additional search queries alongside the original.
+    At most four queries are returned; later segments are skipped once full.
+    Chat queries repeat a lot, so results are memoized (hence the tuple).
     """
-    # Split on spaces, Japanese commas/periods, brackets, and common separators
-    # \\s = regex whitespace; \uXXXX = actual Unicode chars resolved by Python
-    segments = re.split("[\\s\u3000\u3001\u3002\uff0c\uff0e\u300c\u300d\u3010\u3011()\uff08\uff09\uff3b\uff3d]+", text)
     expanded = [text]  # always include original
-    for seg in segments:
-        seg = seg.strip()
+    # Separators include all whitespace, so segments need no further stripping
+    for seg in _QUERY_SEPARATOR_RE.split(text):
         if len(seg) >= 2 and seg != text:
             expanded.append(seg)
-    return expanded[:4]  # limit to 4 queries max
+            if len(expanded) == _MAX_EXPANDED_QUERIES:
+                break
+    return tuple(expanded)
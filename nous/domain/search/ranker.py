@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from datetime import UTC
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+from nous.domain.memory.type_classifier import classify
 from nous.domain.search.engine import SearchQuery, SearchResult
 
 
@@ -58,7 +59,8 @@ class RRFRanker:
                 if key not in result_map or r.score > result_map[key].score:
                     result_map[key] = r
 
-        # Apply importance and recency weight adjustments
+        # Apply importance and recency weight adjustments (one clock read per ranking)
+        now = datetime.now(UTC) if query.recency_weight > 0 else None
         merged: list[SearchResult] = []
         for key, rrf_score in scores.items():
             original = result_map[key]
@@ -67,10 +69,7 @@ class RRFRanker:
             if query.importance_weight > 0:
                 adjusted_score += query.importance_weight * original.memory.importance
 
-            if query.recency_weight > 0 and original.memory.created_at:
-                from datetime import datetime
-
-                now = datetime.now(UTC)
+            if now is not None and original.memory.created_at:
                 created = original.memory.created_at
                 if created.tzinfo is None:
                     created = created.replace(tzinfo=UTC)
@@ -96,7 +95,12 @@ class ForgettingCurveRanker:
     def __init__(
         self,
         strength_lookup: dict[str, float] | Callable[[str], float] | None = None,
+        *,
+        batch_lookup: Callable[[list[str]], dict[str, float]] | None = None,
     ) -> None:
+        # batch_lookup resolves every result key in one call (e.g. one SQL query)
+        # instead of one strength_lookup call per result
+        self._batch_fn = batch_lookup
         if strength_lookup is None:
             self._lookup_fn: Callable[[str], float] | None = None
         elif callable(strength_lookup):
@@ -108,12 +112,18 @@ class ForgettingCurveRanker:
 
     def rank(self, results: list[SearchResult], query: SearchQuery) -> list[SearchResult]:
         """Multiply scores by recall probability if a strength lookup is configured."""
-        if self._lookup_fn is None:
+        lookup: Callable[[str], float | None]
+        if self._batch_fn is not None and results:
+            # Keys without a strength come back as None and fall through to 1.0 below
+            lookup = self._batch_fn([r.memory.key for r in results]).get
+        elif self._lookup_fn is not None:
+            lookup = self._lookup_fn
+        else:
             return results
 
         adjusted: list[SearchResult] = []
         for r in results:
-            recall = self._lookup_fn(r.memory.key)
+            recall = lookup(r.memory.key)
             if not recall or recall <= 0:
                 recall = 1.0
             adjusted.append(
@@ -153,8 +163,6 @@ class TopicAffinityRanker:
         self._min_confidence = min_confidence
 
     def rank(self, results: list[SearchResult], query: SearchQuery) -> list[SearchResult]:
-        from nous.domain.memory.type_classifier import classify  # lazy import
-
         query_type = classify(query.text, min_confidence=self._min_confidence)
         if query_type is None:
             return results
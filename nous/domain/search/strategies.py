@@ -20,6 +20,7 @@ class KeywordSearchStrategy(Protocol):
         limit: int = 10,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
+        tags: list[str] | None = None,
     ) -> Result[list[tuple[Memory, float]], SearchError]: ...
 
 
@@ -35,4 +36,18 @@ class SemanticSearchStrategy(Protocol):
         limit: int = 10,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
+        min_importance: float | None = None,
+        emotion: str | None = None,
+        tags: list[str] | None = None,
     ) -> Result[list[tuple[Memory, float]], SearchError]: ...
+
+    def search_many(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        min_importance: float | None = None,
+        emotion: str | None = None,
+        tags: list[str] | None = None,
+    ) -> Result[list[list[tuple[Memory, float]]], SearchError]: ...
@@ -1,35 +1,69 @@
 from __future__ import annotations
 
+import functools
 import re
 import secrets
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 _DEFAULT_TZ = "Asia/Tokyo"
+# Resolved once; every naive-datetime normalisation below reuses it
+_DEFAULT_ZONE = ZoneInfo(_DEFAULT_TZ)
+
+
+@functools.lru_cache(maxsize=4)
+def _zone(tz: str) -> ZoneInfo:
+    return ZoneInfo(tz)
 
 
 def get_now(tz: str = _DEFAULT_TZ) -> datetime:
     """Return current time in the given timezone."""
-    return datetime.now(ZoneInfo(tz))
+    return datetime.now(_DEFAULT_ZONE if tz == _DEFAULT_TZ else _zone(tz))
 
 
 def format_iso(dt: datetime) -> str:
     """Format datetime as ISO 8601 string with timezone."""
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo(_DEFAULT_TZ))
+        dt = dt.replace(tzinfo=_DEFAULT_ZONE)
     return dt.isoformat()
 
 
+def to_epoch(dt: datetime) -> float:
+    """Convert to POSIX seconds; naive datetimes are treated as the default timezone like format_iso."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_DEFAULT_ZONE)
+    return dt.timestamp()
+
+
 def parse_iso(s: str) -> datetime:
     """Parse an ISO 8601 datetime string."""
     return datetime.fromisoformat(s)
 
 
-def generate_memory_key(prefix: str = "memory") -> str:
-    """Generate a timestamped memory key: {prefix}_YYYYMMDDHHMMSS_microseconds_random."""
-    now = get_now()
-    random_suffix = secrets.token_hex(4)
-    return f"{prefix}_{now.strftime('%Y%m%d%H%M%S')}_{now.microsecond:06d}_{random_suffix}"
+def parse_iso_or_none(s: str | None) -> datetime | None:
+    """Parse an ISO 8601 datetime string, returning None for empty or invalid values."""
+    if not s:
+        return None
+    try:
+        return parse_iso(s)
+    except (ValueError, TypeError):
+        return None
+
+
+def generate_memory_key(prefix: str = "memory", now: datetime | None = None) -> str:
+    """Generate a timestamped memory key: {prefix}_YYYYMMDDHHMMSS_microseconds_random.
+
+    Pass ``now`` to stamp the key with a time the caller already read (e.g. the
+    memory's created_at). The random suffix keeps keys unique within a microsecond.
+    """
+    if now is None:
+        now = get_now()
+    # Integer formatting is cheaper than strftime for a fixed layout
+    stamp = (
+        f"{now.year:04d}{now.month:02d}{now.day:02d}{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        f"_{now.microsecond:06d}"
+    )
+    return f"{prefix}_{stamp}_{secrets.token_hex(4)}"
 
 
 def relative_time_str(dt: datetime, now: datetime | None = None) -> str:
@@ -37,9 +71,9 @@ def relative_time_str(dt: datetime, now: datetime | None = None) -> str:
     if now is None:
         now = get_now()
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo(_DEFAULT_TZ))
+        dt = dt.replace(tzinfo=_DEFAULT_ZONE)
     if now.tzinfo is None:
-        now = now.replace(tzinfo=ZoneInfo(_DEFAULT_TZ))
+        now = now.replace(tzinfo=_DEFAULT_ZONE)
 
     diff = now - dt
     seconds = int(diff.total_seconds())
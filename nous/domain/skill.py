@@ -26,6 +26,9 @@ def _get_logger():
 # a-z, 0-9, - only, 1-64 chars, no leading/trailing hyphen
 _VALID_SKILL_NAME = re.compile(r"^[a-z0-9][a-z0-9-]{0,62}[a-z0-9]$")
 
+# One scan picks every known frontmatter field; other lines are ignored
+_FRONTMATTER_FIELD = re.compile(r"^[ \t]*(name|description|license|compatibility|metadata):(.*)$", re.MULTILINE)
+
 
 class Skill(BaseModel):
     id: int | None = None
@@ -274,43 +277,29 @@ def _parse_skill_md(dir_name: str, raw: str) -> dict[str, Any]:
 
     Returns dict with keys: name, description, content, license, compatibility, metadata.
     """
-    name = dir_name
-    description = ""
-    license_val: str | None = None
-    compatibility_val: str | None = None
+    fields: dict[str, str] = {}
     metadata_val: dict[str, str] | None = None
     body = raw
     if raw.startswith("---"):
         end = raw.find("---", 3)
         if end != -1:
-            fm = raw[3:end].strip()
+            fields = {m[1]: m[2].strip() for m in _FRONTMATTER_FIELD.finditer(raw[3:end])}
             body = raw[end + 3 :].strip()
-            for line in fm.splitlines():
-                stripped = line.strip()
-                if stripped.startswith("name:"):
-                    name = stripped[5:].strip()
-                elif stripped.startswith("description:"):
-                    description = stripped[12:].strip()
-                elif stripped.startswith("license:"):
-                    license_val = stripped[8:].strip()
-                elif stripped.startswith("compatibility:"):
-                    compatibility_val = stripped[14:].strip()
-                elif stripped.startswith("metadata:"):
-                    meta_raw = stripped[9:].strip()
-                    if meta_raw:
-                        try:
-                            parsed = json.loads(meta_raw)
-                            if isinstance(parsed, dict):
-                                metadata_val = {str(k): str(v) for k, v in parsed.items()}
-                        except json.JSONDecodeError:
-                            log = _get_logger()
-                            log.warning("Skill '%s': metadata is not valid JSON, ignoring", name)
+    name = fields.get("name", dir_name)
+    if meta_raw := fields.get("metadata"):
+        try:
+            parsed = json.loads(meta_raw)
+            if isinstance(parsed, dict):
+                metadata_val = {str(k): str(v) for k, v in parsed.items()}
+        except json.JSONDecodeError:
+            log = _get_logger()
+            log.warning("Skill '%s': metadata is not valid JSON, ignoring", name)
     name = _validate_name(name, dir_name)
     return {
         "name": name,
-        "description": description,
+        "description": fields.get("description", ""),
         "content": body,
-        "license": license_val,
-        "compatibility": compatibility_val,
+        "license": fields.get("license"),
+        "compatibility": fields.get("compatibility"),
         "metadata": metadata_val,
     }
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from nous.infrastructure.logging.structured import get_logger
@@ -14,6 +15,7 @@ logger = get_logger(__name__)
 
 _QUERY_PREFIX = "検索クエリ: "
 _DOCUMENT_PREFIX = "検索文書: "
+_QUERY_CACHE_SIZE = 256
 
 
 class EmbeddingModel:
@@ -24,6 +26,10 @@ class EmbeddingModel:
     Thread-safe: uses double-checked locking for lazy model loading.
     Provides both sync (encode/encode_batch/dimension) and async
     (async_encode/async_encode_batch/async_dimension) interfaces.
+
+    Single query encodings are kept in a small LRU so repeated searches
+    (retries, paging, sub-queries) skip the model; cached vectors are
+    read-only.
     """
 
     def __init__(
@@ -36,6 +42,8 @@ class EmbeddingModel:
         self._model: SentenceTransformer | None = None
         self._dimension: int | None = None
         self._lock = threading.Lock()
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Sync API
@@ -56,10 +64,23 @@ class EmbeddingModel:
             text: The text to encode.
             is_query: If True, prepend the query prefix; otherwise the document prefix.
         """
+        if is_query:
+            with self._cache_lock:
+                cached = self._query_cache.get(text)
+                if cached is not None:
+                    self._query_cache.move_to_end(text)
+                    return cached
         self._ensure_loaded()
         assert self._model is not None
         prefixed = f"{_QUERY_PREFIX}{text}" if is_query else f"{_DOCUMENT_PREFIX}{text}"
-        return self._model.encode(prefixed, normalize_embeddings=True)
+        vector = self._model.encode(prefixed, normalize_embeddings=True)
+        if is_query:
+            vector.setflags(write=False)
+            with self._cache_lock:
+                self._query_cache[text] = vector
+                if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return vector
 
     def encode_batch(
         self,
@@ -141,6 +162,8 @@ class EmbeddingModel:
 
             self._model = None
             self._dimension = None
+            with self._cache_lock:
+                self._query_cache.clear()
 
             try:
                 self._load_model()
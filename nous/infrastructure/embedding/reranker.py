@@ -3,6 +3,8 @@ from __future__ import annotations
 import threading
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from nous.infrastructure.logging.structured import get_logger
 
 if TYPE_CHECKING:
@@ -61,19 +63,22 @@ class RerankerModel:
             return results[:top_k]
 
         try:
-            scores = self._model.predict(pairs)
+            scores = np.asarray(self._model.predict(pairs), dtype=np.float64)
         except Exception as e:
             logger.warning("Reranker prediction failed, returning original order: %s", e)
             return results[:top_k]
 
         # Combine reranker scores with original scores (weighted blend)
-        combined: list[tuple[str, float]] = []
-        for (key, original_score), rerank_score in zip(valid_entries, scores, strict=True):
-            blended = float(rerank_score) * 0.7 + original_score * 0.3
-            combined.append((key, blended))
-
-        combined.sort(key=lambda x: x[1], reverse=True)
-        return combined[:top_k]
+        original = np.fromiter((score for _, score in valid_entries), dtype=np.float64, count=len(valid_entries))
+        blended = scores * 0.7 + original * 0.3
+
+        # Partition out the top_k before sorting so only the survivors are ordered
+        if 0 < top_k < len(blended):
+            top = np.argpartition(-blended, top_k - 1)[:top_k]
+            order = top[np.argsort(-blended[top], kind="stable")]
+        else:
+            order = np.argsort(-blended, kind="stable")[: max(top_k, 0)]
+        return [(valid_entries[i][0], float(blended[i])) for i in order]
 
     def _load_model(self) -> None:
         """Lazy load the cross-encoder model."""
@@ -125,7 +125,7 @@ class AnthropicProvider(LLMProvider):
             if anthropic_tools:
                 kwargs["tools"] = anthropic_tools
 
-            full_text = ""
+            text_chunks: list[str] = []
             tool_calls_collected: list[ToolCallEvent] = []
             current_tool: dict | None = None
 
@@ -136,22 +136,21 @@ class AnthropicProvider(LLMProvider):
                     if event_type == "content_block_start":
                         block = event.content_block
                         if block.type == "tool_use":
-                            current_tool = {"id": block.id, "name": block.name, "input_json": ""}
+                            current_tool = {"id": block.id, "name": block.name, "input_json": []}
 
                     elif event_type == "content_block_delta":
                         delta = event.delta
                         if delta.type == "text_delta":
-                            full_text += delta.text
+                            text_chunks.append(delta.text)
                             yield TextDeltaEvent(content=delta.text)
                         elif delta.type == "input_json_delta" and current_tool:
-                            current_tool["input_json"] += delta.partial_json
+                            current_tool["input_json"].append(delta.partial_json)
 
                     elif event_type == "content_block_stop":
                         if current_tool:
+                            input_json = "".join(current_tool["input_json"])
                             try:
-                                input_data = (
-                                    json.loads(current_tool["input_json"]) if current_tool["input_json"] else {}
-                                )
+                                input_data = json.loads(input_json) if input_json else {}
                             except json.JSONDecodeError:
                                 input_data = {}
                             tc = ToolCallEvent(
@@ -163,7 +162,7 @@ class AnthropicProvider(LLMProvider):
                             yield tc
                             current_tool = None
 
-            yield DoneEvent(full_content=full_text, tool_calls=tool_calls_collected)
+            yield DoneEvent(full_content="".join(text_chunks), tool_calls=tool_calls_collected)
 
         except Exception as e:
             yield ErrorEvent(message=str(e))
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import weakref
 from typing import TYPE_CHECKING
 
 from .anthropic import AnthropicProvider
@@ -12,8 +15,32 @@ if TYPE_CHECKING:
 _OPENAI_BASE_URL = "https://api.openai.com/v1"
 _OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+# Providers own an async HTTP client whose connection pool is bound to the event
+# loop it first ran on, so instances are reused per running loop. Reuse keeps
+# the TCP/TLS connection to the API alive across chat turns instead of paying
+# a new handshake for every call; entries disappear with their loop.
+_providers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str, str, str], LLMProvider]] = (
+    weakref.WeakKeyDictionary()
+)
+_providers_lock = threading.Lock()
+
 
 def get_provider(provider: str, api_key: str, model: str, base_url: str = "") -> LLMProvider:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop yet (e.g. the caller drives the provider with asyncio.run): nothing to share
+        return _create_provider(provider, api_key, model, base_url)
+    key = (provider, api_key, model, base_url)
+    with _providers_lock:
+        cached = _providers.setdefault(loop, {})
+        instance = cached.get(key)
+        if instance is None:
+            instance = cached[key] = _create_provider(provider, api_key, model, base_url)
+        return instance
+
+
+def _create_provider(provider: str, api_key: str, model: str, base_url: str) -> LLMProvider:
     if provider == "anthropic":
         return AnthropicProvider(api_key=api_key, model=model)
     elif provider == "openai":
@@ -126,7 +126,7 @@ class OpenAICompatProvider(LLMProvider):
             if openai_tools:
                 kwargs["tools"] = openai_tools
 
-            full_text = ""
+            text_chunks: list[str] = []
             tool_calls_collected: list[ToolCallEvent] = []
             # Accumulate tool call chunks by index
             pending_tool_calls: dict[int, dict] = {}
@@ -138,7 +138,7 @@ class OpenAICompatProvider(LLMProvider):
                         continue
 
                     if delta.content:
-                        full_text += delta.content
+                        text_chunks.append(delta.content)
                         yield TextDeltaEvent(content=delta.content)
 
                     if delta.tool_calls:
@@ -148,7 +148,7 @@ class OpenAICompatProvider(LLMProvider):
                                 pending_tool_calls[idx] = {
                                     "id": tc_chunk.id or "",
                                     "name": tc_chunk.function.name if tc_chunk.function else "",
-                                    "args_json": "",
+                                    "args_json": [],
                                 }
                             if tc_chunk.id:
                                 pending_tool_calls[idx]["id"] = tc_chunk.id
@@ -156,13 +156,14 @@ class OpenAICompatProvider(LLMProvider):
                                 if tc_chunk.function.name:
                                     pending_tool_calls[idx]["name"] = tc_chunk.function.name
                                 if tc_chunk.function.arguments:
-                                    pending_tool_calls[idx]["args_json"] += tc_chunk.function.arguments
+                                    pending_tool_calls[idx]["args_json"].append(tc_chunk.function.arguments)
 
             # Emit collected tool calls
             for idx in sorted(pending_tool_calls.keys()):
                 tc_data = pending_tool_calls[idx]
+                args_json = "".join(tc_data["args_json"])
                 try:
-                    input_data = json.loads(tc_data["args_json"]) if tc_data["args_json"] else {}
+                    input_data = json.loads(args_json) if args_json else {}
                 except json.JSONDecodeError:
                     input_data = {}
                 tc = ToolCallEvent(
@@ -173,7 +174,7 @@ class OpenAICompatProvider(LLMProvider):
                 tool_calls_collected.append(tc)
                 yield tc
 
-            yield DoneEvent(full_content=full_text, tool_calls=tool_calls_collected)
+            yield DoneEvent(full_content="".join(text_chunks), tool_calls=tool_calls_collected)
 
         except Exception as e:
             yield ErrorEvent(message=str(e))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,11 @@ MODEL_MAX_CONTEXT: dict[str, int] = {
     "deepseek": 128_000,
 }
 
+# Longest key first so "gpt-4o" wins over "gpt-4"; ordered once, not per lookup
+_MODEL_KEYS_LONGEST_FIRST: tuple[tuple[str, int], ...] = tuple(
+    sorted(MODEL_MAX_CONTEXT.items(), key=lambda kv: len(kv[0]), reverse=True)
+)
+
 
 class TokenCounter:
     """Count tokens in text and messages. Uses tiktoken if available, else heuristic."""
@@ -50,6 +56,7 @@ class TokenCounter:
             self._has_tiktoken = False
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def _resolve_encoding(model: str) -> str:
         """Map model name to tiktoken encoding name."""
         model_lower = model.lower()
@@ -116,9 +123,13 @@ class TokenCounter:
         return cjk_count + max(1, ascii_count // 4)
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def get_model_max_tokens(model: str) -> int:
         """Get the context window size for a model name.
 
+        Memoized: a deployment uses a handful of model names, so lowercasing and
+        the substring scan run once per name instead of on every chat turn.
+
         Args:
             model: Model name string (e.g., 'claude-opus-4-5', 'gpt-4o', 'openai/gpt-4o')
 
@@ -130,7 +141,7 @@ class TokenCounter:
         if "/" in model_lower:
             model_lower = model_lower.split("/", 1)[1]
 
-        for key, max_tokens in sorted(MODEL_MAX_CONTEXT.items(), key=lambda x: -len(x[0])):
+        for key, max_tokens in _MODEL_KEYS_LONGEST_FIRST:
             if key in model_lower:
                 return max_tokens
         return 128_000  # conservative default
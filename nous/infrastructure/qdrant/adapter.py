@@ -6,14 +6,41 @@ from typing import TYPE_CHECKING
 
 from nous.domain.shared.errors import VectorStoreError
 from nous.domain.shared.result import Failure, Result, Success
+from nous.domain.shared.time_utils import to_epoch
+from nous.domain.value_objects import normalize_emotion
 from nous.infrastructure.logging.structured import get_logger
 
 if TYPE_CHECKING:
+    from nous.domain.memory.entities import Memory
     from nous.infrastructure.embedding.model import EmbeddingModel
     from nous.infrastructure.qdrant.client import QdrantClientManager
 
 logger = get_logger(__name__)
 
+# Payload fields indexed for filtered search (field name -> Qdrant schema type)
+_PAYLOAD_INDEXES: dict[str, str] = {
+    "importance": "float",
+    "emotion": "keyword",
+    "tag_list": "keyword",
+    "created_at_ts": "float",
+}
+
+
+def memory_payload(memory: Memory) -> dict:
+    """Build the filterable payload metadata stored alongside a memory's vector.
+
+    Tags go under ``tag_list`` as a real list; ``tags`` is left alone because
+    older rebuilds stored it as a comma-joined string. ``created_at_ts`` is the
+    memory's own creation time in epoch seconds (``created_at`` records the
+    upsert time), matching the SQLite column of the same name.
+    """
+    return {
+        "importance": memory.importance,
+        "emotion": normalize_emotion(memory.emotion),
+        "tag_list": list(memory.tags),
+        "created_at_ts": to_epoch(memory.created_at),
+    }
+
 
 class QdrantVectorStore:
     """Vector store adapter for memory search using Qdrant."""
@@ -23,10 +50,12 @@ class QdrantVectorStore:
         client_manager: QdrantClientManager,
         embedding_model: EmbeddingModel,
         collection_prefix: str = "memory_",
+        quantization: bool = True,
     ) -> None:
         self.client_manager = client_manager
         self.embedding = embedding_model
         self.collection_prefix = collection_prefix
+        self.quantization = quantization
 
     def collection_name(self, persona: str) -> str:
         """Get the collection name for a persona."""
@@ -50,8 +79,12 @@ class QdrantVectorStore:
                         size=self.embedding.dimension,
                         distance=Distance.COSINE,
                     ),
+                    quantization_config=self._quantization_config(),
                 )
+                self._create_payload_indexes(name)
                 logger.info("Created Qdrant collection: %s", name)
+            else:
+                self._upgrade_collection(name)
             return Success(None)
         except Exception as e:
             err_str = str(e)
@@ -68,6 +101,121 @@ class QdrantVectorStore:
                 logger.error("Failed to ensure collection %s: %s", name, e)
             return Failure(VectorStoreError(str(e)))
 
+    def _quantization_config(self):
+        """Int8 scalar quantization for new collections, or None when disabled.
+
+        Scalar rather than binary: the default 256-dim embeddings are too small
+        for 1-bit codes to keep recall. Quantized vectors stay in RAM and the
+        originals are used for rescoring.
+        """
+        if not self.quantization:
+            return None
+        from qdrant_client.models import ScalarQuantization, ScalarQuantizationConfig, ScalarType
+
+        return ScalarQuantization(scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True))
+
+    def _upgrade_collection(self, name: str) -> None:
+        """Bring a collection created by an older version up to the current layout.
+
+        Enables int8 quantization when configured but missing (Qdrant builds the
+        quantized vectors in the background) and adds payload indexes that did
+        not exist yet. Failures are logged; search works without either.
+        """
+        try:
+            info = self.client_manager.client.get_collection(name)
+            quantization_config = self._quantization_config()
+            if quantization_config is not None and info.config.quantization_config is None:
+                self.client_manager.client.update_collection(
+                    collection_name=name, quantization_config=quantization_config
+                )
+                logger.info("Enabled int8 quantization on existing collection: %s", name)
+            indexed = info.payload_schema or {}
+            missing = [field_name for field_name in _PAYLOAD_INDEXES if field_name not in indexed]
+            if missing:
+                self._create_payload_indexes(name, missing)
+        except Exception as e:
+            logger.warning("Failed to upgrade collection %s: %s", name, e)
+
+    def _create_payload_indexes(self, name: str, fields: list[str] | None = None) -> None:
+        """Index filterable payload fields so filtered searches avoid full scans."""
+        from qdrant_client.models import PayloadSchemaType
+
+        for field_name in fields or _PAYLOAD_INDEXES:
+            schema = _PAYLOAD_INDEXES[field_name]
+            try:
+                self.client_manager.client.create_payload_index(
+                    collection_name=name,
+                    field_name=field_name,
+                    field_schema=PayloadSchemaType(schema),
+                )
+            except Exception as e:
+                logger.warning("Failed to create payload index %s on %s: %s", field_name, name, e)
+
+    @staticmethod
+    def build_filter(
+        min_importance: float | None = None,
+        emotion: str | None = None,
+        tags: list[str] | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ):
+        """Build a Qdrant payload filter, or None when no condition is given.
+
+        ``tags`` requires every listed tag; the date bounds are inclusive and
+        compared on ``created_at_ts``. Points upserted before payload metadata
+        existed lack these fields; they are let through (IsEmpty) and left to
+        the caller's post-filter. For ``tags`` the legacy check is keyed on
+        ``created_at_ts`` because an empty ``tag_list`` also counts as empty.
+        """
+        if min_importance is None and emotion is None and not tags and date_from is None and date_to is None:
+            return None
+        from qdrant_client.models import FieldCondition, Filter, IsEmptyCondition, MatchValue, PayloadField, Range
+
+        conditions = []
+        if min_importance is not None:
+            conditions.append(
+                Filter(
+                    should=[
+                        FieldCondition(key="importance", range=Range(gte=min_importance)),
+                        IsEmptyCondition(is_empty=PayloadField(key="importance")),
+                    ]
+                )
+            )
+        if emotion is not None:
+            conditions.append(
+                Filter(
+                    should=[
+                        FieldCondition(key="emotion", match=MatchValue(value=normalize_emotion(emotion))),
+                        IsEmptyCondition(is_empty=PayloadField(key="emotion")),
+                    ]
+                )
+            )
+        if tags:
+            conditions.append(
+                Filter(
+                    should=[
+                        Filter(must=[FieldCondition(key="tag_list", match=MatchValue(value=t)) for t in tags]),
+                        # An untagged memory stores ``tag_list: []``, which IsEmpty
+                        # also matches; only payload-less legacy points fall through.
+                        IsEmptyCondition(is_empty=PayloadField(key="created_at_ts")),
+                    ]
+                )
+            )
+        if date_from is not None or date_to is not None:
+            date_range = Range(
+                gte=to_epoch(date_from) if date_from is not None else None,
+                lte=to_epoch(date_to) if date_to is not None else None,
+            )
+            conditions.append(
+                Filter(
+                    should=[
+                        FieldCondition(key="created_at_ts", range=date_range),
+                        IsEmptyCondition(is_empty=PayloadField(key="created_at_ts")),
+                    ]
+                )
+            )
+        return Filter(must=conditions)
+
     def upsert(
         self,
         persona: str,
@@ -105,10 +253,16 @@ class QdrantVectorStore:
             logger.error("Failed to upsert vector for %s: %s", key, e)
             return Failure(VectorStoreError(str(e)))
 
-    def _build_decay_query(self, vector, limit, decay_scale=604800):
+    def _build_decay_query(self, vector, limit, decay_scale=604800, query_filter=None, score_threshold=None):
         """Build a Qdrant QueryRequest with exp_decay temporal scoring.
 
         decay_scale: 604800 = 1 week in seconds (recency half-life)
+        query_filter: optional payload Filter applied to the vector prefetch
+        score_threshold: optional cutoff on the final score, applied server-side
+
+        With quantization enabled the prefetch searches the int8 vectors with
+        2x oversampling and rescores with the originals; collections created
+        without quantization ignore these params.
         """
         from qdrant_client.models import (
             DatetimeKeyExpression,
@@ -116,7 +270,9 @@ class QdrantVectorStore:
             ExpDecayExpression,
             FormulaQuery,
             Prefetch,
+            QuantizationSearchParams,
             QueryRequest,
+            SearchParams,
             SumExpression,
         )
 
@@ -129,19 +285,39 @@ class QdrantVectorStore:
         formula = FormulaQuery(formula=SumExpression(sum=["$score", ExpDecayExpression(exp_decay=decay)]))
         prefetch = Prefetch(
             query=vector.tolist(),
+            filter=query_filter,
+            params=(
+                SearchParams(quantization=QuantizationSearchParams(rescore=True, oversampling=2.0))
+                if self.quantization
+                else None
+            ),
             limit=limit * 3,  # oversample to compensate decay re-ranking
         )
         return QueryRequest(
             prefetch=[prefetch],
             query=formula,
             limit=limit,
+            score_threshold=score_threshold,
         )
 
-    def search(self, persona: str, query: str, limit: int = 10) -> Result[list[tuple[str, float]], VectorStoreError]:
-        """Semantic search with temporal decay. Returns list of (memory_key, score)."""
+    def search(
+        self,
+        persona: str,
+        query: str,
+        limit: int = 10,
+        query_filter=None,
+        score_threshold: float | None = None,
+    ) -> Result[list[tuple[str, float]], VectorStoreError]:
+        """Semantic search with temporal decay. Returns list of (memory_key, score).
+
+        When ``score_threshold`` is given only hits scoring at least that much
+        are returned, so callers need not over-fetch and filter themselves.
+        """
         try:
             vector = self.embedding.encode(query, is_query=True)
-            query_request = self._build_decay_query(vector, limit)
+            query_request = self._build_decay_query(
+                vector, limit, query_filter=query_filter, score_threshold=score_threshold
+            )
             response = self.client_manager.client.query_points(
                 collection_name=self.collection_name(persona),
                 **query_request.model_dump(exclude_none=True),
@@ -152,6 +328,29 @@ class QdrantVectorStore:
             logger.error("Failed to search vectors for '%s': %s", query, e)
             return Failure(VectorStoreError(str(e)))
 
+    def search_batch(
+        self,
+        persona: str,
+        queries: list[str],
+        limit: int = 10,
+        query_filter=None,
+    ) -> Result[list[list[tuple[str, float]]], VectorStoreError]:
+        """Batched :meth:`search`: one ``encode_batch`` call and one ``query_batch_points`` request.
+
+        Returns one list of (memory_key, score) per query, in query order.
+        """
+        try:
+            vectors = self.embedding.encode_batch(queries, is_query=True)
+            requests = [self._build_decay_query(vector, limit, query_filter=query_filter) for vector in vectors]
+            responses = self.client_manager.client.query_batch_points(
+                collection_name=self.collection_name(persona),
+                requests=requests,
+            )
+            return Success([[(r.payload["key"], r.score) for r in response.points] for response in responses])
+        except Exception as e:
+            logger.error("Failed to batch-search %d queries: %s", len(queries), e)
+            return Failure(VectorStoreError(str(e)))
+
     # ------------------------------------------------------------------
     # Async API (embedding calls run in executor to avoid event-loop blocking)
     # ------------------------------------------------------------------
@@ -171,8 +370,12 @@ class QdrantVectorStore:
                         size=dim,
                         distance=Distance.COSINE,
                     ),
+                    quantization_config=self._quantization_config(),
                 )
+                self._create_payload_indexes(name)
                 logger.info("Created Qdrant collection: %s", name)
+            else:
+                self._upgrade_collection(name)
             return Success(None)
         except Exception as e:
             err_str = str(e)
@@ -231,11 +434,15 @@ class QdrantVectorStore:
         persona: str,
         query: str,
         limit: int = 10,
+        query_filter=None,
+        score_threshold: float | None = None,
     ) -> Result[list[tuple[str, float]], VectorStoreError]:
         """Async version of :meth:`search` with temporal decay."""
         try:
             vector = await self.embedding.async_encode(query, is_query=True)
-            query_request = self._build_decay_query(vector, limit)
+            query_request = self._build_decay_query(
+                vector, limit, query_filter=query_filter, score_threshold=score_threshold
+            )
             response = self.client_manager.client.query_points(
                 collection_name=self.collection_name(persona),
                 **query_request.model_dump(exclude_none=True),
@@ -251,6 +458,7 @@ class QdrantVectorStore:
         persona: str,
         memories: list[tuple[str, str]],
         batch_size: int = 64,
+        metadata: list[dict] | None = None,
     ) -> Result[int, VectorStoreError]:
         """Async version of :meth:`upsert_batch`."""
         if not memories:
@@ -260,17 +468,26 @@ class QdrantVectorStore:
 
             contents = [content for _, content in memories]
             vectors = await self.embedding.async_encode_batch(contents, is_query=False)
+            created_at = datetime.now(UTC).isoformat()
             total = 0
             for i in range(0, len(memories), batch_size):
                 batch = memories[i : i + batch_size]
                 batch_vectors = vectors[i : i + batch_size]
                 points = []
-                for (key, content), vec in zip(batch, batch_vectors, strict=True):
+                for j, ((key, content), vec) in enumerate(zip(batch, batch_vectors, strict=True)):
+                    payload = {
+                        "key": key,
+                        "content": content,
+                        "lifecycle_status": "active",
+                        "created_at": created_at,
+                    }
+                    if metadata:
+                        payload.update(metadata[i + j])
                     points.append(
                         PointStruct(
                             id=self._key_to_id(key),
                             vector=vec.tolist(),
-                            payload={"key": key, "content": content},
+                            payload=payload,
                         )
                     )
                 self.client_manager.client.upsert(
@@ -303,6 +520,21 @@ class QdrantVectorStore:
             logger.error("Failed to delete vector for %s: %s", key, e)
             return Failure(VectorStoreError(str(e)))
 
+    def set_payload(self, persona: str, key: str, payload: dict) -> Result[None, VectorStoreError]:
+        """Overwrite payload fields of an existing point without re-embedding."""
+        try:
+            from qdrant_client.models import PointIdsList
+
+            self.client_manager.client.set_payload(
+                collection_name=self.collection_name(persona),
+                payload=payload,
+                points=PointIdsList(points=[self._key_to_id(key)]),
+            )
+            return Success(None)
+        except Exception as e:
+            logger.error("Failed to set payload for %s: %s", key, e)
+            return Failure(VectorStoreError(str(e)))
+
     def count(self, persona: str) -> Result[int, VectorStoreError]:
         """Count points in the persona's collection."""
         try:
@@ -317,8 +549,13 @@ class QdrantVectorStore:
         persona: str,
         memories: list[tuple[str, str]],
         batch_size: int = 64,
+        metadata: list[dict] | None = None,
     ) -> Result[int, VectorStoreError]:
-        """Batch upsert multiple memories. Returns count of upserted points."""
+        """Batch upsert multiple memories. Returns count of upserted points.
+
+        ``metadata`` (optional) is aligned with ``memories`` and merged into each
+        point's payload, as :meth:`upsert` does for a single memory.
+        """
         if not memories:
             return Success(0)
         try:
@@ -326,17 +563,26 @@ class QdrantVectorStore:
 
             contents = [content for _, content in memories]
             vectors = self.embedding.encode_batch(contents, is_query=False)
+            created_at = datetime.now(UTC).isoformat()
             total = 0
             for i in range(0, len(memories), batch_size):
                 batch = memories[i : i + batch_size]
                 batch_vectors = vectors[i : i + batch_size]
                 points = []
-                for (key, content), vec in zip(batch, batch_vectors, strict=True):
+                for j, ((key, content), vec) in enumerate(zip(batch, batch_vectors, strict=True)):
+                    payload = {
+                        "key": key,
+                        "content": content,
+                        "lifecycle_status": "active",
+                        "created_at": created_at,
+                    }
+                    if metadata:
+                        payload.update(metadata[i + j])
                     points.append(
                         PointStruct(
                             id=self._key_to_id(key),
                             vector=vec.tolist(),
-                            payload={"key": key, "content": content},
+                            payload=payload,
                         )
                     )
                 self.client_manager.client.upsert(
@@ -33,7 +33,15 @@ CREATE TABLE IF NOT EXISTS memories (
     privacy_level TEXT DEFAULT 'internal',
     body_state TEXT,
     state_snapped_at TEXT,
-    lifecycle_status TEXT DEFAULT 'active'
+    lifecycle_status TEXT DEFAULT 'active',
+    -- created_at as POSIX seconds for numeric date filters (naive strings are JST)
+    created_at_ts REAL GENERATED ALWAYS AS (
+        (CASE
+            WHEN created_at LIKE '%Z' OR (length(created_at) > 19 AND substr(created_at, -6, 1) IN ('+', '-'))
+            THEN julianday(created_at)
+            ELSE julianday(created_at, '-9 hours')
+        END - 2440587.5) * 86400.0
+    ) VIRTUAL
 );
 
 CREATE TABLE IF NOT EXISTS memory_strength (
@@ -175,6 +183,7 @@ CREATE TABLE IF NOT EXISTS search_log (
 CREATE INDEX IF NOT EXISTS idx_search_log_time ON search_log(searched_at DESC);
 CREATE INDEX IF NOT EXISTS idx_memories_updated_at ON memories(updated_at DESC);
 CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_memories_importance ON memories(importance DESC);
 CREATE INDEX IF NOT EXISTS idx_memory_strength_strength ON memory_strength(strength);
 CREATE INDEX IF NOT EXISTS idx_emotion_history_persona ON emotion_history(timestamp DESC);
 
@@ -247,26 +256,52 @@ CREATE TABLE IF NOT EXISTS skills (
 );
 """
 
+# Applied once when a connection is opened; connections are long-lived and reused.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-32768",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    """Open a shared connection with the standard PRAGMAs and Row factory."""
+    conn = sqlite3.connect(str(db_path), check_same_thread=False)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
 _global_skills_conn: sqlite3.Connection | None = None
+_global_skills_lock = threading.Lock()
 
 
 def get_global_skills_db(data_dir: str) -> sqlite3.Connection:
-    """Return the singleton global skills.sqlite connection."""
+    """Return the singleton global skills.sqlite connection.
+
+    The first call opens it under a lock, so concurrent first requests (MCP
+    tools, chat prompt building, HTTP routes) share one connection instead of
+    each opening and migrating its own.
+    """
     global _global_skills_conn
-    if _global_skills_conn is None:
-        db_path = Path(data_dir) / "skills" / "skills.sqlite"
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(db_path), check_same_thread=False)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.row_factory = sqlite3.Row
-        conn.executescript(_SKILLS_SCHEMA)
-        # migrate existing DBs — add columns if missing
-        _migrate_skills_schema(conn)
-        conn.commit()
-        _global_skills_conn = conn
-        logger.info("Global skills DB opened: %s", db_path)
-    return _global_skills_conn
+    if _global_skills_conn is not None:
+        return _global_skills_conn
+    with _global_skills_lock:
+        if _global_skills_conn is None:
+            db_path = Path(data_dir) / "skills" / "skills.sqlite"
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = _open_connection(db_path)
+            conn.executescript(_SKILLS_SCHEMA)
+            # migrate existing DBs — add columns if missing
+            _migrate_skills_schema(conn)
+            conn.commit()
+            _global_skills_conn = conn
+            logger.info("Global skills DB opened: %s", db_path)
+        return _global_skills_conn
 
 
 def _migrate_skills_schema(conn: sqlite3.Connection) -> None:
@@ -300,10 +335,7 @@ class SQLiteConnection:
             if relative_path not in self._connections:
                 db_path = Path(self.data_dir) / relative_path
                 db_path.parent.mkdir(parents=True, exist_ok=True)
-                conn = sqlite3.connect(str(db_path), check_same_thread=False)
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA foreign_keys=ON")
-                conn.row_factory = sqlite3.Row
+                conn = _open_connection(db_path)
                 self._connections[relative_path] = conn
                 logger.info("SQLite connection opened: %s", db_path)
             return self._connections[relative_path]
@@ -317,6 +349,8 @@ class SQLiteConnection:
 
         # Initialize FTS5 full-text search index
         self._init_fts_schema(memory_conn)
+        self._init_trigram_schema(memory_conn)
+        self._init_tag_index_schema(memory_conn)
 
         inventory_conn = self.get_inventory_db()
         inventory_conn.executescript(_INVENTORY_SCHEMA)
@@ -330,6 +364,10 @@ class SQLiteConnection:
         ``content`` and a ``memories_key`` column for JOINs. Triggers use standard
         SQL ``DELETE FROM`` (the FTS5-specific ``'delete'`` command is not available
         in bundled libsqlite3 3.46).
+
+        The update trigger only fires when ``content`` or ``key`` change, so
+        metadata writes (importance decay, tags, lifecycle) do not reindex the
+        row. Databases created with the older catch-all trigger are upgraded here.
         """
         conn.execute(
             """
@@ -355,9 +393,10 @@ class SQLiteConnection:
             END
             """
         )
+        conn.execute("DROP TRIGGER IF EXISTS memories_au")
         conn.execute(
             """
-            CREATE TRIGGER IF NOT EXISTS memories_au AFTER UPDATE ON memories BEGIN
+            CREATE TRIGGER memories_au AFTER UPDATE OF content, key ON memories BEGIN
                 DELETE FROM memories_fts WHERE rowid = old.rowid;
                 INSERT INTO memories_fts(rowid, content, memories_key)
                 VALUES (new.rowid, new.content, new.key);
@@ -376,6 +415,115 @@ class SQLiteConnection:
         conn.commit()
         logger.info("FTS5 schema initialized for persona '%s'", self.persona)
 
+    def _init_trigram_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the trigram FTS5 index used by keyword (substring) search.
+
+        ``memories_fts`` uses unicode61, which cannot match substrings inside
+        unsegmented Japanese text. A trigram index answers substring queries of
+        three or more characters from the index instead of scanning every row.
+        Skipped with a warning when SQLite lacks the trigram tokenizer (< 3.34);
+        keyword search then keeps using LIKE. Rows are keyed by the memories
+        rowid and searched via a rowid JOIN, so entries orphaned by
+        ``INSERT OR REPLACE`` (which skips delete triggers) never surface.
+        """
+        try:
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS memories_trigram USING fts5(
+                    content,
+                    tokenize='trigram'
+                )
+                """
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning("Trigram FTS5 unavailable, keyword search will scan with LIKE: %s", e)
+            return
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS memories_trigram_ai AFTER INSERT ON memories BEGIN
+                DELETE FROM memories_trigram WHERE rowid = new.rowid;
+                INSERT INTO memories_trigram(rowid, content) VALUES (new.rowid, new.content);
+            END
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS memories_trigram_ad AFTER DELETE ON memories BEGIN
+                DELETE FROM memories_trigram WHERE rowid = old.rowid;
+            END
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS memories_trigram_au AFTER UPDATE OF content ON memories BEGIN
+                DELETE FROM memories_trigram WHERE rowid = old.rowid;
+                INSERT INTO memories_trigram(rowid, content) VALUES (new.rowid, new.content);
+            END
+            """
+        )
+        count = conn.execute("SELECT COUNT(*) as cnt FROM memories_trigram").fetchone()["cnt"]
+        if count == 0:
+            existing = conn.execute("SELECT COUNT(*) as cnt FROM memories").fetchone()["cnt"]
+            if existing > 0:
+                conn.execute("INSERT INTO memories_trigram(rowid, content) SELECT rowid, content FROM memories")
+                logger.info("Trigram index backfilled: %d documents", existing)
+        conn.commit()
+
+    def _init_tag_index_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the ``memory_tags`` inverted index (tag -> memory key).
+
+        Tag lookups (``get_by_tags`` / ``find_by_tags``) run on every chat turn;
+        the index turns them into a primary-key range read per tag instead of
+        a LIKE scan over every row's JSON. Rows are keyed by memory key, so the
+        insert trigger first clears the key's entries, which also covers
+        ``INSERT OR REPLACE`` (delete triggers do not fire for it). Non-array or
+        invalid ``tags`` values index nothing.
+        """
+        tags = "CASE WHEN json_valid({0}.tags) THEN CASE WHEN json_type({0}.tags) = 'array' THEN {0}.tags END END"
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS memory_tags (
+                tag TEXT NOT NULL,
+                memory_key TEXT NOT NULL,
+                PRIMARY KEY (tag, memory_key)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_memory_tags_key ON memory_tags(memory_key)")
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS memory_tags_ai AFTER INSERT ON memories BEGIN
+                DELETE FROM memory_tags WHERE memory_key = new.key;
+                INSERT OR IGNORE INTO memory_tags(tag, memory_key)
+                    SELECT value, new.key FROM json_each({tags.format("new")}) WHERE type = 'text';
+            END
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS memory_tags_ad AFTER DELETE ON memories BEGIN
+                DELETE FROM memory_tags WHERE memory_key = old.key;
+            END
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS memory_tags_au AFTER UPDATE OF tags, key ON memories BEGIN
+                DELETE FROM memory_tags WHERE memory_key = old.key;
+                INSERT OR IGNORE INTO memory_tags(tag, memory_key)
+                    SELECT value, new.key FROM json_each({tags.format("new")}) WHERE type = 'text';
+            END
+            """
+        )
+        if conn.execute("SELECT 1 FROM memory_tags LIMIT 1").fetchone() is None:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO memory_tags(tag, memory_key)"  # nosec B608
+                f" SELECT j.value, m.key FROM memories m, json_each({tags.format('m')}) j WHERE j.type = 'text'"
+            )
+            if cursor.rowcount > 0:
+                logger.info("Tag index backfilled: %d entries", cursor.rowcount)
+        conn.commit()
+
     def close(self) -> None:
         """Close all managed connections."""
         with self._lock:
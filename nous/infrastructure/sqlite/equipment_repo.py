@@ -10,7 +10,7 @@ from nous.domain.equipment.entities import (
 )
 from nous.domain.shared.errors import RepositoryError
 from nous.domain.shared.result import Failure, Result, Success
-from nous.domain.shared.time_utils import format_iso, get_now, parse_iso
+from nous.domain.shared.time_utils import format_iso, get_now, parse_iso_or_none
 from nous.infrastructure.logging.structured import get_logger
 
 if TYPE_CHECKING:
@@ -342,8 +342,8 @@ class SQLiteEquipmentRepository:
             visual_desc=row["visual_desc"] if "visual_desc" in row else None,  # noqa: SIM401 (sqlite3.Row has no .get)
             quantity=row["quantity"] or 1,
             tags=self._parse_json_list(row["tags"]),
-            created_at=_parse_or_none(row["created_at"]),
-            updated_at=_parse_or_none(row["updated_at"]),
+            created_at=parse_iso_or_none(row["created_at"]),
+            updated_at=parse_iso_or_none(row["updated_at"]),
         )
 
     @staticmethod
@@ -353,16 +353,6 @@ class SQLiteEquipmentRepository:
             action=row["action"],
             slot=row["slot"],
             item_name=row["item_name"],
-            timestamp=_parse_or_none(row["timestamp"]),
+            timestamp=parse_iso_or_none(row["timestamp"]),
             details=row["details"],
         )
-
-
-def _parse_or_none(value: str | None):
-    """Parse ISO datetime or return None."""
-    if not value:
-        return None
-    try:
-        return parse_iso(value)
-    except Exception:
-        return None
@@ -1,38 +1,185 @@
 from __future__ import annotations
 
+import functools
 import json
-from typing import TYPE_CHECKING, Any
+import re
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from nous.domain.memory.entities import Memory
 from nous.domain.shared.errors import RepositoryError
 from nous.domain.shared.result import Failure, Result, Success
-from nous.domain.shared.time_utils import format_iso, get_now
+from nous.domain.shared.time_utils import format_iso, get_now, parse_iso, to_epoch
 from nous.infrastructure.logging.structured import get_logger
 from nous.infrastructure.sqlite.block_repo import SQLiteBlockMixin
 from nous.infrastructure.sqlite.strength_repo import SQLiteStrengthMixin
 
+_orjson: ModuleType | None
+try:
+    import orjson as _orjson  # optional (fast-json extra): faster decode on cache misses
+except ImportError:
+    _orjson = None
+
 if TYPE_CHECKING:
     from datetime import datetime
+    from types import ModuleType
 
     from nous.infrastructure.sqlite.connection import SQLiteConnection
 
 logger = get_logger(__name__)
 
 
+# Search SQL is built once per filter shape; values are always bound positionally,
+# so the text stays stable across calls and sqlite3's statement cache can reuse it.
+def _date_range_sql(column: str, has_from: bool, has_to: bool) -> str:
+    return (f" AND {column} >= ?" if has_from else "") + (f" AND {column} <= ?" if has_to else "")
+
+
+def _tags_all_sql(column: str, tag_count: int) -> str:
+    """One EXISTS per required tag; a tags column that is not a JSON array matches nothing."""
+    tags = f"CASE WHEN json_valid({column}) THEN CASE WHEN json_type({column}) = 'array' THEN {column} END END"
+    return f" AND EXISTS (SELECT 1 FROM json_each({tags}) WHERE value = ?)" * tag_count
+
+
+@functools.lru_cache(maxsize=64)
+def _keyword_search_sql(like_count: int, has_from: bool, has_to: bool, tag_count: int = 0, byte_count: int = 0) -> str:
+    # instr() on the raw UTF-8 bytes skips LIKE's per-character pattern matcher
+    terms = ["instr(CAST(content AS BLOB), ?) > 0"] * byte_count + ["content LIKE ? ESCAPE '\\'"] * like_count
+    return (
+        f"SELECT * FROM memories WHERE {' AND '.join(terms)} AND lifecycle_status != 'tombstoned'"  # noqa: S608  # nosec B608
+        f"{_date_range_sql('created_at_ts', has_from, has_to)}{_tags_all_sql('tags', tag_count)}"
+        " ORDER BY updated_at DESC LIMIT ?"
+    )
+
+
+# SQLite's LIKE folds case for ASCII letters only; terms without them match
+# case-sensitively either way and can use a plain byte search instead.
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+
+
+class _ParsedQuery(NamedTuple):
+    like_patterns: tuple[str, ...]  # escaped ``%term%`` pattern per term containing ASCII letters
+    byte_terms: tuple[bytes, ...]  # UTF-8 encoding of every other term (CJK, digits, symbols)
+    shortest_term: int
+    match_expr: str  # FTS5 MATCH expression, every term quoted and ANDed
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_keyword_query(query: str) -> _ParsedQuery:
+    """Parse a plain-text query once per distinct text.
+
+    Hybrid and smart search send the same text to the keyword, trigram and FTS
+    lookups, so splitting, LIKE escaping and MATCH quoting are shared.
+    """
+    terms = query.split()
+    if not terms:
+        return _ParsedQuery((), (), 0, "")
+    # Embedded double-quotes are doubled (FTS5 convention)
+    match_expr = " AND ".join('"{}"'.format(t.replace('"', '""')) for t in terms)
+    return _ParsedQuery(
+        tuple(f"%{SQLiteMemoryRepository._escape_like(t)}%" for t in terms if _ASCII_LETTER_RE.search(t)),
+        tuple(t.encode() for t in terms if not _ASCII_LETTER_RE.search(t)),
+        min(len(t) for t in terms),
+        match_expr,
+    )
+
+
+# orjson does not keep integers beyond 64 bits exact (at most 20 digits)
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+
+
+def _json_loads(value: str) -> Any:
+    """Decode with orjson when installed, giving the same result as ``json.loads``.
+
+    Text orjson rejects (``NaN``, ``Infinity``) or would round (very long
+    integers) is decoded by the stdlib instead.
+    """
+    if _orjson is not None and not _LONG_DIGITS_RE.search(value):
+        try:
+            return _orjson.loads(value)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_json_list(value: str) -> tuple:
+    """Decode a JSON list column once per distinct value (tag sets repeat across rows)."""
+    try:
+        parsed = _json_loads(value)
+    except (ValueError, TypeError):
+        return ()
+    return tuple(parsed) if isinstance(parsed, list) else ()
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_json_dict(value: str) -> dict | None:
+    """Decode a JSON object column once per distinct value; callers copy the result."""
+    try:
+        parsed = _json_loads(value)
+    except (ValueError, TypeError):
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _optional_column(row, name: str):
+    """Value of ``name`` in ``row``, or None when the column is absent (older schemas)."""
+    try:
+        return row[name]
+    except (IndexError, KeyError):
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _find_by_keys_sql(key_count: int, has_from: bool, has_to: bool) -> str:
+    return (
+        f"SELECT * FROM memories WHERE key IN ({','.join('?' * key_count)})"  # noqa: S608  # nosec B608
+        f"{_date_range_sql('created_at_ts', has_from, has_to)}"
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _trigram_search_sql(has_from: bool, has_to: bool, tag_count: int = 0) -> str:
+    return (
+        "SELECT m.* FROM memories_trigram t JOIN memories m ON m.rowid = t.rowid"
+        " WHERE memories_trigram MATCH ? AND m.lifecycle_status != 'tombstoned'"
+        f"{_date_range_sql('m.created_at_ts', has_from, has_to)}{_tags_all_sql('m.tags', tag_count)}"
+        " ORDER BY m.updated_at DESC LIMIT ?"
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _fts_search_sql(has_from: bool, has_to: bool, tag_count: int = 0) -> str:
+    return (
+        "SELECT m.*, rank FROM memories_fts JOIN memories m ON m.key = memories_fts.memories_key"
+        " WHERE memories_fts MATCH ? AND m.lifecycle_status != 'tombstoned'"
+        f"{_date_range_sql('m.created_at_ts', has_from, has_to)}{_tags_all_sql('m.tags', tag_count)}"
+        " ORDER BY rank LIMIT ?"
+    )
+
+
 class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
     """SQLite-backed implementation of the MemoryRepository protocol."""
 
+    # Trigram tokens are three characters, so shorter terms can only be found with LIKE.
+    _TRIGRAM_MIN_TERM = 3
+
     def __init__(self, connection: SQLiteConnection) -> None:
         self._conn = connection
+        self._trigram_available: bool | None = None
+        self._search_log_ready = False
 
     @property
     def _db(self):
         return self._conn.get_memory_db()
 
     @staticmethod
-    def _active_where() -> str:
-        """Return WHERE clause fragment to exclude tombstoned memories."""
-        return "lifecycle_status != 'tombstoned'"
+    def _active_where(alias: str = "") -> str:
+        """Return WHERE clause fragment to exclude tombstoned memories.
+
+        ``alias`` qualifies the column when memories is joined under a table alias.
+        """
+        column = f"{alias}.lifecycle_status" if alias else "lifecycle_status"
+        return f"{column} != 'tombstoned'"
 
     # ------------------------------------------------------------------
     # Memory CRUD
@@ -89,7 +236,7 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
                 (memory.key,),
             )
             self._db.commit()
-            logger.info("Memory saved: %s", memory.key)
+            logger.debug("Memory saved: %s", memory.key)
             return Success(memory.key)
         except Exception as e:
             self._db.rollback()
@@ -107,6 +254,26 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             logger.error("Failed to find memory %s: %s", key, e)
             return Failure(RepositoryError(str(e)))
 
+    def find_by_keys(
+        self, keys: list[str], date_from: datetime | None = None, date_to: datetime | None = None
+    ) -> Result[dict[str, Memory], RepositoryError]:
+        """Find several memories in one query. Missing keys are absent from the result.
+
+        Optional date bounds are compared on the numeric ``created_at_ts`` column;
+        memories outside the range are absent as well.
+        """
+        if not keys:
+            return Success({})
+        try:
+            cursor = self._db.execute(
+                _find_by_keys_sql(len(keys), date_from is not None, date_to is not None),
+                [*keys, *self._date_params(date_from, date_to)],
+            )
+            return Success({r["key"]: self._row_to_memory(r) for r in cursor})
+        except Exception as e:
+            logger.error("Failed to find memories by keys: %s", e)
+            return Failure(RepositoryError(str(e)))
+
     def find_recent(self, limit: int = 10, offset: int = 0) -> Result[list[Memory], RepositoryError]:
         """Return the most recently updated memories with optional pagination offset."""
         try:
@@ -120,20 +287,22 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             return Failure(RepositoryError(str(e)))
 
     def find_by_tags(self, tags: list[str], limit: int = 10) -> Result[list[Memory], RepositoryError]:
-        """Find memories that contain any of the specified tags."""
+        """Find memories that contain any of the specified tags.
+
+        Candidates come from the ``memory_tags`` inverted index, so only rows
+        carrying one of the tags are read.
+        """
         try:
+            if not tags:
+                return Success([])
+            placeholders = ", ".join("?" for _ in tags)
             rows = self._db.execute(
-                f"SELECT * FROM memories WHERE {self._active_where()} ORDER BY updated_at DESC"
+                f"SELECT * FROM memories WHERE {self._active_where()}"  # nosec B608
+                f" AND key IN (SELECT memory_key FROM memory_tags WHERE tag IN ({placeholders}))"
+                " ORDER BY updated_at DESC LIMIT ?",
+                [*tags, limit],
             ).fetchall()
-            result: list[Memory] = []
-            tag_set = set(tags)
-            for row in rows:
-                memory_tags = set(self._parse_json_list(row["tags"]))
-                if memory_tags & tag_set:
-                    result.append(self._row_to_memory(row))
-                    if len(result) >= limit:
-                        break
-            return Success(result)
+            return Success([self._row_to_memory(r) for r in rows])
         except Exception as e:
             logger.error("Failed to find memories by tags %s: %s", tags, e)
             return Failure(RepositoryError(str(e)))
@@ -166,7 +335,7 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             self._db.commit()
 
             updated_row = self._db.execute("SELECT * FROM memories WHERE key = ?", (key,)).fetchone()
-            logger.info("Memory updated: %s", key)
+            logger.debug("Memory updated: %s", key)
             return Success(self._row_to_memory(updated_row))
         except Exception as e:
             self._db.rollback()
@@ -179,7 +348,7 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             self._db.execute("DELETE FROM memory_strength WHERE memory_key = ?", (key,))
             self._db.execute("DELETE FROM memories WHERE key = ?", (key,))
             self._db.commit()
-            logger.info("Memory deleted: %s", key)
+            logger.debug("Memory deleted: %s", key)
             return Success(None)
         except Exception as e:
             self._db.rollback()
@@ -195,63 +364,62 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             logger.error("Failed to count memories: %s", e)
             return Failure(RepositoryError(str(e)))
 
+    def data_version(self) -> Result[tuple, RepositoryError]:
+        """Cheap marker that changes whenever a memory is written or deleted."""
+        try:
+            row = self._db.execute("SELECT MAX(updated_at), COUNT(*) FROM memories").fetchone()
+            return Success((row[0], row[1]))
+        except Exception as e:
+            logger.error("Failed to read memory data version: %s", e)
+            return Failure(RepositoryError(str(e)))
+
     def find_all(self) -> Result[list[Memory], RepositoryError]:
         """Return all memories."""
         try:
-            rows = self._db.execute(
-                f"SELECT * FROM memories WHERE {self._active_where()} ORDER BY updated_at DESC"
-            ).fetchall()
-            return Success([self._row_to_memory(r) for r in rows])
+            cursor = self._db.execute(f"SELECT * FROM memories WHERE {self._active_where()} ORDER BY updated_at DESC")
+            return Success([self._row_to_memory(r) for r in cursor])
         except Exception as e:
             logger.error("Failed to find all memories: %s", e)
             return Failure(RepositoryError(str(e)))
 
+    def find_by_lifecycle_status(self, status: str) -> Result[list[Memory], RepositoryError]:
+        """Return memories in the given lifecycle status, most recently updated first."""
+        try:
+            cursor = self._db.execute(
+                "SELECT * FROM memories WHERE lifecycle_status = ? ORDER BY updated_at DESC",
+                (status,),
+            )
+            return Success([self._row_to_memory(r) for r in cursor])
+        except Exception as e:
+            logger.error("Failed to find memories with lifecycle status %s: %s", status, e)
+            return Failure(RepositoryError(str(e)))
+
     # ------------------------------------------------------------------
     # FTS5 full-text search
     # ------------------------------------------------------------------
 
     def search_fts(
-        self, query: str, top_k: int = 10, date_from: datetime | None = None, date_to: datetime | None = None
+        self,
+        query: str,
+        top_k: int = 10,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        tags: list[str] | None = None,
     ) -> Result[list[tuple[Memory, float]], RepositoryError]:
         """FTS5 full-text search using BM25 ranking.
 
         Returns [(Memory, normalized_bm25_score), ...] sorted by relevance.
-        Score normalized to 0-1 range via ``1 / (1 + |bm25|)``.
+        Score normalized to 0-1 range via ``1 / (1 + |bm25|)``. When ``tags`` is
+        given, only memories carrying all of them are returned.
         """
         try:
             fts_query = self._sanitize_fts_query(query)
             if not fts_query:
                 return Success([])
 
-            conditions: list[str] = ["memories_fts MATCH ?"]
-            params: list = [fts_query]
-
-            # Exclude tombstoned
-            conditions.append("m.lifecycle_status != 'tombstoned'")
-
-            # Date range filter
-            if date_from is not None or date_to is not None:
-                if date_from is not None and date_to is not None:
-                    conditions.append("m.created_at BETWEEN ? AND ?")
-                    params.extend([date_from.isoformat(), date_to.isoformat()])
-                elif date_from is not None:
-                    conditions.append("m.created_at >= ?")
-                    params.append(date_from.isoformat())
-                elif date_to is not None:
-                    conditions.append("m.created_at <= ?")
-                    params.append(date_to.isoformat())
-
-            where_clause = " AND ".join(conditions)
             rows = self._db.execute(
-                f"""
-                SELECT m.*, rank
-                FROM memories_fts
-                JOIN memories m ON m.key = memories_fts.memories_key
-                WHERE {where_clause}
-                ORDER BY rank
-                LIMIT ?
-                """,  # noqa: S608  # nosec B608
-                [*params, top_k],
+                _fts_search_sql(date_from is not None, date_to is not None, len(tags or ())),
+                [fts_query, *self._date_params(date_from, date_to), *(tags or ()), top_k],
             ).fetchall()
 
             scored: list[tuple[Memory, float]] = []
@@ -276,62 +444,66 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
         characters (``OR``, ``NOT``, ``*``, ``(...)``) while preserving
         Unicode text including Japanese.
         """
-        terms = query.strip().split()
-        if not terms:
-            return ""
-        escaped = []
-        for t in terms:
-            # Escape embedded double-quotes by doubling them (FTS5 convention)
-            t = t.replace('"', '""')
-            escaped.append(f'"{t}"')
-        return " AND ".join(escaped)
+        return _parse_keyword_query(query).match_expr
 
     # ------------------------------------------------------------------
     # Keyword search
     # ------------------------------------------------------------------
 
     def search_keyword(
-        self, query: str, limit: int = 10, date_from: datetime | None = None, date_to: datetime | None = None
+        self,
+        query: str,
+        limit: int = 10,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        tags: list[str] | None = None,
     ) -> Result[list[tuple[Memory, float]], RepositoryError]:
         """Search memories by keyword with relevance scoring.
 
         Multi-word queries use AND logic: all terms must appear in the content.
-        Optionally filter by date range (created_at BETWEEN date_from AND date_to).
+        Optionally filter by date range (created_at BETWEEN date_from AND date_to)
+        and by ``tags`` (all must be present), both applied before the LIMIT.
+
+        LIKE wildcards in terms are escaped so every hit contains all terms
+        literally; relevance is therefore uniform (1.0) and ordering plus LIMIT
+        are applied in SQL instead of scoring and sorting every matching row.
+        Terms without ASCII letters (typically Japanese) are matched with
+        ``instr`` on the UTF-8 bytes, which gives the same hits as LIKE (it only
+        folds ASCII case) at about half the cost per row.
+
+        When every term is at least three characters and the trigram index
+        exists, matches come from ``memories_trigram`` instead of a LIKE scan.
         """
         try:
-            terms = [t for t in query.split() if t]
-            if not terms:
+            parsed = _parse_keyword_query(query)
+            if not parsed.match_expr:
                 return Success([])
-            # Each term must match independently (AND logic)
-            conditions: list[str] = ["content LIKE ?" for _ in terms]  # noqa: UP028
-            params: list[str] = list(f"%{t}%" for t in terms)
-
-            # Exclude tombstoned memories
-            conditions.append("lifecycle_status != 'tombstoned'")
-
-            # Date range filter
-            if date_from is not None or date_to is not None:
-                if date_from is not None and date_to is not None:
-                    conditions.append("created_at BETWEEN ? AND ?")
-                    params.extend([date_from.isoformat(), date_to.isoformat()])
-                elif date_from is not None:
-                    conditions.append("created_at >= ?")
-                    params.append(date_from.isoformat())
-                elif date_to is not None:
-                    conditions.append("created_at <= ?")
-                    params.append(date_to.isoformat())
-
-            where_clause = " AND ".join(conditions)
+            tag_params = tuple(tags or ())
+            if parsed.shortest_term >= self._TRIGRAM_MIN_TERM and self._has_trigram_index():
+                rows = self._db.execute(
+                    _trigram_search_sql(date_from is not None, date_to is not None, len(tag_params)),
+                    [parsed.match_expr, *self._date_params(date_from, date_to), *tag_params, limit],
+                ).fetchall()
+                return Success([(self._row_to_memory(row), 1.0) for row in rows])
+            # Each term must match independently (AND logic); tombstoned rows excluded
             rows = self._db.execute(
-                f"SELECT * FROM memories WHERE {where_clause} ORDER BY updated_at DESC",  # noqa: S608  # nosec B608
-                tuple(params),
+                _keyword_search_sql(
+                    len(parsed.like_patterns),
+                    date_from is not None,
+                    date_to is not None,
+                    len(tag_params),
+                    len(parsed.byte_terms),
+                ),
+                [
+                    *parsed.byte_terms,
+                    *parsed.like_patterns,
+                    *self._date_params(date_from, date_to),
+                    *tag_params,
+                    limit,
+                ],
             ).fetchall()
-            scored: list[tuple[Memory, float]] = []
-            for row in rows:
-                score = self._simple_relevance_score(row["content"], query)
-                scored.append((self._row_to_memory(row), score))
-            scored.sort(key=lambda x: x[1], reverse=True)
-            return Success(scored[:limit])
+            # Every row already contains all terms, so each is a full match
+            return Success([(self._row_to_memory(row), 1.0) for row in rows])
         except Exception as e:
             logger.error("Failed to search memories for '%s': %s", query, e)
             return Failure(RepositoryError(str(e)))
@@ -370,7 +542,7 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
                 ),
             )
             self._db.commit()
-            logger.info(
+            logger.debug(
                 "Version %d saved for memory %s (%s)",
                 version,
                 memory_key,
@@ -475,29 +647,33 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             return Failure(RepositoryError(str(e)))
 
     def get_all_tags(self) -> Result[list[str], RepositoryError]:
-        """Return a deduplicated list of all tags used across memories."""
+        """Return a deduplicated list of all tags used across memories.
+
+        Read from the ``memory_tags`` index in tag order; no tags JSON is decoded.
+        """
         try:
-            rows = self._db.execute(f"SELECT tags FROM memories WHERE {self._active_where()}").fetchall()
-            all_tags: set[str] = set()
-            for row in rows:
-                all_tags.update(self._parse_json_list(row["tags"]))
-            return Success(sorted(all_tags))
+            cursor = self._db.execute(f"""
+                SELECT DISTINCT t.tag FROM memory_tags t JOIN memories m ON m.key = t.memory_key
+                WHERE {self._active_where("m")} ORDER BY t.tag
+            """)
+            return Success([row[0] for row in cursor])
         except Exception as e:
             logger.error("Failed to get all tags: %s", e)
             return Failure(RepositoryError(str(e)))
 
     def get_by_tags(self, tags: list[str]) -> Result[list[Memory], RepositoryError]:
-        """Get memories that contain ALL specified tags."""
+        """Get memories that contain ALL specified tags (exact match via ``memory_tags``)."""
         try:
             if not tags:
                 return Success([])
-            match_conditions = ["tags LIKE ?" for _ in tags]
-            params = [f'%"{t}"%' for t in tags]
-            all_conditions = [self._active_where(), *match_conditions]
-            where = " AND ".join(all_conditions)
+            unique_tags = list(dict.fromkeys(tags))
+            placeholders = ", ".join("?" for _ in unique_tags)
             rows = self._db.execute(
-                f"SELECT * FROM memories WHERE {where} ORDER BY updated_at DESC",  # nosec B608
-                params,
+                f"SELECT * FROM memories WHERE {self._active_where()}"  # nosec B608
+                f" AND key IN (SELECT memory_key FROM memory_tags WHERE tag IN ({placeholders})"
+                " GROUP BY memory_key HAVING COUNT(*) = ?)"
+                " ORDER BY updated_at DESC",
+                [*unique_tags, len(unique_tags)],
             ).fetchall()
             return Success([self._row_to_memory(r) for r in rows])
         except Exception as e:
@@ -573,7 +749,12 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             return Failure(RepositoryError(str(e)))
 
     def _ensure_search_log_table(self) -> None:
-        """Create search_log table if it doesn't exist (safety fallback)."""
+        """Create search_log table if it doesn't exist (safety fallback).
+
+        Runs the DDL once per repository; later calls skip the statement.
+        """
+        if self._search_log_ready:
+            return
         self._db.execute(
             """
             CREATE TABLE IF NOT EXISTS search_log (
@@ -585,48 +766,82 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             )
             """
         )
+        self._search_log_ready = True
+
+    def get_distributions(self) -> Result[dict, RepositoryError]:
+        """Tag and emotion histograms over active memories, aggregated by SQLite.
+
+        Tags come from the memory_tags index, so no memory row is decoded.
+        Both lists are ordered by count descending, then by name.
+        """
+        try:
+            tag_rows = self._db.execute(f"""
+                SELECT t.tag AS tag, COUNT(*) AS cnt
+                FROM memory_tags t JOIN memories m ON m.key = t.memory_key
+                WHERE {self._active_where("m")}
+                GROUP BY t.tag ORDER BY cnt DESC, t.tag
+            """).fetchall()
+            tagged = self._db.execute(f"""
+                SELECT COUNT(DISTINCT t.memory_key) AS cnt
+                FROM memory_tags t JOIN memories m ON m.key = t.memory_key
+                WHERE {self._active_where("m")}
+            """).fetchone()["cnt"]
+            emotion_rows = self._db.execute(f"""
+                SELECT COALESCE(NULLIF(emotion, ''), 'neutral') AS emotion, COUNT(*) AS cnt
+                FROM memories WHERE {self._active_where()}
+                GROUP BY 1 ORDER BY cnt DESC, 1
+            """).fetchall()
+            return Success(
+                {
+                    "tags": [(r["tag"], r["cnt"]) for r in tag_rows],
+                    "emotions": [(r["emotion"], r["cnt"]) for r in emotion_rows],
+                    "tagged_count": tagged,
+                }
+            )
+        except Exception as e:
+            logger.error("Failed to get memory distributions: %s", e)
+            return Failure(RepositoryError(str(e)))
 
     def get_memory_index(self) -> Result[dict, RepositoryError]:
-        """Get compressed memory index for context snapshot."""
+        """Get compressed memory index for context snapshot.
+
+        Total, emotion distribution and high-importance count come from one
+        grouped pass over the active memories rather than three queries.
+        """
         try:
-            total = self._db.execute(f"SELECT COUNT(*) as cnt FROM memories WHERE {self._active_where()}").fetchone()[
-                "cnt"
-            ]
+            emotion_groups = self._db.execute(f"""
+                SELECT emotion, COUNT(*) AS cnt, TOTAL(importance >= 0.8) AS high_cnt
+                FROM memories WHERE {self._active_where()}
+                GROUP BY emotion
+            """).fetchall()
+            total = sum(r["cnt"] for r in emotion_groups)
+            # TOTAL() is 0.0 rather than NULL for a group whose importance is all NULL
+            high_imp = int(sum(r["high_cnt"] for r in emotion_groups))
 
+            # Tag histogram comes from the memory_tags index; no tags JSON is decoded
             tag_rows = self._db.execute(f"""
-                SELECT tags FROM memories WHERE {self._active_where()} AND tags IS NOT NULL AND tags != '' AND tags != '[]'
+                SELECT t.tag AS tag, COUNT(*) AS cnt
+                FROM memory_tags t JOIN memories m ON m.key = t.memory_key
+                WHERE {self._active_where("m")}
+                GROUP BY t.tag ORDER BY cnt DESC, MIN(m.rowid) LIMIT 10
             """).fetchall()
-            tag_dist: dict[str, int] = {}
-            for row in tag_rows:
-                try:
-                    tags = json.loads(row["tags"]) if isinstance(row["tags"], str) else row["tags"]
-                    if isinstance(tags, list):
-                        for t in tags:
-                            tag_dist[t] = tag_dist.get(t, 0) + 1
-                except (json.JSONDecodeError, TypeError):
-                    pass
-            top_tags = sorted(tag_dist.items(), key=lambda x: x[1], reverse=True)[:10]
+            top_tags = [(r["tag"], r["cnt"]) for r in tag_rows]
 
-            emotion_rows = self._db.execute(f"""
-                SELECT emotion, COUNT(*) as cnt FROM memories
-                WHERE {self._active_where()} AND emotion IS NOT NULL AND emotion != ''
-                GROUP BY emotion ORDER BY cnt DESC
-            """).fetchall()
-            emotion_dist = [(r["emotion"], r["cnt"]) for r in emotion_rows[:8]]
+            emotion_rows = sorted(
+                ((r["emotion"], r["cnt"]) for r in emotion_groups if r["emotion"]), key=lambda ec: (-ec[1], ec[0])
+            )
+            emotion_dist = emotion_rows[:8]
             emotion_others = max(0, len(emotion_rows) - 8)
 
             timeline_rows = self._db.execute(f"""
                 SELECT strftime('%Y-%m', created_at) as month, COUNT(*) as cnt
                 FROM memories
-                WHERE {self._active_where()} AND created_at >= datetime('now', '-12 months')
+                WHERE {self._active_where()}
+                  AND created_at_ts >= (julianday('now', '-12 months') - 2440587.5) * 86400.0
                 GROUP BY month ORDER BY month
             """).fetchall()
             timeline = [(r["month"], r["cnt"]) for r in timeline_rows]
 
-            high_imp = self._db.execute(
-                f"SELECT COUNT(*) as cnt FROM memories WHERE {self._active_where()} AND importance >= 0.8"
-            ).fetchone()["cnt"]
-
             return Success(
                 {
                     "total": total,
@@ -668,6 +883,29 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             logger.error("Failed to find relationship highlights: %s", e)
             return Failure(RepositoryError(str(e)))
 
+    def find_by_period(
+        self, date_from: datetime, date_to: datetime | None = None, limit: int = 20, min_importance: float = 0.0
+    ) -> Result[list[Memory], RepositoryError]:
+        """Memories created in ``[date_from, date_to]``, most important first.
+
+        The created_at_ts range and importance floor are both answered from
+        ``idx_memories_created_ts_importance``; only matching rows are read and
+        sorted. The unary ``+`` on importance keeps the planner off
+        ``idx_memories_importance``, which would otherwise walk the whole table
+        in importance order for the usual narrow (one-day) window.
+        """
+        try:
+            rows = self._db.execute(
+                f"SELECT * FROM memories WHERE {self._active_where()}"  # nosec B608
+                f"{_date_range_sql('created_at_ts', True, date_to is not None)} AND +importance >= ?"
+                " ORDER BY +importance DESC, created_at_ts DESC LIMIT ?",
+                [*self._date_params(date_from, date_to), min_importance, limit],
+            ).fetchall()
+            return Success([self._row_to_memory(r) for r in rows])
+        except Exception as e:
+            logger.error("Failed to find memories by period: %s", e)
+            return Failure(RepositoryError(str(e)))
+
     def find_top_by_importance(self, limit: int = 15) -> Result[list[Memory], RepositoryError]:
         """Find memories ranked purely by importance descending."""
         try:
@@ -689,7 +927,7 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
                 (now, key),
             )
             self._db.commit()
-            logger.info("Memory tombstoned: %s", key)
+            logger.debug("Memory tombstoned: %s", key)
             return Success(None)
         except Exception as e:
             self._db.rollback()
@@ -702,33 +940,34 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
 
     @staticmethod
     def _parse_json_list(value: str | None) -> list[str]:
-        """Safely parse a JSON-encoded list from a database field."""
-        if not value:
-            return []
-        try:
-            parsed = json.loads(value)
-            return parsed if isinstance(parsed, list) else []
-        except (json.JSONDecodeError, TypeError):
+        """Safely parse a JSON-encoded list from a database field.
+
+        Decoding is memoised by the raw string; callers get a fresh list.
+        """
+        if not value or value == "[]":
             return []
+        return list(_decode_json_list(value))
 
     @staticmethod
     def _parse_json_dict(value: str | None) -> dict | None:
-        """Parse a JSON dict column. Returns None for empty/null."""
+        """Parse a JSON dict column. Returns None for empty/null.
+
+        Decoding is memoised by the raw string; callers get a fresh dict.
+        """
         if not value:
             return None
-        try:
-            raw = json.loads(value)
-            return raw if isinstance(raw, dict) else None
-        except (json.JSONDecodeError, TypeError):
-            return None
+        parsed = _decode_json_dict(value)
+        return dict(parsed) if parsed is not None else None
 
     @staticmethod
     def _parse_iso_or_none(value: str | None):
-        """Parse ISO datetime string or return None."""
-        if not value:
-            return None
-        from nous.domain.shared.time_utils import parse_iso
+        """Parse ISO datetime string or return None.
 
+        Called several times per row, so values that are not shaped like an
+        ISO date (``YYYY-MM-DD...``) are rejected up front instead of raising.
+        """
+        if not value or len(value) < 10 or value[4] != "-" or value[7] != "-":
+            return None
         return parse_iso(value)
 
     def _row_to_memory(self, row) -> Memory:
@@ -752,21 +991,27 @@ class SQLiteMemoryRepository(SQLiteBlockMixin, SQLiteStrengthMixin):
             summary_ref=row["summary_ref"],
             equipped_items=row["equipped_items"],
             access_count=row["access_count"] or 0,
-            last_accessed=self._parse_iso_or_none(row["last_accessed"]) if "last_accessed" in row else None,
-            body_state=self._parse_json_dict(row["body_state"]) if "body_state" in row else None,
-            state_snapped_at=self._parse_iso_or_none(row["state_snapped_at"]) if "state_snapped_at" in row else None,
-            lifecycle_status=row["lifecycle_status"]
-            if "lifecycle_status" in (row.keys() if hasattr(row, "keys") else [])
-            else "active",
+            last_accessed=self._parse_iso_or_none(_optional_column(row, "last_accessed")),
+            body_state=self._parse_json_dict(_optional_column(row, "body_state")),
+            state_snapped_at=self._parse_iso_or_none(_optional_column(row, "state_snapped_at")),
+            lifecycle_status=_optional_column(row, "lifecycle_status") or "active",
         )
 
     @staticmethod
-    def _simple_relevance_score(content: str, query: str) -> float:
-        """Simple relevance: count query term occurrences."""
-        query_lower = query.lower()
-        content_lower = content.lower()
-        terms = query_lower.split()
-        if not terms:
-            return 0.0
-        matches = sum(1 for t in terms if t in content_lower)
-        return matches / len(terms)
+    def _date_params(date_from: datetime | None, date_to: datetime | None) -> list[float]:
+        """Epoch bounds for the created_at_ts range placeholders, in SQL order."""
+        return [to_epoch(dt) for dt in (date_from, date_to) if dt is not None]
+
+    def _has_trigram_index(self) -> bool:
+        """Whether the trigram FTS5 table exists (checked once per repository)."""
+        if self._trigram_available is None:
+            row = self._db.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memories_trigram'"
+            ).fetchone()
+            self._trigram_available = row is not None
+        return self._trigram_available
+
+    @staticmethod
+    def _escape_like(term: str) -> str:
+        """Escape LIKE wildcards so the term is matched literally (ESCAPE '\\')."""
+        return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
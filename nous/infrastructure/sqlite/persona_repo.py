@@ -12,7 +12,7 @@ from nous.domain.persona.entities import (
 from nous.domain.persona.repository import PersonaRepository
 from nous.domain.shared.errors import RepositoryError
 from nous.domain.shared.result import Failure, Result, Success
-from nous.domain.shared.time_utils import format_iso, get_now, parse_iso
+from nous.domain.shared.time_utils import format_iso, get_now, parse_iso, parse_iso_or_none
 from nous.infrastructure.logging.structured import get_logger
 
 if TYPE_CHECKING:
@@ -85,7 +85,7 @@ class SQLitePersonaRepository(PersonaRepository):
                     user_info=user_info,
                     persona_info=persona_info,
                     last_conversation_time=_resolve_last_conversation_time(self._db, state_map),
-                    last_state_update=_parse_or_none(state_map.get("last_state_update")),
+                    last_state_update=parse_iso_or_none(state_map.get("last_state_update")),
                     author_note=state_map.get("author_note"),
                     author_note_frequency=state_map.get("author_note_frequency", "always"),
                 )
@@ -362,7 +362,7 @@ class SQLitePersonaRepository(PersonaRepository):
             key=row["key"],
             value=row["value"],
             valid_from=parse_iso(row["valid_from"]),
-            valid_until=_parse_or_none(row["valid_until"]),
+            valid_until=parse_iso_or_none(row["valid_until"]),
             change_source=row["change_source"],
         )
 
@@ -401,12 +401,12 @@ def _resolve_last_conversation_time(db, state_map: dict):
         row = db.execute("SELECT MAX(COALESCE(updated_at, created_at)) AS last_activity FROM memories").fetchone()
         if row and row["last_activity"]:
             memory_time = parse_iso(row["last_activity"])
-            stored_time = _parse_or_none(state_map.get("last_conversation_time"))
+            stored_time = parse_iso_or_none(state_map.get("last_conversation_time"))
             candidates = [t for t in (memory_time, stored_time) if t is not None]
             return max(candidates) if candidates else None
     except Exception:
         pass
-    return _parse_or_none(state_map.get("last_conversation_time"))
+    return parse_iso_or_none(state_map.get("last_conversation_time"))
 
 
 def _safe_float(value: str | None) -> float | None:
@@ -417,13 +417,3 @@ def _safe_float(value: str | None) -> float | None:
         return float(value)
     except (ValueError, TypeError):
         return None
-
-
-def _parse_or_none(value: str | None):
-    """Parse ISO datetime or return None."""
-    if not value:
-        return None
-    try:
-        return parse_iso(value)
-    except Exception:
-        return None
@@ -25,7 +25,7 @@ class SessionEventRepository:
 
     def insert(self, event: SessionEvent) -> int:
         """Insert a session event and return its row id."""
-        self._db.execute(
+        cursor = self._db.execute(
             """
             INSERT INTO session_events
                 (session_id, persona, event_type, timestamp, summary, detail, metadata_json)
@@ -42,7 +42,7 @@ class SessionEventRepository:
             ),
         )
         self._db.commit()
-        return self._db.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return cursor.lastrowid
 
     # ------------------------------------------------------------------
     # Query
@@ -8,6 +8,29 @@ from nous.infrastructure.logging.structured import get_logger
 
 logger = get_logger(__name__)
 
+_UPSERT_STRENGTH_SQL = """
+    INSERT OR REPLACE INTO memory_strength
+        (memory_key, strength, stability, last_decay, recall_count, last_recall,
+         last_utility, interference_count, link_count, emotion_peak, is_ltm)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _strength_params(strength: MemoryStrength) -> tuple:
+    return (
+        strength.memory_key,
+        strength.strength,
+        strength.stability,
+        format_iso(strength.last_decay) if strength.last_decay else None,
+        strength.recall_count,
+        format_iso(strength.last_recall) if strength.last_recall else None,
+        format_iso(strength.last_utility) if strength.last_utility else None,
+        strength.interference_count,
+        strength.link_count,
+        strength.emotion_peak,
+        int(strength.is_ltm),
+    )
+
 
 class SQLiteStrengthMixin:
     """Mixin providing memory strength operations for SQLiteMemoryRepository."""
@@ -23,30 +46,25 @@ class SQLiteStrengthMixin:
             logger.error("Failed to get strength for %s: %s", key, e)
             return Failure(RepositoryError(str(e)))
 
+    def get_strength_values(self, keys: list[str]) -> Result[dict[str, float], RepositoryError]:
+        """Return ``{key: strength}`` for several memories in one query. Keys without a record are absent."""
+        if not keys:
+            return Success({})
+        try:
+            placeholders = ",".join("?" * len(keys))
+            cursor = self._db.execute(
+                f"SELECT memory_key, strength FROM memory_strength WHERE memory_key IN ({placeholders})",  # noqa: S608  # nosec B608
+                keys,
+            )
+            return Success({r["memory_key"]: r["strength"] for r in cursor if r["strength"] is not None})
+        except Exception as e:
+            logger.error("Failed to get strengths for %d keys: %s", len(keys), e)
+            return Failure(RepositoryError(str(e)))
+
     def save_strength(self, strength: MemoryStrength) -> Result[None, RepositoryError]:
         """Save or update a memory strength record."""
         try:
-            self._db.execute(
-                """
-                INSERT OR REPLACE INTO memory_strength
-                    (memory_key, strength, stability, last_decay, recall_count, last_recall,
-                     last_utility, interference_count, link_count, emotion_peak, is_ltm)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    strength.memory_key,
-                    strength.strength,
-                    strength.stability,
-                    format_iso(strength.last_decay) if strength.last_decay else None,
-                    strength.recall_count,
-                    format_iso(strength.last_recall) if strength.last_recall else None,
-                    format_iso(strength.last_utility) if strength.last_utility else None,
-                    strength.interference_count,
-                    strength.link_count,
-                    strength.emotion_peak,
-                    int(strength.is_ltm),
-                ),
-            )
+            self._db.execute(_UPSERT_STRENGTH_SQL, _strength_params(strength))
             self._db.commit()
             return Success(None)
         except Exception as e:
@@ -54,11 +72,24 @@ class SQLiteStrengthMixin:
             logger.error("Failed to save strength for %s: %s", strength.memory_key, e)
             return Failure(RepositoryError(str(e)))
 
+    def save_strengths(self, strengths: list[MemoryStrength]) -> Result[int, RepositoryError]:
+        """Save or update many strength records with one prepared statement and one commit."""
+        if not strengths:
+            return Success(0)
+        try:
+            self._db.executemany(_UPSERT_STRENGTH_SQL, [_strength_params(s) for s in strengths])
+            self._db.commit()
+            return Success(len(strengths))
+        except Exception as e:
+            self._db.rollback()
+            logger.error("Failed to save %d strength records: %s", len(strengths), e)
+            return Failure(RepositoryError(str(e)))
+
     def get_all_strengths(self) -> Result[list[MemoryStrength], RepositoryError]:
         """Get all memory strength records."""
         try:
-            rows = self._db.execute("SELECT * FROM memory_strength").fetchall()
-            return Success([self._row_to_strength(r) for r in rows])
+            cursor = self._db.execute("SELECT * FROM memory_strength")
+            return Success([self._row_to_strength(r) for r in cursor])
         except Exception as e:
             logger.error("Failed to get all strengths: %s", e)
             return Failure(RepositoryError(str(e)))
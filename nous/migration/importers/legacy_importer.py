@@ -18,6 +18,23 @@ logger = get_logger(__name__)
 if TYPE_CHECKING:
     from nous.infrastructure.sqlite.connection import SQLiteConnection
 
+# Source databases are only read; a large page cache and mmap keep the full-table
+# SELECTs of an import off the syscall path.
+_SOURCE_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _open_source_db(db_path: Path) -> sqlite3.Connection:
+    """Open a legacy database read-only, so the import never locks or modifies it."""
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    for pragma in _SOURCE_PRAGMAS:
+        conn.execute(pragma)
+    conn.row_factory = sqlite3.Row
+    return conn
+
 
 class LegacyImporter:
     """Import legacy MemoryMCP v1 data into Nous v2/v3 schema.
@@ -48,8 +65,7 @@ class LegacyImporter:
         # 1. memory.sqlite
         memory_db_path = source_dir_path / "memory.sqlite"
         if memory_db_path.exists():
-            src = sqlite3.connect(str(memory_db_path))
-            src.row_factory = sqlite3.Row
+            src = _open_source_db(memory_db_path)
             try:
                 counts["memories"] = self._import_memories(src)
                 counts["memory_strength"] = self._import_memory_strength(src)
@@ -64,8 +80,7 @@ class LegacyImporter:
         # 2. inventory.sqlite
         inventory_db_path = source_dir_path / "inventory.sqlite"
         if inventory_db_path.exists():
-            src = sqlite3.connect(str(inventory_db_path))
-            src.row_factory = sqlite3.Row
+            src = _open_source_db(inventory_db_path)
             try:
                 counts["items"] = self._import_items(src)
                 counts["equipment_slots"] = self._import_equipment_slots(src)
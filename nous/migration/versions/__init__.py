@@ -57,6 +57,15 @@ from nous.migration.versions.v031_author_note import upgrade as v031_upgrade
 from nous.migration.versions.v032_dynamic_temp import (
     upgrade as v032_upgrade,
 )
+from nous.migration.versions.v033_created_at_ts import (
+    upgrade as v033_upgrade,
+)
+from nous.migration.versions.v034_importance_index import (
+    upgrade as v034_upgrade,
+)
+from nous.migration.versions.v035_created_importance_index import (
+    upgrade as v035_upgrade,
+)
 
 ALL_MIGRATIONS: list[tuple[str, str, object]] = [
     ("001", "Initial schema", v001_upgrade),
@@ -90,4 +99,7 @@ ALL_MIGRATIONS: list[tuple[str, str, object]] = [
     ("030", "Add visual_desc column to items table", v030_upgrade),
     ("031", "Add author_note and author_note_frequency to persona state", v031_upgrade),
     ("032", "Add dynamic temperature and top_p to chat_settings", v032_upgrade),
+    ("033", "Add created_at_ts generated column to memories", v033_upgrade),
+    ("034", "Add importance index to memories", v034_upgrade),
+    ("035", "Add (created_at_ts, importance) index to memories", v035_upgrade),
 ]
@@ -0,0 +1,29 @@
+"""Migration v033: Add numeric created_at_ts generated column to memories."""
+
+from __future__ import annotations
+
+from contextlib import suppress
+
+
+def upgrade(db) -> None:
+    """Add created_at_ts (POSIX seconds) as a VIRTUAL generated column and index it.
+
+    Date-range filters compare this column numerically instead of comparing
+    ISO strings, which breaks across mixed UTC offsets. Strings without an
+    offset are interpreted as JST, matching ``format_iso``. The column is
+    computed on read, so existing rows need no backfill.
+    """
+    with suppress(Exception):
+        db.execute(
+            """
+            ALTER TABLE memories ADD COLUMN created_at_ts REAL GENERATED ALWAYS AS (
+                (CASE
+                    WHEN created_at LIKE '%Z' OR (length(created_at) > 19 AND substr(created_at, -6, 1) IN ('+', '-'))
+                    THEN julianday(created_at)
+                    ELSE julianday(created_at, '-9 hours')
+                END - 2440587.5) * 86400.0
+            ) VIRTUAL
+            """
+        )
+    db.execute("CREATE INDEX IF NOT EXISTS idx_memories_created_at_ts ON memories(created_at_ts)")
+    db.commit()
@@ -0,0 +1,14 @@
+"""Migration v034: Index memories by importance."""
+
+from __future__ import annotations
+
+
+def upgrade(db) -> None:
+    """Create an importance index for the context snapshot's top-N and threshold counts.
+
+    ``find_top_by_importance`` (``ORDER BY importance DESC LIMIT ?``) otherwise
+    scans and sorts every row, and the ``importance >= ?`` counts and
+    highlights scan the whole table.
+    """
+    db.execute("CREATE INDEX IF NOT EXISTS idx_memories_importance ON memories(importance DESC)")
+    db.commit()
@@ -0,0 +1,17 @@
+"""Migration v035: Index memories by (created_at_ts, importance)."""
+
+from __future__ import annotations
+
+
+def upgrade(db) -> None:
+    """Replace the created_at_ts index with a composite (created_at_ts, importance) index.
+
+    Period extraction (``find_by_period``) seeks the created_at_ts range and
+    applies the importance floor from the index entries, so table rows are
+    read only for matches. The composite index still serves every query that
+    filters on created_at_ts alone, so the single-column index is dropped to
+    keep writes from maintaining both.
+    """
+    db.execute("CREATE INDEX IF NOT EXISTS idx_memories_created_ts_importance ON memories(created_at_ts, importance)")
+    db.execute("DROP INDEX IF EXISTS idx_memories_created_at_ts")
+    db.commit()
@@ -7,6 +7,7 @@ Routes exercised here:
   search.py  : emotions (GET), graph (GET)
   admin.py   : settings (GET/PUT/status), rebuild (503 path), export (GET)
   item.py    : add/equip/unequip/update/delete items
+  events.py  : session event ingest (POST)
   deps.py    : persona resolution via Bearer token and X-Persona header
 """
 
@@ -277,6 +278,12 @@ class TestDashboardEndpoints:
         assert resp.json()["stats"]["total_count"] >= 1
         assert len(resp.json()["recent"]) >= 1
 
+    async def test_api_dashboard_goals_active_first_with_status(self, client):
+        await client.post(f"/api/memories/{PERSONA}", json={"content": "old goal", "tags": ["goal", "achieved"]})
+        await client.post(f"/api/memories/{PERSONA}", json={"content": "new goal", "tags": ["goal", "active"]})
+        goals = (await client.get(f"/api/dashboard/{PERSONA}")).json()["goals"]
+        assert [(g["content"], g["status"]) for g in goals] == [("new goal", "active"), ("old goal", "achieved")]
+
 
 # ---------------------------------------------------------------------------
 # persona.py — persona CRUD
@@ -683,6 +690,40 @@ class TestItemEndpoints:
         assert resp.status_code == 400
 
 
+# ---------------------------------------------------------------------------
+# events.py — session event ingest
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.integration
+class TestEventsIngestEndpoint:
+    """POST /api/events/ingest."""
+
+    async def test_repeated_ingests_run_schema_fallback_once(self, client):
+        from nous.api.http.routers import events
+
+        body = {
+            "session_id": "sess_1",
+            "persona": PERSONA,
+            "events": [{"type": "tool_call", "summary": "first"}],
+        }
+        with patch.object(events, "ensure_session_events_schema", wraps=events.ensure_session_events_schema) as ddl:
+            first = await client.post("/api/events/ingest", json=body)
+            body["events"] = [{"type": "tool_call", "summary": "second"}, {"type": "", "summary": "skipped"}]
+            second = await client.post("/api/events/ingest", json=body)
+
+        assert first.json() == {"status": "ok", "count": 1, "skipped": 0}
+        assert second.json() == {"status": "ok", "count": 1, "skipped": 1}
+        ddl.assert_called_once()
+        ctx = AppContextRegistry.get(PERSONA)
+        rows = (
+            ctx.connection.get_memory_db()
+            .execute("SELECT summary FROM session_events WHERE event_type = 'tool_call' ORDER BY id")
+            .fetchall()
+        )
+        assert [r["summary"] for r in rows] == ["first", "second"]
+
+
 # ---------------------------------------------------------------------------
 # Dashboard state restoration helpers (moved from test_dashboard_state_restore)
 # ---------------------------------------------------------------------------
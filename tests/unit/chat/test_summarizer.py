@@ -0,0 +1,98 @@
+"""Tests for SessionSummarizer budgets."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from nous.application.chat import summarizer
+from nous.application.chat.summarizer import summarize_and_store
+from nous.infrastructure.llm.base import DoneEvent, TextDeltaEvent
+
+
+def _config() -> MagicMock:
+    config = MagicMock()
+    config.session_summarize = True
+    config.get_effective_api_key.return_value = "sk-test"
+    config.extract_model = "gpt-4o-mini"
+    return config
+
+
+class _Provider:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def stream(self, messages, **kwargs):
+        self.prompts.append(messages[0].content)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        yield TextDeltaEvent(content="要約")
+        yield DoneEvent(full_content="要約")
+
+
+class TestSummarizeAndStore:
+    async def test_short_conversation_is_one_call(self):
+        provider = _Provider()
+        ctx = MagicMock()
+        turns = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+        with patch.object(summarizer, "get_provider", return_value=provider):
+            assert await summarize_and_store(ctx, _config(), turns) == "要約"
+        assert len(provider.prompts) == 1
+        assert "User: hi\nAssistant: hello" in provider.prompts[0]
+        ctx.memory_service.create_memory.assert_called_once()
+
+    async def test_long_conversation_summarized_in_batches_then_merged(self):
+        provider = _Provider()
+        turns = [{"role": "user", "content": f"{i:03d}" + "x" * 400} for i in range(20)]
+        with patch.object(summarizer, "get_provider", return_value=provider):
+            assert await summarize_and_store(MagicMock(), _config(), turns) == "要約"
+
+        *batch_prompts, merge_prompt = provider.prompts
+        assert len(batch_prompts) > 1
+        lines = [line for p in batch_prompts for line in p.splitlines() if line.startswith("User: ")]
+        assert [line[6:9] for line in lines] == [f"{i:03d}" for i in range(20)]
+        for p in batch_prompts:
+            assert (
+                sum(len(line) for line in p.splitlines() if line.startswith("User: ")) <= summarizer._INPUT_CHAR_BUDGET
+            )
+        assert "区切りごとの要約" in merge_prompt
+
+    async def test_batch_calls_run_concurrently_within_limit(self):
+        provider = _Provider(delay=0.02)
+        turns = [{"role": "user", "content": "x" * 400} for _ in range(100)]
+        with (
+            patch.object(summarizer, "get_provider", return_value=provider),
+            patch.object(summarizer, "_MAX_CONCURRENT_CALLS", 2),
+        ):
+            assert await summarize_and_store(MagicMock(), _config(), turns) == "要約"
+        assert len(provider.prompts) == len(summarizer._pack_turns(turns)) + 1
+        assert provider.max_in_flight == 2
+
+    async def test_partials_merged_hierarchically_keeping_newest_turns(self):
+        provider = _Provider()
+        turns = [{"role": "user", "content": f"turn{i:02d}"} for i in range(12)]
+        with (
+            patch.object(summarizer, "get_provider", return_value=provider),
+            patch.object(summarizer, "_INPUT_CHAR_BUDGET", 10),
+        ):
+            assert await summarize_and_store(MagicMock(), _config(), turns) == "要約"
+
+        # one call per turn, 12 partials merged five at a time, then the final merge
+        batch_prompts = provider.prompts[:12]
+        assert len(provider.prompts) == 12 + 3 + 1
+        assert any("User: turn11" in p for p in batch_prompts)
+        assert all("区切りごとの要約" in p for p in provider.prompts[12:])
+
+    async def test_timeout_skips_summary(self):
+        ctx = MagicMock()
+        with (
+            patch.object(summarizer, "get_provider", return_value=_Provider(delay=1.0)),
+            patch.object(summarizer, "_TIMEOUT_SECONDS", 0.01),
+        ):
+            assert await summarize_and_store(ctx, _config(), [{"role": "user", "content": "hi"}]) is None
+        ctx.memory_service.create_memory.assert_not_called()
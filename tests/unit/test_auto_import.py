@@ -5,6 +5,8 @@ from __future__ import annotations
 import contextlib
 import logging
 import shutil
+import sqlite3
+import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -88,6 +90,60 @@ def test_empty_directory_returns_empty(import_settings):
     assert result == {}
 
 
+def _write_empty_zip(import_dir: Path, persona: str) -> None:
+    db_path = import_dir / "memory.sqlite"
+    sqlite3.connect(str(db_path)).close()
+    with zipfile.ZipFile(import_dir / f"{persona}.zip", "w") as zf:
+        zf.write(db_path, arcname="memory.sqlite")
+    db_path.unlink()
+
+
+def test_import_shares_the_persona_context_connection(import_settings, monkeypatch):
+    """レジストリが同じDBを指すなら、インポートとベクトル同期はコンテキストの接続を共有し、DBを一度だけ開く。"""
+    from nous.application import auto_import, use_cases
+    from nous.application.use_cases import AppContextRegistry
+
+    # no background model download for the context this test registers
+    monkeypatch.setattr(import_settings.reranker, "enabled", False)
+    opened: list[str] = []
+    real_connection = use_cases.SQLiteConnection
+
+    def counting_connection(data_dir, persona):
+        opened.append(persona)
+        return real_connection(data_dir, persona)
+
+    monkeypatch.setattr(use_cases, "SQLiteConnection", counting_connection)
+    monkeypatch.setattr(auto_import, "SQLiteConnection", counting_connection)
+    _write_empty_zip(Path(import_settings.import_dir), "tiny")
+
+    result = run_auto_import(import_settings)
+
+    assert "tiny" in result
+    assert opened == ["tiny"]
+    # the context's connection is left open
+    ctx = AppContextRegistry.get("tiny")
+    assert ctx.connection.get_memory_db().execute("SELECT COUNT(*) FROM memories").fetchone()[0] == 0
+
+
+def test_import_uses_the_given_settings_not_the_registry(import_settings, tmp_path, monkeypatch):
+    """レジストリが別の設定でも、インポートは引数の settings の data_dir に行う。"""
+    from nous.application.use_cases import AppContextRegistry
+
+    other = Settings(data_root=str(tmp_path / "other"))
+    monkeypatch.setattr(other.reranker, "enabled", False)
+    AppContextRegistry.configure(other)
+    _write_empty_zip(Path(import_settings.import_dir), "tiny")
+
+    result = run_auto_import(import_settings)
+
+    assert "tiny" in result
+    imported = sqlite3.connect(str(Path(import_settings.data_dir) / "tiny" / "memory.sqlite"))
+    try:
+        assert imported.execute("SELECT COUNT(*) FROM memories").fetchone()[0] == 0
+    finally:
+        imported.close()
+
+
 @pytest.mark.skipif(not _zip_available("herta"), reason="herta.zip not found")
 def test_imports_single_zip(import_settings):
     """単一zipインポート: herta.zip → memories=167, done/に移動。"""
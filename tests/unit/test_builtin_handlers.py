@@ -11,6 +11,7 @@ from nous.application.chat.tools.builtin import (
     _handle_execute_code,
     _handle_image_generate,
     _handle_search,
+    execute_tool,
 )
 from nous.application.sandbox.service import ExecResult
 
@@ -737,3 +738,30 @@ class TestSearchHandler:
         assert result["status"] == "ok"
         assert result["count"] == 0
         assert result["results"] == []
+
+
+# ===================================================================
+# Shared MCP tools
+# ===================================================================
+
+
+class TestSharedMemorySearch:
+    @pytest.mark.asyncio
+    async def test_memory_search_uses_structured_payload(self, mock_ctx, mock_config):
+        """memory_search results reach the chat loop without a JSON round trip."""
+        from datetime import UTC, datetime
+
+        from nous.domain.memory.entities import Memory
+        from nous.domain.search.engine import SearchResult
+        from nous.domain.shared.result import Success
+
+        now = datetime.now(UTC)
+        memory = Memory(key="mem_tea", content="green tea", created_at=now, updated_at=now)
+        mock_ctx.search_engine.search.return_value = Success([SearchResult(memory=memory, score=0.5, source="fts")])
+        mock_ctx.memory_service.count_memories.return_value = Success(1)
+
+        with patch("nous.application.chat.tools.builtin.json.loads", side_effect=AssertionError("parsed")):
+            result = await execute_tool(mock_ctx, mock_config, "memory_search", {"query": "tea"})
+
+        assert result["status"] == "ok"
+        assert [m["key"] for m in result["memories"]] == ["mem_tea"]
@@ -243,6 +243,14 @@ class TestComputeRecencyDecay:
         old_decay = _compute_recency_decay(old)
         assert recent_decay > old_decay
 
+    def test_explicit_now_matches_wall_clock_for_naive_utc(self):
+        """Passing now_ts gives the same decay as reading the clock, naive datetimes as UTC."""
+        import math
+
+        now = datetime(2025, 6, 15, 12, 0, tzinfo=UTC)
+        naive = datetime(2025, 6, 13, 12, 0)
+        assert _compute_recency_decay(naive, now.timestamp()) == pytest.approx(math.exp(-0.5 * 2))
+
 
 # ──────────────────────────────────────────────
 # PrepareStep — _build_context_section tier structure
@@ -374,6 +382,42 @@ class TestBuildContextSectionTierContent:
         assert "元気" in result
         assert "強い" in result  # intensity 0.8 > 0.6 → "強い"
 
+    @pytest.mark.asyncio
+    async def test_tier1_times_share_one_clock_read(self):
+        """The Now line, relative label and elapsed note should all come from one get_now() call."""
+        from unittest.mock import MagicMock, patch
+
+        from nous.application.chat.pipeline.prepare import _build_context_section
+
+        ctx = MagicMock()
+        ctx.persona = "test"
+        ctx.memory_service.get_by_tags.return_value.is_ok = False
+        ctx.persona_service.get_emotion_history.return_value.is_ok = False
+        ctx.equipment_service.get_equipment.return_value.is_ok = False
+
+        now = datetime(2025, 6, 15, 14, 30, tzinfo=UTC)
+        state = MagicMock()
+        state.last_conversation_time = now - timedelta(hours=30)
+        state.emotion = None
+        state.mental_state = None
+        state.speech_style = None
+        state.physical_state = None
+        state.environment = None
+        state.relationship_status = None
+        state.user_info = {}
+        state.persona_info = {}
+        state.fatigue = None
+        state.pain = None
+        state.arousal = None
+
+        with patch("nous.application.chat.pipeline.prepare.get_now", return_value=now) as clock:
+            result = await _build_context_section(ctx, state)
+
+        assert "Now: 2025-06-15 14:30" in result
+        assert "Last conversation: 1d ago" in result
+        assert "About 1 day(s) since last conversation." in result
+        clock.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_tier2_body_metrics_and_environment(self):
         """Tier2 should include body metrics and environment when present."""
@@ -562,6 +606,109 @@ class TestRunAutoCapture:
         assert result == []
 
 
+# ──────────────────────────────────────────────
+# PostProcessStep — session summary overlaps MemoryLLM
+# ──────────────────────────────────────────────
+
+
+class TestPostProcessStepSummaryOverlap:
+    @pytest.mark.asyncio
+    async def test_summary_runs_alongside_memory_llm(self):
+        """退避ターンの要約は MemoryLLM と並行して走り、その後 SessionSummarizedSSE が送られる."""
+        import asyncio
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock, patch
+
+        from nous.application.chat.events import MemoryActivitySSE, SessionSummarizedSSE
+        from nous.application.chat.pipeline.post import PostProcessStep
+
+        memory_llm_started = asyncio.Event()
+
+        async def summarize(ctx, config, turns):
+            # Would deadlock if MemoryLLM only started after this summary finished
+            await asyncio.wait_for(memory_llm_started.wait(), timeout=2.0)
+            return "summary"
+
+        async def memory_llm(ctx, config, payload):
+            memory_llm_started.set()
+            return {}
+
+        class _Session:
+            evict_callback = None
+            _messages: list = []
+
+            def add(self, role, content, ts, tool_calls=None):
+                if role == "user" and self.evict_callback:
+                    self.evict_callback([{"role": "user", "content": "old"}])
+
+        ctx = MagicMock()
+        ctx.settings.auto_capture.enabled = False
+        ctx.memory_service.get_by_tags.return_value = Success([])
+        config = SimpleNamespace(
+            session_summarize=True,
+            auto_extract=True,
+            housekeeping_threshold=10,
+            reflection_enabled=False,
+            mental_model_enabled=False,
+        )
+        turn_ctx = ChatTurnContext(session_id="s", user_message="hi")
+        turn_ctx.full_response = "hello"
+
+        with (
+            patch("nous.application.chat.pipeline.post._do_summarize", side_effect=summarize),
+            patch("nous.application.chat.pipeline.post.run_memory_llm", side_effect=memory_llm),
+        ):
+            events = [e async for e in PostProcessStep().run(ctx, config, _Session(), turn_ctx)]
+
+        kinds = [type(e) for e in events]
+        assert kinds.index(SessionSummarizedSSE) < kinds.index(MemoryActivitySSE)
+
+
+# ──────────────────────────────────────────────
+# Skills section — PromptBuildStep
+# ──────────────────────────────────────────────
+
+
+class TestPromptBuildStepSkills:
+    """The skill list section is memoized until the skills table changes."""
+
+    def test_section_reused_until_skill_edited(self):
+        import sqlite3
+        from unittest.mock import MagicMock, patch
+
+        from nous.application.chat.pipeline import prompt
+        from nous.domain.skill import Skill, SkillRepository
+        from nous.infrastructure.sqlite.connection import _SKILLS_SCHEMA
+
+        db = sqlite3.connect(":memory:")
+        db.row_factory = sqlite3.Row
+        db.executescript(_SKILLS_SCHEMA)
+        repo = SkillRepository(db)
+        saved = repo.save(Skill(name="tea", description="Brew tea", content="..."))
+
+        config = MagicMock()
+        config.system_prompt = "Base."
+        config.enabled_skills = ["tea"]
+
+        def build() -> str:
+            turn_ctx = MagicMock(context_section="", related_memories="", author_note=None)
+            prompt.PromptBuildStep().run(MagicMock(), config, turn_ctx)
+            return turn_ctx.system_prompt
+
+        prompt._skills_section.cache_clear()
+        with (
+            patch.object(prompt, "get_global_skills_db", return_value=db),
+            patch.object(SkillRepository, "get", autospec=True, side_effect=SkillRepository.get) as get,
+        ):
+            assert "- tea: Brew tea" in build()
+            assert "- tea: Brew tea" in build()
+            assert get.call_count == 1
+            repo.save(saved.model_copy(update={"description": "Brew green tea"}))
+            assert "- tea: Brew green tea" in build()
+            assert get.call_count == 2
+        prompt._skills_section.cache_clear()
+
+
 # ──────────────────────────────────────────────
 # Author's Note — PromptBuildStep
 # ──────────────────────────────────────────────
@@ -938,3 +1085,52 @@ class TestDynamicTemperatureInference:
 
         result = EmotionDrivenSampler.compute(0.7, "neutral", 0.9, scale=0.2)
         assert result == pytest.approx(0.7, rel=1e-3)
+
+
+class TestInferenceResponseAssembly:
+    """ストリームのテキスト断片が full_response に連結される。"""
+
+    @staticmethod
+    def _setup(events):
+        from unittest.mock import MagicMock
+
+        async def _mock_stream(**kwargs):
+            for event in events:
+                yield event
+
+        provider = MagicMock()
+        provider.stream = _mock_stream
+        config = MagicMock()
+        config.get_effective_api_key.return_value = "test-key"
+        config.max_tool_calls = 0
+        config.top_p = None
+        turn_ctx = ChatTurnContext(session_id="s", user_message="test")
+        return provider, config, turn_ctx
+
+    @pytest.mark.asyncio
+    async def test_deltas_joined_into_full_response(self):
+        from unittest.mock import MagicMock, patch
+
+        from nous.application.chat.pipeline.inference import InferenceStep
+        from nous.infrastructure.llm.base import TextDeltaEvent
+
+        provider, config, turn_ctx = self._setup([TextDeltaEvent(content=c) for c in ("Hel", "lo", "!")])
+        with patch("nous.application.chat.pipeline.inference.get_provider", return_value=provider):
+            events = [e async for e in InferenceStep().run(MagicMock(), config, [], turn_ctx, MagicMock())]
+
+        assert [e.content for e in events] == ["Hel", "lo", "!"]
+        assert turn_ctx.full_response == "Hello!"
+
+    @pytest.mark.asyncio
+    async def test_partial_text_kept_on_stream_error(self):
+        from unittest.mock import MagicMock, patch
+
+        from nous.application.chat.pipeline.inference import InferenceStep
+        from nous.infrastructure.llm.base import ErrorEvent, TextDeltaEvent
+
+        provider, config, turn_ctx = self._setup([TextDeltaEvent(content="par"), ErrorEvent(message="boom")])
+        with patch("nous.application.chat.pipeline.inference.get_provider", return_value=provider):
+            events = [e async for e in InferenceStep().run(MagicMock(), config, [], turn_ctx, MagicMock())]
+
+        assert isinstance(events[-1], ErrorSSE)
+        assert turn_ctx.full_response == "par"
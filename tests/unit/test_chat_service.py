@@ -359,6 +359,16 @@ class TestChatConfigRepository:
         loaded = repo.get("p1")
         assert loaded.top_p is None
 
+    def test_get_adds_missing_late_columns(self):
+        db = self._make_db()
+        db.execute("ALTER TABLE chat_settings DROP COLUMN top_p")
+        repo = ChatConfigRepository(db)
+        cfg = repo.get("p1")
+        columns = {row[1] for row in db.execute("PRAGMA table_info(chat_settings)")}
+        assert {"top_p", "debug_mode", "searxng_url", "enable_memory_tools"} <= columns
+        assert cfg.top_p is None
+        assert cfg.debug_mode is False
+
 
 # ─────────────────────────────────────────────────────────────
 # _sse helper tests
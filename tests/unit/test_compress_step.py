@@ -91,6 +91,16 @@ class TestTokenCounter:
     def test_get_model_max_unknown(self):
         assert TokenCounter.get_model_max_tokens("unknown-model-xyz") == 128_000
 
+    def test_get_model_max_prefers_longest_key(self):
+        assert TokenCounter.get_model_max_tokens("gpt-4") == 8_192
+        assert TokenCounter.get_model_max_tokens("gpt-4-turbo-preview") == 128_000
+
+    def test_get_model_max_memoized_per_name(self):
+        TokenCounter.get_model_max_tokens("anthropic/claude-sonnet-4-5")
+        hits = TokenCounter.get_model_max_tokens.cache_info().hits
+        assert TokenCounter.get_model_max_tokens("anthropic/claude-sonnet-4-5") == 200_000
+        assert TokenCounter.get_model_max_tokens.cache_info().hits == hits + 1
+
     def test_heuristic_vs_tiktoken_rough_agreement(self):
         """Verify heuristic is within sane bounds for various inputs."""
         tc = TokenCounter()
@@ -18,10 +18,12 @@ class MockVectorStore:
         self._results = results or []
         self._error = error
 
-    def search(self, persona: str, query: str, limit: int = 10):
+    def search(self, persona: str, query: str, limit: int = 10, score_threshold: float | None = None):
         if self._error:
             return Failure(VectorStoreError("Connection failed"))
-        return Success(self._results)
+        if score_threshold is None:
+            return Success(self._results)
+        return Success([(k, s) for k, s in self._results if s >= score_threshold])
 
 
 # ---------------------------------------------------------------------------
@@ -144,3 +146,14 @@ class TestContradictionDetector:
         result = detector.find_potential_contradictions("my query", "persona1")
         assert result.is_ok
         assert result.value.query_content == "my query"
+
+    def test_threshold_pushed_to_vector_store(self):
+        """閾値はベクトルストアの検索に渡される"""
+        from unittest.mock import MagicMock
+
+        store = MagicMock()
+        store.search.return_value = Success([("mem_1", 0.9)])
+        detector = ContradictionDetector(vector_store=store, threshold=0.8)
+        result = detector.find_potential_contradictions("test", "persona1")
+        store.search.assert_called_once_with("persona1", "test", limit=10, score_threshold=0.8)
+        assert [c.memory_key for c in result.value.candidates] == ["mem_1"]
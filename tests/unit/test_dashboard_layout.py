@@ -0,0 +1,21 @@
+"""Tests for composing the dashboard HTML shell."""
+
+from __future__ import annotations
+
+from nous import __version__
+from nous.api.http.sections.base import render_layout_shell
+
+
+class TestRenderLayoutShell:
+    def test_embeds_sections_in_page_order(self):
+        html = render_layout_shell("<nav>N</nav>", "<section>T</section>", "console.log(`${x}`);")
+        assert html.startswith("<!DOCTYPE html>\n")
+        assert html.endswith("</html>")
+        assert f"<h1>Nous v{__version__} Dashboard</h1>" in html
+        nav, tabs, js = (html.index(s) for s in ("<nav>N</nav>", "<section>T</section>", "console.log(`${x}`);"))
+        assert nav < tabs < js
+        assert "__INITIAL_PERSONA__" not in html
+
+    def test_initial_persona_is_escaped(self):
+        html = render_layout_shell("", "", "", initial_persona='a"<b>&')
+        assert '<script>window.__INITIAL_PERSONA__="a\\"b";</script>' in html
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
 from nous.application.workers.decay_worker import DecayWorker
@@ -20,7 +20,7 @@ def _make_strength(key: str, strength: float = 0.8, use_old_decay: bool = False)
 def _make_ctx(strengths: list[MemoryStrength], min_strength: float = 0.01) -> MagicMock:
     ctx = MagicMock()
     ctx.memory_repo.get_all_strengths.return_value = MagicMock(is_ok=True, value=strengths)
-    ctx.memory_repo.save_strength.return_value = MagicMock(is_ok=True)
+    ctx.memory_repo.save_strengths.return_value = MagicMock(is_ok=True)
     ctx.settings.forgetting.min_strength = min_strength
     return ctx
 
@@ -35,7 +35,9 @@ class TestDecayWorker:
         worker = DecayWorker(ctx, interval_seconds=3600)
         worker._decay_cycle()
 
-        assert ctx.memory_repo.save_strength.call_count == 2
+        ctx.memory_repo.save_strengths.assert_called_once()
+        (saved,) = ctx.memory_repo.save_strengths.call_args.args
+        assert [s.memory_key for s in saved] == ["mem_001", "mem_002"]
 
     def test_decay_cycle_skips_below_min_strength(self) -> None:
         """compute_recall が min_strength 未満の場合はスキップする"""
@@ -47,7 +49,7 @@ class TestDecayWorker:
         worker = DecayWorker(ctx, interval_seconds=3600)
         worker._decay_cycle()
 
-        ctx.memory_repo.save_strength.assert_not_called()
+        ctx.memory_repo.save_strengths.assert_not_called()
 
     def test_decay_cycle_handles_repo_error(self) -> None:
         """get_all_strengths が失敗しても例外を投げない"""
@@ -65,3 +67,13 @@ class TestDecayWorker:
         assert worker._running is True
         worker.stop()
         assert worker._running is False
+
+    def test_decay_cycle_handles_recalled_memory(self) -> None:
+        """last_recall (tz-aware) を持つ記憶でも decay が計算される"""
+        strength = _make_strength("mem_001")
+        strength.last_recall = get_now() - timedelta(days=1)
+        ctx = _make_ctx([strength])
+
+        DecayWorker(ctx, interval_seconds=3600)._decay_cycle()
+
+        ctx.memory_repo.save_strengths.assert_called_once()
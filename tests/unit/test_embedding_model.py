@@ -0,0 +1,47 @@
+"""Tests for EmbeddingModel's query-vector cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from nous.infrastructure.embedding import model as model_module
+from nous.infrastructure.embedding.model import EmbeddingModel
+
+
+@pytest.fixture
+def embedding():
+    emb = EmbeddingModel()
+    emb._model = MagicMock()
+    emb._model.encode.side_effect = lambda text, **kw: np.array([float(len(text)), 1.0])
+    emb._dimension = 2
+    return emb
+
+
+class TestQueryCache:
+    def test_repeated_query_skips_model(self, embedding):
+        first = embedding.encode("tea", is_query=True)
+        second = embedding.encode("tea", is_query=True)
+        assert second is first
+        assert embedding._model.encode.call_count == 1
+        with pytest.raises(ValueError):
+            first[0] = 0.0
+
+    def test_documents_not_cached(self, embedding):
+        embedding.encode("tea")
+        embedding.encode("tea")
+        assert embedding._model.encode.call_count == 2
+
+    def test_lru_eviction(self, embedding):
+        with patch.object(model_module, "_QUERY_CACHE_SIZE", 2):
+            for text in ("a", "b", "a", "c"):
+                embedding.encode(text, is_query=True)
+        assert list(embedding._query_cache) == ["a", "c"]
+
+    def test_reload_clears_cache(self, embedding):
+        embedding.encode("tea", is_query=True)
+        with patch.object(EmbeddingModel, "_load_model"):
+            embedding.reload_model()
+        assert len(embedding._query_cache) == 0
@@ -183,6 +183,22 @@ class TestActiveCommitmentsDisplay:
         assert "G1" in output
         assert "ACTIVE COMMITMENTS" in output
 
+    def test_ages_share_one_clock_read(self):
+        """期限表示はすべて 1 回の get_now() を基準にする。"""
+        from datetime import timedelta
+        from unittest.mock import patch
+
+        now = get_now()
+        goal = self._make_goal("G1")
+        goal.created_at = now - timedelta(days=3)
+        promise = self._make_promise("P1")
+        promise.created_at = now - timedelta(hours=2)
+        with patch("nous.api.mcp._tools_helpers.get_now", return_value=now) as clock:
+            output = self._fmt([goal], [promise])
+        clock.assert_called_once()
+        assert "🎯 G1 (3d ago)" in output
+        assert "🤝 P1 (2h ago)" in output
+
     def test_empty_goals_and_promises_show_no_commitments_section(self):
         """goals/promises が空のとき ACTIVE COMMITMENTS セクションは現れない。"""
         output = self._fmt([], [])
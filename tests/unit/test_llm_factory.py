@@ -0,0 +1,32 @@
+"""Tests for LLM provider construction and per-event-loop reuse."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nous.infrastructure.llm.factory import get_provider
+from nous.infrastructure.llm.openai_compat import OpenAICompatProvider
+
+
+class TestGetProvider:
+    async def test_reused_within_running_loop(self):
+        first = get_provider("openai", "sk-test", "gpt-4o")
+        assert isinstance(first, OpenAICompatProvider)
+        assert get_provider("openai", "sk-test", "gpt-4o") is first
+        assert get_provider("openai", "sk-test", "gpt-4o-mini") is not first
+        assert get_provider("openrouter", "sk-test", "gpt-4o") is not first
+
+    def test_not_shared_across_loops(self):
+        async def build():
+            return get_provider("openai", "sk-test", "gpt-4o")
+
+        assert asyncio.run(build()) is not asyncio.run(build())
+
+    def test_outside_loop_builds_fresh_instance(self):
+        assert get_provider("openai", "sk-test", "gpt-4o") is not get_provider("openai", "sk-test", "gpt-4o")
+
+    def test_unknown_provider_raises(self):
+        with pytest.raises(ValueError, match="Unknown LLM provider"):
+            get_provider("nope", "k", "m")
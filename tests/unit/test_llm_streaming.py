@@ -0,0 +1,61 @@
+"""Tests for assembling streamed LLM output in the provider adapters."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from nous.infrastructure.llm.base import DoneEvent, TextDeltaEvent, ToolCallEvent
+from nous.infrastructure.llm.openai_compat import OpenAICompatProvider
+
+
+class _FakeStream:
+    def __init__(self, chunks: list) -> None:
+        self._chunks = chunks
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _chunk(content: str | None = None, tool_calls: list | None = None):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content, tool_calls=tool_calls))])
+
+
+def _tool_chunk(arguments: str, name: str | None = None, call_id: str | None = None):
+    function = SimpleNamespace(name=name, arguments=arguments)
+    return _chunk(tool_calls=[SimpleNamespace(index=0, id=call_id, function=function)])
+
+
+class TestOpenAICompatStream:
+    async def test_joins_text_and_tool_argument_fragments(self):
+        chunks = [
+            _chunk("Hel"),
+            _chunk("lo"),
+            _tool_chunk('{"query": ', name="memory_search", call_id="call_1"),
+            _tool_chunk('"tea"}'),
+        ]
+
+        async def create(**kwargs):
+            return _FakeStream(chunks)
+
+        provider = OpenAICompatProvider.__new__(OpenAICompatProvider)
+        provider.model = "test"
+        provider._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        events = [e async for e in provider.stream([], system="sys")]
+        assert [e.content for e in events if isinstance(e, TextDeltaEvent)] == ["Hel", "lo"]
+        (tool_call,) = [e for e in events if isinstance(e, ToolCallEvent)]
+        assert tool_call.tool_name == "memory_search"
+        assert tool_call.tool_input == {"query": "tea"}
+        done = events[-1]
+        assert isinstance(done, DoneEvent)
+        assert done.full_content == "Hello"
@@ -167,6 +167,24 @@ class TestUpdateContext:
             result = await update_context(user_info={"name": "Alice", "nickname": "Ali"})
         assert "user_info updated" in result
 
+    @pytest.mark.asyncio
+    async def test_persona_info_goals_read_active_goals_once(self, registered_tools):
+        tools, ctx, _ = registered_tools
+        existing = _mem("goal_1", "Learn piano")
+        ctx.memory_service.get_by_tags.return_value = Success([existing])
+        ctx.persona_service.update_persona_info.return_value = Success(None)
+        update_context = tools["update_context"]
+        with (
+            patch("nous.api.mcp.tools.AppContextRegistry") as mock_reg_cls,
+            patch("nous.api.mcp.tools.get_current_persona", return_value="test_persona"),
+        ):
+            mock_reg_cls.get.return_value = ctx
+            await update_context(persona_info={"goals": ["Learn piano", "Run 10k", "Run 10k", "Read more"]})
+        ctx.memory_service.get_by_tags.assert_called_once_with(["goal", "active"])
+        saved = [call.args[0] for call in ctx.memory_service.save_memory.call_args_list]
+        assert [m.content for m in saved] == ["Run 10k", "Read more"]
+        assert all(m.tags == ["goal", "active"] and m.emotion == "anticipation" for m in saved)
+
 
 # ---------------------------------------------------------------------------
 # get_context()
@@ -384,3 +402,18 @@ class TestGetContext:
         assert "CURRENT STATE" in result
         assert "joy" in result
         assert "faded" not in result.lower()
+
+
+class TestOneLineSnippet:
+    def test_short_content_flattened(self):
+        from nous.api.mcp._tools_helpers import _one_line_snippet
+
+        assert _one_line_snippet("line1\nline2") == "line1 line2"
+
+    def test_long_content_truncated_to_width(self):
+        from nous.api.mcp._tools_helpers import _one_line_snippet
+
+        snippet = _one_line_snippet("a\nb" * 200)
+        assert len(snippet) == 100
+        assert snippet.endswith("...")
+        assert "\n" not in snippet
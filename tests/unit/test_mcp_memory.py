@@ -234,6 +234,16 @@ class TestMemoryRead:
         assert result["memories"][1]["key"] == "k2"
         assert result["total_count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_read_recent_pushes_offset_to_service(self, registered_tools):
+        tools, ctx, _ = registered_tools
+        ctx.memory_service.get_recent.return_value = Success([_mem("k3")])
+        ctx.memory_service.count_memories.return_value = Success(5)
+        memory_read = tools["memory_read"]
+        result = json.loads(await memory_read(limit=1, offset=2))
+        ctx.memory_service.get_recent.assert_called_once_with(limit=1, offset=2)
+        assert [m["key"] for m in result["memories"]] == ["k3"]
+
     @pytest.mark.asyncio
     async def test_read_by_key_not_found(self, registered_tools):
         tools, ctx, _ = registered_tools
@@ -317,6 +327,20 @@ class TestMemoryUpdate:
         assert data["ok"] is True
         assert data["key"] == "mem_001"
 
+    @pytest.mark.asyncio
+    async def test_update_resolves_key_from_query(self, mock_app_context):
+        import json
+
+        from nous.api.mcp._tools_memory import _tool_memory_update
+
+        ctx = mock_app_context
+        ctx.search_engine.search.return_value = Success([_search_result("mem_found")])
+        ctx.memory_service.update_memory.return_value = Success(_mem("mem_found"))
+        result = await _tool_memory_update(ctx, "test_persona", query="tea", new_content="green tea")
+        data = json.loads(result)
+        assert data == {"ok": True, "key": "mem_found"}
+        ctx.memory_service.update_memory.assert_called_once_with("mem_found", content="green tea")
+
     @pytest.mark.asyncio
     async def test_update_requires_key(self, registered_tools):
         tools, ctx, _ = registered_tools
@@ -446,6 +470,25 @@ class TestMemorySearch:
         assert data["memories"][0]["score"] == 1.0  # normalized to max score
         assert data["total_count"] == 42
 
+    @pytest.mark.asyncio
+    async def test_search_runs_off_event_loop(self, registered_tools):
+        import threading
+
+        tools, ctx, _ = registered_tools
+        search_threads: list[int] = []
+
+        def search(query):
+            search_threads.append(threading.get_ident())
+            return Success([_search_result()])
+
+        ctx.search_engine.search.side_effect = search
+        ctx.memory_service.count_memories.return_value = Success(1)
+        result = await tools["memory_search"](query="test")
+
+        assert json.loads(result)["ok"] is True
+        assert search_threads and search_threads[0] != threading.get_ident()
+        ctx.memory_service.log_search.assert_called_once_with("test", "hybrid", 1)
+
     @pytest.mark.asyncio
     async def test_search_no_results(self, registered_tools):
         tools, ctx, _ = registered_tools
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -598,3 +599,26 @@ class TestSandboxFiles:
         data = json.loads(result)
         assert data["ok"] is False
         assert "content is required" in data["error"]
+
+    @pytest.mark.asyncio
+    async def test_append_extends_existing_file(self, registered_tools):
+        """Append should write the existing bytes followed by the new content."""
+        tools, ctx, _ = registered_tools
+        sf_tool = tools["sandbox_files"]
+
+        with (
+            patch("nous.config.settings.get_settings") as mock_get_settings,
+            patch("nous.application.sandbox.service.get_sandbox_session") as mock_get_session,
+        ):
+            mock_get_settings.return_value = _mock_settings(enabled=True)
+            session = _mock_sandbox_session()
+            session.read_file.return_value = b"hello "
+            session.execute.return_value = ExecResult(stdout="appended 11 total bytes", stderr="", exit_code=0)
+            mock_get_session.return_value = session
+
+            result = await sf_tool(operation="append", path="/home/sbox_test_persona/test.txt", content="world")
+
+        data = json.loads(result)
+        assert data["ok"] is True
+        assert data["stdout"] == "appended 11 total bytes"
+        assert repr(base64.b64encode(b"hello world").decode()) in session.execute.call_args.args[0]
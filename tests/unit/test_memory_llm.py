@@ -443,6 +443,7 @@ class TestBuildMemoryLLMContext:
         goal_mem.key = "goal_001"
         goal_mem.content = "毎日ランニングする"
         goal_mem.id = None
+        goal_mem.tags = ["goal", "active"]
 
         def get_by_tags_side_effect(tags):
             if tags == ["goal", "active"]:
@@ -476,9 +477,10 @@ class TestBuildMemoryLLMContext:
         ip_mem.key = "ip_001"
         ip_mem.content = "明日までに本を返す"
         ip_mem.id = None
+        ip_mem.tags = ["goal", "active", "interpersonal"]
 
         def get_by_tags_side_effect(tags):
-            if tags == ["goal", "active", "interpersonal"]:
+            if tags == ["goal", "active"]:
                 return Success([ip_mem])
             return Success([])
 
@@ -508,17 +510,17 @@ class TestBuildMemoryLLMContext:
         goal_mem.key = "goal_001"
         goal_mem.content = "毎日勉強"
         goal_mem.id = None
+        goal_mem.tags = ["goal", "active"]
 
         ip_mem = MagicMock()
         ip_mem.key = "ip_001"
         ip_mem.content = "約束を守る"
         ip_mem.id = None
+        ip_mem.tags = ["goal", "active", "interpersonal"]
 
         def get_by_tags_side_effect(tags):
             if tags == ["goal", "active"]:
-                return Success([goal_mem])
-            elif tags == ["goal", "active", "interpersonal"]:
-                return Success([ip_mem])
+                return Success([goal_mem, ip_mem])
             return Success([])
 
         mock_ctx.memory_service.get_by_tags.side_effect = get_by_tags_side_effect
@@ -528,8 +530,11 @@ class TestBuildMemoryLLMContext:
         context_str, commitments_str, inventory_str = await _build_memory_llm_context(mock_ctx)
 
         assert "ユーザーA" in context_str
-        assert "goal_001" in commitments_str
-        assert "ip_001" in commitments_str
+        assert "[goal (self)] key=goal_001" in commitments_str
+        assert "[goal (interpersonal)] key=ip_001" in commitments_str
+        # interpersonal goals are a subset of goal+active: one query, listed once
+        assert commitments_str.count("ip_001") == 1
+        mock_ctx.memory_service.get_by_tags.assert_called_once_with(["goal", "active"])
 
     @pytest.mark.asyncio
     async def test_context_with_equipment(self, mock_ctx):
@@ -574,29 +579,28 @@ class TestBuildMemoryLLMContext:
         state.environment = ""
         mock_ctx.persona_service.get_context.return_value = Success(state)
 
-        # 5 self goals max
+        # 6 of each: only 5 per scope make it into the prompt
         goals = []
-        for i in range(5):
+        for i in range(6):
             g = MagicMock()
             g.key = f"goal_{i:03d}"
             g.content = f"目標{i + 1}: テスト"
             g.id = None
+            g.tags = ["goal", "active"]
             goals.append(g)
 
-        # 5 interpersonal goals max
         ip_goals = []
-        for i in range(5):
+        for i in range(6):
             p = MagicMock()
             p.key = f"ip_{i:03d}"
             p.content = f"約束{i + 1}: テスト"
             p.id = None
+            p.tags = ["goal", "active", "interpersonal"]
             ip_goals.append(p)
 
         def get_by_tags_side_effect(tags):
             if tags == ["goal", "active"]:
-                return Success(goals)
-            elif tags == ["goal", "active", "interpersonal"]:
-                return Success(ip_goals)
+                return Success([m for pair in zip(ip_goals, goals, strict=True) for m in pair])
             return Success([])
 
         mock_ctx.memory_service.get_by_tags.side_effect = get_by_tags_side_effect
@@ -605,11 +609,14 @@ class TestBuildMemoryLLMContext:
 
         context_str, commitments_str, inventory_str = await _build_memory_llm_context(mock_ctx)
 
-        # Commitments should contain all 10 entries
+        # Commitments should contain 10 entries, self goals first
         assert "goal_000" in commitments_str
         assert "goal_004" in commitments_str
         assert "ip_000" in commitments_str
         assert "ip_004" in commitments_str
+        assert "goal_005" not in commitments_str
+        assert "ip_005" not in commitments_str
+        assert commitments_str.index("goal_004") < commitments_str.index("ip_000")
         assert context_str == ""
         assert inventory_str == ""
 
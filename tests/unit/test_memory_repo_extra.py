@@ -9,7 +9,7 @@ import pytest
 from nous.domain.memory.entities import Memory
 from nous.domain.shared.time_utils import get_now
 from nous.infrastructure.sqlite.connection import SQLiteConnection
-from nous.infrastructure.sqlite.memory_repo import SQLiteMemoryRepository
+from nous.infrastructure.sqlite.memory_repo import SQLiteMemoryRepository, _parse_keyword_query
 
 
 @pytest.fixture
@@ -39,6 +39,184 @@ def _save_many(repo, count: int, prefix: str = "memory_202501010000") -> list[Me
     return memories
 
 
+class TestFindByKeys:
+    def test_returns_found_memories_by_key(self, repo):
+        _save_many(repo, 3)
+        result = repo.find_by_keys(["memory_20250101000000", "memory_20250101000002", "missing"])
+        assert result.is_ok
+        found = result.unwrap()
+        assert set(found) == {"memory_20250101000000", "memory_20250101000002"}
+        assert found["memory_20250101000002"].content == "memory content 2"
+
+    def test_empty_keys_returns_empty(self, repo):
+        assert repo.find_by_keys([]).unwrap() == {}
+
+    def test_date_bounds_filter_on_created_at(self, repo):
+        now = get_now()
+        for key, days_ago in (("memory_old", 20), ("memory_mid", 10), ("memory_new", 1)):
+            created = now - timedelta(days=days_ago)
+            repo.save(Memory(key=key, content=key, created_at=created, updated_at=created))
+        keys = ["memory_old", "memory_mid", "memory_new"]
+        found = repo.find_by_keys(keys, date_from=now - timedelta(days=15)).unwrap()
+        assert set(found) == {"memory_mid", "memory_new"}
+        found = repo.find_by_keys(keys, date_from=now - timedelta(days=15), date_to=now - timedelta(days=5)).unwrap()
+        assert set(found) == {"memory_mid"}
+
+    def test_sql_built_once_per_shape(self):
+        from nous.infrastructure.sqlite.memory_repo import _find_by_keys_sql
+
+        assert _find_by_keys_sql(3, False, True) is _find_by_keys_sql(3, False, True)
+        assert _find_by_keys_sql(3, False, True).endswith("key IN (?,?,?) AND created_at_ts <= ?")
+
+
+class TestDataVersion:
+    def test_changes_on_write_and_delete(self, repo):
+        before = repo.data_version().unwrap()
+        repo.save(_make_memory("memory_20250101000001", "one"))
+        after_save = repo.data_version().unwrap()
+        assert after_save != before
+        repo.delete("memory_20250101000001")
+        assert repo.data_version().unwrap() != after_save
+
+
+class TestSearchLog:
+    def test_logged_searches_are_returned_newest_first(self, repo):
+        assert repo.log_search("tea", "hybrid", 3).is_ok
+        assert repo.log_search("coffee", "keyword", 0).is_ok
+        assert repo.log_search("juice", "keyword", 1).is_ok
+        db = repo._conn.get_memory_db()
+        # datetime('now') has one-second resolution, so give each search its own time
+        for query, hour in (("tea", 10), ("coffee", 12), ("juice", 11)):
+            db.execute("UPDATE search_log SET searched_at = ? WHERE query = ?", (f"2025-01-01 {hour}:00:00", query))
+        recent = repo.get_recent_searches(limit=2).unwrap()
+        assert [r["query"] for r in recent] == ["coffee", "juice"]
+
+    def test_table_ddl_runs_once(self, repo):
+        repo.log_search("tea", "hybrid", 1)
+        assert repo._search_log_ready
+        repo._conn.get_memory_db().execute("DROP TABLE search_log")
+        assert not repo.log_search("tea", "hybrid", 1).is_ok
+
+
+class TestJsonColumnDecoding:
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def orjson_calls(self, request, monkeypatch):
+        """Calls made to orjson.loads, or None when the stdlib decoder is forced."""
+        from nous.infrastructure.sqlite import memory_repo
+
+        calls: list[str] | None = None
+        if request.param == "orjson":
+            orjson = pytest.importorskip("orjson")
+            calls = []
+
+            class _SpyOrjson:
+                JSONDecodeError = orjson.JSONDecodeError
+
+                @staticmethod
+                def loads(value):
+                    calls.append(value)
+                    return orjson.loads(value)
+
+            monkeypatch.setattr(memory_repo, "_orjson", _SpyOrjson)
+        else:
+            monkeypatch.setattr(memory_repo, "_orjson", None)
+        memory_repo._decode_json_list.cache_clear()
+        memory_repo._decode_json_dict.cache_clear()
+        yield calls
+        memory_repo._decode_json_list.cache_clear()
+        memory_repo._decode_json_dict.cache_clear()
+
+    def test_plain_columns_decoded_by_orjson_when_installed(self, orjson_calls):
+        assert SQLiteMemoryRepository._parse_json_list('["a", "b"]') == ["a", "b"]
+        assert SQLiteMemoryRepository._parse_json_dict('{"k": 1}') == {"k": 1}
+        if orjson_calls is not None:
+            assert orjson_calls == ['["a", "b"]', '{"k": 1}']
+
+    def test_values_orjson_rejects_decode_as_stdlib_json(self, orjson_calls):
+        assert repr(SQLiteMemoryRepository._parse_json_list("[NaN, Infinity]")) == "[nan, inf]"
+        big = 2**70
+        assert SQLiteMemoryRepository._parse_json_list(f"[{big}]") == [big]
+        assert SQLiteMemoryRepository._parse_json_dict(f'{{"n": {big}, "x": NaN}}')["n"] == big
+        assert SQLiteMemoryRepository._parse_json_list("not json") == []
+
+
+class TestParseIsoOrNone:
+    def test_valid_iso_is_parsed(self):
+        parsed = SQLiteMemoryRepository._parse_iso_or_none("2025-01-01T12:00:00+09:00")
+        assert parsed is not None
+        assert parsed.hour == 12
+
+    @pytest.mark.parametrize("value", [None, "", "unknown", "2025/01/01 12:00"])
+    def test_non_iso_shape_returns_none(self, value):
+        assert SQLiteMemoryRepository._parse_iso_or_none(value) is None
+
+
+class TestParseKeywordQuery:
+    def test_patterns_shortest_term_and_match_expr(self):
+        parsed = _parse_keyword_query('v100% say "hi"')
+        assert parsed.like_patterns == ("%v100\\%%", "%say%", '%"hi"%')
+        assert parsed.shortest_term == 3
+        assert parsed.match_expr == '"v100%" AND "say" AND """hi"""'
+
+    def test_terms_without_ascii_letters_become_byte_terms(self):
+        parsed = _parse_keyword_query("猫 100% Tea")
+        assert parsed.byte_terms == ("猫".encode(), b"100%")
+        assert parsed.like_patterns == ("%Tea%",)
+
+    def test_blank_query_has_no_terms(self):
+        parsed = _parse_keyword_query("   ")
+        assert parsed.like_patterns == ()
+        assert parsed.byte_terms == ()
+
+    def test_repeated_query_parsed_once(self):
+        _parse_keyword_query.cache_clear()
+        _parse_keyword_query("coffee beans")
+        _parse_keyword_query("coffee beans")
+        assert _parse_keyword_query.cache_info().hits == 1
+
+
+class TestParseJsonList:
+    def test_decoded_values_are_independent_copies(self):
+        first = SQLiteMemoryRepository._parse_json_list('["a", "b"]')
+        first.append("mutated")
+        assert SQLiteMemoryRepository._parse_json_list('["a", "b"]') == ["a", "b"]
+
+    @pytest.mark.parametrize("value", [None, "", "[]", "not json", '{"a": 1}'])
+    def test_empty_or_invalid_returns_empty_list(self, value):
+        assert SQLiteMemoryRepository._parse_json_list(value) == []
+
+
+class TestRowToMemory:
+    def test_snapshot_columns_round_trip(self, repo):
+        now = get_now()
+        repo.save(
+            _make_memory(
+                body_state={"fatigue": 0.4},
+                state_snapped_at=now,
+                last_accessed=now,
+            )
+        )
+        loaded = repo.find_by_key("memory_20250101120000").unwrap()
+        assert loaded.body_state == {"fatigue": 0.4}
+        assert loaded.state_snapped_at == now
+        assert loaded.last_accessed == now
+        loaded.body_state["fatigue"] = 1.0
+        assert repo.find_by_key("memory_20250101120000").unwrap().body_state == {"fatigue": 0.4}
+
+    def test_missing_optional_columns_default(self, repo):
+        repo.save(_make_memory())
+        columns = (
+            "key, content, created_at, updated_at, importance, emotion, emotion_intensity, tags, privacy_level,"
+            " physical_state, mental_state, environment, relationship_status, source_context, related_keys,"
+            " summary_ref, equipped_items, access_count"
+        )
+        row = repo._db.execute(f"SELECT {columns} FROM memories").fetchone()
+        memory = repo._row_to_memory(row)
+        assert memory.lifecycle_status == "active"
+        assert memory.body_state is None
+        assert memory.last_accessed is None
+
+
 class TestFindWithPagination:
     def test_basic_pagination(self, repo):
         _save_many(repo, 5)
@@ -116,6 +294,16 @@ class TestGetAllTags:
         assert "c_tag" in tags
         assert tags == sorted(set(tags))  # sorted, unique
 
+    def test_skips_tombstoned_and_invalid_tags(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "a", tags=["food"]))
+        repo.save(_make_memory("memory_20250101000002", "b", tags=["gone"]))
+        repo.save(_make_memory("memory_20250101000003", "c", tags=["broken"]))
+        db = repo._conn.get_memory_db()
+        db.execute("UPDATE memories SET lifecycle_status = 'tombstoned' WHERE key = 'memory_20250101000002'")
+        db.execute("UPDATE memories SET tags = 'not json' WHERE key = 'memory_20250101000003'")
+        db.commit()
+        assert repo.get_all_tags().unwrap() == ["food"]
+
 
 class TestGetByTags:
     def test_returns_memories_matching_all_tags(self, repo):
@@ -138,6 +326,59 @@ class TestGetByTags:
         assert result.is_ok
         assert result.unwrap() == []
 
+    def test_matches_tags_exactly(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "goal", tags=["goal", "active"]))
+        repo.save(_make_memory("memory_20250101000002", "lookalike", tags=["Goal_setting", "active"]))
+        keys = [m.key for m in repo.get_by_tags(["goal", "active", "goal"]).unwrap()]
+        assert keys == ["memory_20250101000001"]
+
+    def test_index_follows_resave_update_and_delete(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "v1", tags=["food"]))
+        repo.save(_make_memory("memory_20250101000001", "v2", tags=["work"]))
+        assert repo.get_by_tags(["food"]).unwrap() == []
+        repo.update("memory_20250101000001", tags=["food", "work"])
+        assert [m.content for m in repo.get_by_tags(["food", "work"]).unwrap()] == ["v2"]
+        repo.delete("memory_20250101000001")
+        assert repo.get_by_tags(["work"]).unwrap() == []
+        db = repo._conn.get_memory_db()
+        assert db.execute("SELECT COUNT(*) FROM memory_tags").fetchone()[0] == 0
+
+    def test_existing_rows_backfilled(self, sqlite_conn):
+        db = sqlite_conn.get_memory_db()
+        repo = SQLiteMemoryRepository(sqlite_conn)
+        repo.save(_make_memory("memory_20250101000001", "tagged", tags=["food"]))
+        db.execute("DROP TABLE memory_tags")
+        sqlite_conn.initialize_schema()
+        assert [m.key for m in repo.get_by_tags(["food"]).unwrap()] == ["memory_20250101000001"]
+
+
+class TestFindByTags:
+    def test_any_tag_matches_exactly(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "ramen", tags=["食事"]))
+        repo.save(_make_memory("memory_20250101000002", "work", tags=["仕事"]))
+        repo.save(_make_memory("memory_20250101000003", "prefix only", tags=["食事会"]))
+
+        keys = {m.key for m in repo.find_by_tags(["食事", "仕事"]).unwrap()}
+        assert keys == {"memory_20250101000001", "memory_20250101000002"}
+
+    def test_limit_respected(self, repo):
+        for i in range(5):
+            repo.save(_make_memory(f"memory_2025010100000{i}", f"tagged {i}", tags=["food"]))
+        assert len(repo.find_by_tags(["food"], limit=2).unwrap()) == 2
+
+    def test_empty_tags_returns_empty(self, repo):
+        repo.save(_make_memory(tags=["food"]))
+        assert repo.find_by_tags([]).unwrap() == []
+
+
+class TestFindByLifecycleStatus:
+    def test_returns_only_matching_status(self, repo):
+        _save_many(repo, 3)
+        repo.save(_make_memory(key="memory_archived", lifecycle_status="archived"))
+        found = repo.find_by_lifecycle_status("archived").unwrap()
+        assert [m.key for m in found] == ["memory_archived"]
+        assert repo.find_by_lifecycle_status("tombstoned").unwrap() == []
+
 
 class TestFindSmartRecent:
     def test_returns_memories(self, repo):
@@ -179,6 +420,176 @@ class TestSearchKeyword:
         assert result.is_ok
         assert len(result.unwrap()) == 2
 
+    def test_trigram_index_matches_japanese_substring(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "東京のラーメンはおいしい"))
+        repo.save(_make_memory("memory_20250101000002", "大阪のうどん"))
+        assert repo._has_trigram_index()
+        result = repo.search_keyword("ラーメン").unwrap()
+        assert [m.key for m, _ in result] == ["memory_20250101000001"]
+
+    def test_short_terms_fall_back_to_like(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "今日は仕事が忙しい"))
+        result = repo.search_keyword("仕事").unwrap()
+        assert [m.key for m, _ in result] == ["memory_20250101000001"]
+
+    def test_resaved_memory_not_duplicated(self, repo):
+        for i in range(3):
+            repo.save(_make_memory("memory_20250101000001", f"ramen night {i}"))
+        result = repo.search_keyword("ramen").unwrap()
+        assert [m.content for m, _ in result] == ["ramen night 2"]
+
+    def test_without_trigram_table_uses_like(self, sqlite_conn):
+        db = sqlite_conn.get_memory_db()
+        for trigger in ("memories_trigram_ai", "memories_trigram_ad", "memories_trigram_au"):
+            db.execute(f"DROP TRIGGER {trigger}")
+        db.execute("DROP TABLE memories_trigram")
+        repo = SQLiteMemoryRepository(sqlite_conn)
+        repo.save(_make_memory("memory_20250101000001", "ramen night"))
+        assert not repo._has_trigram_index()
+        assert len(repo.search_keyword("ramen").unwrap()) == 1
+
+    def test_tags_filter_applied_before_limit(self, repo):
+        # The newest matches lack the tag; an SQL-side filter still fills the limit
+        repo.save(_make_memory("memory_20250101000001", "ramen with friends", tags=["food", "social"]))
+        repo.save(_make_memory("memory_20250101000002", "ramen again", tags=["food"]))
+        repo.save(_make_memory("memory_20250101000003", "ramen recipe", tags=["cooking"]))
+        db = repo._conn.get_memory_db()
+        db.execute("UPDATE memories SET tags = 'not json' WHERE key = 'memory_20250101000003'")
+        db.commit()
+        for query in ("ramen", "ra"):  # trigram and LIKE paths
+            assert [m.key for m, _ in repo.search_keyword(query, limit=1, tags=["social"]).unwrap()] == [
+                "memory_20250101000001"
+            ]
+        keys = {m.key for m, _ in repo.search_keyword("ramen", tags=["food"]).unwrap()}
+        assert keys == {"memory_20250101000001", "memory_20250101000002"}
+        assert repo.search_keyword("ramen", tags=["food", "cooking"]).unwrap() == []
+        fts = repo.search_fts("ramen", top_k=1, tags=["food", "social"]).unwrap()
+        assert [m.key for m, _ in fts] == ["memory_20250101000001"]
+
+    def test_sql_text_cached_per_filter_shape(self):
+        from nous.infrastructure.sqlite.memory_repo import _keyword_search_sql
+
+        assert _keyword_search_sql(2, True, False) is _keyword_search_sql(2, True, False)
+        assert _keyword_search_sql(2, True, False).count("LIKE ?") == 2
+        assert "created_at_ts <= ?" not in _keyword_search_sql(2, True, False)
+
+    def test_short_japanese_and_symbol_terms_match_literally(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "猫が100%かわいい"))
+        repo.save(_make_memory("memory_20250101000002", "猫が1000円"))
+        hits = repo.search_keyword("猫 100%").unwrap()
+        assert [m.key for m, _ in hits] == ["memory_20250101000001"]
+        assert repo.search_keyword("犬").unwrap() == []
+
+    def test_mixed_case_query_scores_full_match(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "Tokyo Ramen is great"))
+        result = repo.search_keyword("TOKYO ramen").unwrap()
+        assert len(result) == 1
+        assert result[0][1] == 1.0
+
+    def test_like_wildcards_matched_literally(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "battery at 50% now"))
+        repo.save(_make_memory("memory_20250101000002", "battery at 500 now"))
+        repo.save(_make_memory("memory_20250101000003", "snake_case name"))
+        repo.save(_make_memory("memory_20250101000004", "snakeXcase name"))
+
+        percent = repo.search_keyword("50%").unwrap()
+        assert [m.key for m, _ in percent] == ["memory_20250101000001"]
+        underscore = repo.search_keyword("snake_case").unwrap()
+        assert [m.key for m, _ in underscore] == ["memory_20250101000003"]
+
+    def test_results_ordered_by_updated_at(self, repo, sqlite_conn):
+        now = get_now()
+        for i in range(3):
+            repo.save(_make_memory(f"memory_2025010100000{i}", f"keyword {i}"))
+            sqlite_conn.get_memory_db().execute(
+                "UPDATE memories SET updated_at = ? WHERE key = ?",
+                ((now - timedelta(hours=i)).isoformat(), f"memory_2025010100000{i}"),
+            )
+
+        results = repo.search_keyword("KEYWORD", limit=2).unwrap()
+        assert [m.key for m, _ in results] == ["memory_20250101000000", "memory_20250101000001"]
+        assert all(score == 1.0 for _, score in results)
+
+
+class TestFindByPeriod:
+    def test_returns_period_most_important_first(self, repo):
+        now = get_now()
+        for key, hours_ago, importance in (
+            ("memory_old", 48, 0.9),
+            ("memory_low", 2, 0.2),
+            ("memory_high", 3, 0.8),
+            ("memory_mid", 1, 0.5),
+        ):
+            created = now - timedelta(hours=hours_ago)
+            repo.save(Memory(key=key, content=key, created_at=created, updated_at=created, importance=importance))
+
+        since = now - timedelta(hours=24)
+        assert [m.key for m in repo.find_by_period(since).unwrap()] == ["memory_high", "memory_mid", "memory_low"]
+        assert [m.key for m in repo.find_by_period(since, limit=1).unwrap()] == ["memory_high"]
+        floor = repo.find_by_period(since, min_importance=0.5).unwrap()
+        assert [m.key for m in floor] == ["memory_high", "memory_mid"]
+        bounded = repo.find_by_period(now - timedelta(days=3), now - timedelta(days=1)).unwrap()
+        assert [m.key for m in bounded] == ["memory_old"]
+
+    def test_narrow_window_searches_the_composite_index(self, repo, sqlite_conn):
+        """A one-day window over older rows is read from the (created_at_ts, importance) index, not by importance."""
+        from nous.migration.versions.v035_created_importance_index import upgrade as upgrade_v035
+
+        db = sqlite_conn.get_memory_db()
+        upgrade_v035(db)
+        now = get_now()
+        for i in range(40):
+            created = now - timedelta(days=i * 10, hours=1)
+            repo.save(
+                Memory(key=f"memory_{i:02d}", content="m", created_at=created, updated_at=created, importance=0.9)
+            )
+        repo.save(Memory(key="memory_today", content="m", created_at=now, updated_at=now, importance=0.3))
+
+        statements: list[str] = []
+        db.set_trace_callback(statements.append)
+        try:
+            found = repo.find_by_period(now - timedelta(hours=24), limit=5).unwrap()
+        finally:
+            db.set_trace_callback(None)
+
+        assert [m.key for m in found] == ["memory_00", "memory_today"]
+        (sql,) = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        plan = " ".join(r[3] for r in db.execute(f"EXPLAIN QUERY PLAN {sql}"))
+        assert "SEARCH memories USING INDEX idx_memories_created_ts_importance" in plan
+
+
+class TestDateRangeFilter:
+    def test_filters_compare_instants_across_utc_offsets(self, repo, sqlite_conn):
+        repo.save(_make_memory("memory_20250101000001", "dated entry jst"))
+        repo.save(_make_memory("memory_20250101000002", "dated entry utc"))
+        db = sqlite_conn.get_memory_db()
+        # 12:00 JST and 02:00Z: lexically "2025-01-01T02" < "2025-01-01T12" but 02:00Z is 11:00 JST
+        db.execute("UPDATE memories SET created_at = '2025-01-01T12:00:00+09:00' WHERE key = 'memory_20250101000001'")
+        db.execute("UPDATE memories SET created_at = '2025-01-01T02:00:00Z' WHERE key = 'memory_20250101000002'")
+
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+
+        date_from = datetime(2025, 1, 1, 10, 30, tzinfo=ZoneInfo("Asia/Tokyo"))
+        date_to = datetime(2025, 1, 1, 11, 30, tzinfo=ZoneInfo("Asia/Tokyo"))
+        keys = [m.key for m, _ in repo.search_keyword("dated", date_from=date_from, date_to=date_to).unwrap()]
+        assert keys == ["memory_20250101000002"]
+
+    def test_naive_created_at_treated_as_jst(self, repo, sqlite_conn):
+        repo.save(_make_memory("memory_20250101000001", "naive entry"))
+        sqlite_conn.get_memory_db().execute(
+            "UPDATE memories SET created_at = '2025-01-01T12:00:00' WHERE key = 'memory_20250101000001'"
+        )
+        row = (
+            sqlite_conn.get_memory_db()
+            .execute("SELECT created_at_ts FROM memories WHERE key = 'memory_20250101000001'")
+            .fetchone()
+        )
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+
+        assert row["created_at_ts"] == datetime(2025, 1, 1, 12, tzinfo=ZoneInfo("Asia/Tokyo")).timestamp()
+
 
 class TestMemoryVersions:
     def test_save_and_get_versions(self, repo):
@@ -290,6 +701,25 @@ class TestCountDecayedImportant:
         assert result.unwrap() == 1
 
 
+class TestGetDistributions:
+    def test_empty_db(self, repo):
+        dist = repo.get_distributions().unwrap()
+        assert dist == {"tags": [], "emotions": [], "tagged_count": 0}
+
+    def test_histograms_over_active_memories(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "a", tags=["food", "travel"], emotion="joy"))
+        repo.save(_make_memory("memory_20250101000002", "b", tags=["food"], emotion="joy"))
+        repo.save(_make_memory("memory_20250101000003", "c", emotion="sadness"))
+        repo.save(_make_memory("memory_20250101000004", "d", tags=["food"], emotion="anger"))
+        db = repo._conn.get_memory_db()
+        db.execute("UPDATE memories SET lifecycle_status = 'tombstoned' WHERE key = 'memory_20250101000004'")
+        db.commit()
+        dist = repo.get_distributions().unwrap()
+        assert dist["tags"] == [("food", 2), ("travel", 1)]
+        assert dist["emotions"] == [("joy", 2), ("sadness", 1)]
+        assert dist["tagged_count"] == 2
+
+
 class TestGetMemoryIndex:
     def test_empty_db(self, repo):
         result = repo.get_memory_index()
@@ -316,6 +746,56 @@ class TestGetMemoryIndex:
         tag_names = [t[0] for t in index["top_tags"]]
         assert "milestone" in tag_names
 
+    def test_top_tags_counted_across_active_memories(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "a", tags=["food", "travel"]))
+        repo.save(_make_memory("memory_20250101000002", "b", tags=["food"]))
+        repo.save(_make_memory("memory_20250101000003", "c", tags=["food", "work"]))
+        repo.save(_make_memory("memory_20250101000004", "d", tags=["travel"]))
+        db = repo._conn.get_memory_db()
+        db.execute("UPDATE memories SET tags = 'not json' WHERE key = 'memory_20250101000004'")
+        db.execute("UPDATE memories SET lifecycle_status = 'tombstoned' WHERE key = 'memory_20250101000003'")
+        db.commit()
+        index = repo.get_memory_index().unwrap()
+        assert index["total"] == 3
+        assert index["top_tags"] == [("food", 2), ("travel", 1)]
+
+    def test_counts_and_emotions_from_one_pass(self, repo):
+        for i, (emotion, importance) in enumerate(
+            [("joy", 0.9), ("joy", 0.5), ("sadness", 0.85), ("", 0.95), ("anger", 0.1), ("joy", 0.9)], start=1
+        ):
+            m = _make_memory(f"memory_2025010100000{i}", f"m{i}", importance=importance)
+            m.emotion = emotion
+            repo.save(m)
+        db = repo._conn.get_memory_db()
+        db.execute("UPDATE memories SET lifecycle_status = 'tombstoned' WHERE key = 'memory_20250101000006'")
+        db.commit()
+        index = repo.get_memory_index().unwrap()
+        assert index["total"] == 5
+        assert index["high_importance_count"] == 3
+        assert index["emotion_dist"] == [("joy", 2), ("anger", 1), ("sadness", 1)]
+        assert index["emotion_others"] == 0
+
+    def test_null_importance_group_counts_as_not_high(self, repo):
+        repo.save(_make_memory("memory_20250101000001", "a", importance=0.9))
+        m = _make_memory("memory_20250101000002", "b")
+        m.emotion = "sadness"
+        repo.save(m)
+        db = repo._conn.get_memory_db()
+        db.execute("UPDATE memories SET importance = NULL WHERE key = 'memory_20250101000002'")
+        db.commit()
+        index = repo.get_memory_index().unwrap()
+        assert index["total"] == 2
+        assert index["high_importance_count"] == 1
+        assert isinstance(index["high_importance_count"], int)
+
+    def test_timeline_covers_last_twelve_months(self, repo):
+        now = get_now()
+        old = now - timedelta(days=400)
+        repo.save(_make_memory("memory_20250101000001", "recent"))
+        repo.save(Memory(key="memory_20250101000002", content="old", created_at=old, updated_at=old))
+        timeline = repo.get_memory_index().unwrap()["timeline"]
+        assert sum(cnt for _, cnt in timeline) == 1
+
 
 class TestFindRelationshipHighlights:
     def test_empty_db(self, repo):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 from zoneinfo import ZoneInfo
@@ -81,9 +82,23 @@ class InMemoryMemoryRepository:
     def find_all(self) -> Result[list[Memory], RepositoryError]:
         return Success(list(self._store.values()))
 
+    def get_distributions(self) -> Result[dict, RepositoryError]:
+        tags = Counter(t for m in self._store.values() for t in m.tags)
+        emotions = Counter(m.emotion for m in self._store.values())
+        return Success(
+            {
+                "tags": sorted(tags.items(), key=lambda x: (-x[1], x[0])),
+                "emotions": sorted(emotions.items(), key=lambda x: (-x[1], x[0])),
+                "tagged_count": sum(1 for m in self._store.values() if m.tags),
+            }
+        )
+
     def get_strength(self, key: str) -> Result[MemoryStrength | None, RepositoryError]:
         return Success(self._strengths.get(key))
 
+    def get_strength_values(self, keys: list[str]) -> Result[dict[str, float], RepositoryError]:
+        return Success({k: self._strengths[k].strength for k in keys if k in self._strengths})
+
     def save_strength(self, strength: MemoryStrength) -> Result[None, RepositoryError]:
         self._strengths[strength.memory_key] = strength
         return Success(None)
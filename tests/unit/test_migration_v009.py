@@ -7,6 +7,9 @@ import sqlite3
 
 from nous.migration.versions.v006_normalize_emotions import upgrade as upgrade_v006
 from nous.migration.versions.v008_add_persona_to_goals_promises import upgrade as upgrade_v008
+from nous.migration.versions.v033_created_at_ts import upgrade as upgrade_v033
+from nous.migration.versions.v034_importance_index import upgrade as upgrade_v034
+from nous.migration.versions.v035_created_importance_index import upgrade as upgrade_v035
 
 
 def _make_db():
@@ -653,3 +656,54 @@ def test_v008_new_rows_get_default_persona():
 
     row = conn.execute("SELECT persona FROM goals WHERE id='g2'").fetchone()
     assert row["persona"] == "test_user"
+
+
+def test_v033_adds_created_at_ts_and_index():
+    """v033 は created_at_ts 生成カラムとインデックスを追加し、2回実行しても安全。"""
+    conn = _make_db()
+    conn.execute(
+        "INSERT INTO memories (key, content, created_at, updated_at) "
+        "VALUES ('m1', 'x', '2025-01-01T12:00:00+09:00', '2025-01-01T12:00:00+09:00')"
+    )
+    upgrade_v033(conn)
+    upgrade_v033(conn)
+
+    row = conn.execute("SELECT created_at_ts FROM memories WHERE key='m1'").fetchone()
+    assert row["created_at_ts"] == 1735700400.0
+    indexes = [r[1] for r in conn.execute("PRAGMA index_list(memories)").fetchall()]
+    assert "idx_memories_created_at_ts" in indexes
+
+
+def test_v034_importance_index_serves_top_n():
+    """v034 は importance インデックスを追加し、上位N件の取得でソートを不要にする。"""
+    conn = _make_db()
+    upgrade_v034(conn)
+    upgrade_v034(conn)
+
+    indexes = [r[1] for r in conn.execute("PRAGMA index_list(memories)").fetchall()]
+    assert "idx_memories_importance" in indexes
+    plan = " ".join(
+        r[3] for r in conn.execute("EXPLAIN QUERY PLAN SELECT * FROM memories ORDER BY importance DESC LIMIT 5")
+    )
+    assert "idx_memories_importance" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_v035_composite_index_serves_period_queries():
+    """v035 は (created_at_ts, importance) 複合インデックスに置き換え、期間＋重要度の絞り込みに使う。"""
+    conn = _make_db()
+    upgrade_v033(conn)
+    upgrade_v035(conn)
+    upgrade_v035(conn)
+
+    indexes = [r[1] for r in conn.execute("PRAGMA index_list(memories)").fetchall()]
+    assert "idx_memories_created_ts_importance" in indexes
+    assert "idx_memories_created_at_ts" not in indexes
+    plan = " ".join(
+        r[3]
+        for r in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM memories WHERE created_at_ts >= ? AND importance >= ?", (0.0, 0.3)
+        )
+    )
+    assert "SEARCH" in plan
+    assert "idx_memories_created_ts_importance" in plan
@@ -307,6 +307,37 @@ class TestMaybeRunMentalModel:
         assert len(meta_calls) == 1
         assert "last_decision_abstraction:" in meta_calls[0][1]["content"]
 
+    async def test_prompt_uses_newest_twenty_memories(self):
+        """Only the 20 most recent memories of a type reach the LLM prompt."""
+        ctx = _make_mock_ctx()
+        config = _make_mock_config()
+
+        now = datetime.now()
+        decision_mems = [
+            _make_memory(
+                f"dec_{i}", f"decision content {i:02d}", tags=["decision"], created_at=now - timedelta(hours=i)
+            )
+            for i in range(25)
+        ]
+        _set_get_by_tags(ctx, {"_meta": [], "decision": decision_mems[::-1]})
+
+        prompts: list[str] = []
+        mock_provider = AsyncMock()
+
+        async def mock_stream(**kwargs):
+            prompts.append(kwargs["messages"][0].content)
+            yield TextDeltaEvent(content='{"models": ["pattern"]}')
+            yield DoneEvent()
+
+        mock_provider.stream = mock_stream
+
+        with patch("nous.application.chat.pattern_detector.get_provider", return_value=mock_provider):
+            await maybe_run_mental_model(ctx, config)
+
+        (prompt,) = prompts
+        assert prompt.index("decision content 00") < prompt.index("decision content 19")
+        assert "decision content 20" not in prompt
+
     async def test_does_not_reprocess_already_abstracted_groups(self):
         """Groups with no new memories since last abstraction are skipped."""
         ctx = _make_mock_ctx()
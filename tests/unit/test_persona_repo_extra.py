@@ -9,7 +9,6 @@ from nous.domain.shared.time_utils import get_now
 from nous.infrastructure.sqlite.connection import SQLiteConnection
 from nous.infrastructure.sqlite.persona_repo import (
     SQLitePersonaRepository,
-    _parse_or_none,
     _safe_float,
 )
 
@@ -43,22 +42,6 @@ class TestSafeFloat:
         assert _safe_float("1") == 1.0
 
 
-class TestParseOrNone:
-    def test_none_returns_none(self):
-        assert _parse_or_none(None) is None
-
-    def test_empty_string_returns_none(self):
-        assert _parse_or_none("") is None
-
-    def test_valid_iso_string(self):
-        result = _parse_or_none("2025-01-01T00:00:00+09:00")
-        assert result is not None
-        assert result.year == 2025
-
-    def test_invalid_string_returns_none(self):
-        assert _parse_or_none("not-a-date") is None
-
-
 class TestGetEmotionHistoryByDays:
     def test_returns_empty_when_no_records(self, persona_repo):
         result = persona_repo.get_emotion_history_by_days(PERSONA, days=7)
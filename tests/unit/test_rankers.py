@@ -58,6 +58,14 @@ class TestForgettingCurveRanker:
         assert ranked[0].memory.key == "b"
         assert ranked[1].memory.key == "a"
 
+    def test_batch_lookup_called_once_for_all_results(self) -> None:
+        batch = MagicMock(return_value={"a": 0.5})
+        ranker = ForgettingCurveRanker(batch_lookup=batch)
+        results = [_make_result("a", 1.0), _make_result("b", 0.8)]
+        ranked = ranker.rank(results, SearchQuery(text="test"))
+        batch.assert_called_once_with(["a", "b"])
+        assert [(r.memory.key, r.score) for r in ranked] == [("b", pytest.approx(0.8)), ("a", pytest.approx(0.5))]
+
 
 class TestChainedRanker:
     def test_applies_rankers_in_order(self) -> None:
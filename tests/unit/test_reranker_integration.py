@@ -47,6 +47,21 @@ class TestRerankerModelScoreBlending:
         assert abs(reranked[0][1] - 0.78) < 1e-6, f"Expected 0.78, got {reranked[0][1]}"
         assert abs(reranked[1][1] - 0.45) < 1e-6, f"Expected 0.45, got {reranked[1][1]}"
 
+    def test_top_k_selects_highest_blended_scores(self):
+        """Only the top_k blended scores are returned, in descending order."""
+        from nous.infrastructure.embedding.reranker import RerankerModel
+
+        model = RerankerModel(model_name="test-model", enabled=True)
+        model._model = MagicMock()
+        model._model.predict.return_value = [0.1, 0.9, 0.5, 0.7, 0.3]
+        results = [(f"key{i}", 0.0) for i in range(5)]
+        contents = {key: f"doc {key}" for key, _ in results}
+
+        reranked = model.rerank("query", results, contents, top_k=3)
+
+        assert [key for key, _ in reranked] == ["key1", "key3", "key2"]
+        assert all(isinstance(score, float) for _, score in reranked)
+
     def test_disabled_returns_original_order(self):
         """When enabled=False, rerank() returns original results sliced to top_k."""
         from nous.infrastructure.embedding.reranker import RerankerModel
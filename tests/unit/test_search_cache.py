@@ -0,0 +1,125 @@
+"""Tests for SearchResultCache and its use in SearchEngine."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+from nous.domain.memory.entities import Memory
+from nous.domain.search.cache import SearchResultCache
+from nous.domain.search.engine import SearchEngine, SearchQuery, SearchResult
+from nous.domain.shared.result import Success
+
+
+def _mem(key: str) -> Memory:
+    now = datetime.now(UTC)
+    return Memory(key=key, content="content", created_at=now, updated_at=now)
+
+
+def _result(key: str) -> SearchResult:
+    return SearchResult(memory=_mem(key), score=1.0, source="keyword")
+
+
+class TestSearchResultCache:
+    def test_hit_returns_copy(self):
+        cache = SearchResultCache()
+        key = cache.make_key("p", SearchQuery(text="q"))
+        cache.put(key, "v1", [_result("k1")])
+        hit = cache.get(key, "v1")
+        assert [r.memory.key for r in hit] == ["k1"]
+        hit.clear()
+        assert len(cache.get(key, "v1")) == 1
+
+    def test_version_change_is_miss(self):
+        cache = SearchResultCache()
+        key = cache.make_key("p", SearchQuery(text="q"))
+        cache.put(key, "v1", [_result("k1")])
+        assert cache.get(key, "v2") is None
+        assert len(cache) == 0
+
+    def test_ttl_expiry(self):
+        cache = SearchResultCache(ttl_seconds=10.0)
+        key = cache.make_key("p", SearchQuery(text="q"))
+        with patch("nous.domain.search.cache.time.monotonic", return_value=100.0):
+            cache.put(key, "v1", [_result("k1")])
+        with patch("nous.domain.search.cache.time.monotonic", return_value=111.0):
+            assert cache.get(key, "v1") is None
+
+    def test_lru_eviction(self):
+        cache = SearchResultCache(max_entries=2)
+        k1, k2, k3 = (cache.make_key("p", SearchQuery(text=t)) for t in ("a", "b", "c"))
+        cache.put(k1, "v", [])
+        cache.put(k2, "v", [])
+        cache.get(k1, "v")  # k1 becomes most recent
+        cache.put(k3, "v", [])
+        assert cache.get(k2, "v") is None
+        assert cache.get(k1, "v") == []
+
+    def test_key_distinguishes_filters_and_persona(self):
+        base = SearchResultCache.make_key("p", SearchQuery(text="q", tags=["a"]))
+        assert base == SearchResultCache.make_key("p", SearchQuery(text="q", tags=["a"]))
+        assert base != SearchResultCache.make_key("p", SearchQuery(text="q", tags=["b"]))
+        assert base != SearchResultCache.make_key("other", SearchQuery(text="q", tags=["a"]))
+
+
+class TestSearchEngineCache:
+    def _engine(self, version="v1"):
+        kw = MagicMock()
+        kw.search.return_value = Success([(_mem("k1"), 1.0)])
+        repo = MagicMock()
+        repo.data_version.return_value = Success(version)
+        engine = SearchEngine(keyword_search=kw, memory_repo=repo, result_cache=SearchResultCache())
+        return engine, kw, repo
+
+    def test_repeated_query_served_from_cache(self):
+        engine, kw, _ = self._engine()
+        query = SearchQuery(text="hello", mode="keyword")
+        first = engine.search(query)
+        second = engine.search(query)
+        assert [r.memory.key for r in second.value] == [r.memory.key for r in first.value]
+        kw.search.assert_called_once()
+
+    def test_write_invalidates_cache(self):
+        engine, kw, repo = self._engine()
+        query = SearchQuery(text="hello", mode="keyword")
+        engine.search(query)
+        repo.data_version.return_value = Success("v2")
+        engine.search(query)
+        assert kw.search.call_count == 2
+
+    def test_no_cache_configured_always_searches(self):
+        kw = MagicMock()
+        kw.search.return_value = Success([])
+        engine = SearchEngine(keyword_search=kw, memory_repo=MagicMock())
+        query = SearchQuery(text="hello", mode="keyword")
+        engine.search(query)
+        engine.search(query)
+        assert kw.search.call_count == 2
+
+    def test_concurrent_searches_share_the_cache_safely(self, monkeypatch):
+        import itertools
+        import time
+        import types
+        from concurrent.futures import ThreadPoolExecutor
+
+        from nous.domain.search import cache
+
+        def yielding_monotonic() -> float:
+            # give up the GIL between the entry lookup and the eviction that follows it
+            time.sleep(0)
+            return time.monotonic()
+
+        monkeypatch.setattr(cache, "time", types.SimpleNamespace(monotonic=yielding_monotonic))
+        kw = MagicMock()
+        kw.search.return_value = Success([(_mem("k1"), 1.0)])
+        repo = MagicMock()
+        # the version keeps changing, so entries are invalidated, rewritten and evicted concurrently
+        versions = itertools.count()
+        repo.data_version.side_effect = lambda: Success(next(versions) % 3)
+        engine = SearchEngine(keyword_search=kw, memory_repo=repo, result_cache=SearchResultCache(max_entries=4))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda i: engine.search(SearchQuery(text=f"q{i % 6}", mode="keyword")), range(2000))
+            )
+        assert all(r.is_ok for r in results)
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from nous.domain.memory.entities import Memory
 from nous.domain.search.clue_generator import ClueGenerator, _parse_clues
-from nous.domain.search.engine import SearchEngine, SearchQuery, SearchResult
+from nous.domain.search.engine import SearchEngine, SearchQuery, SearchResult, _dedupe_top, _expand_query
 from nous.domain.search.ranker import ForgettingCurveRanker, RRFRanker
 from nous.domain.shared.result import Failure, Success
+from nous.domain.value_objects import normalize_emotion
 
 UTC = UTC
 
@@ -109,6 +111,15 @@ class TestRRFRanker:
         # The newer memory should be ranked first due to high recency weight
         assert ranked[0].memory.key == "new_key"
 
+    def test_recency_reads_clock_once_per_ranking(self):
+        ranker = RRFRanker(k=60)
+        query = SearchQuery(text="test", recency_weight=1.0)
+        results = [_result(f"key_{i}", score=0.5, source="keyword") for i in range(5)]
+        with patch("nous.domain.search.ranker.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime.now(UTC)
+            ranker.rank(results, query)
+        mock_dt.now.assert_called_once_with(UTC)
+
     def test_recency_weight_with_naive_datetime(self):
         """Memory created_at without tzinfo should be handled gracefully."""
         ranker = RRFRanker(k=60)
@@ -273,6 +284,28 @@ class TestSearchEngineSearch:
         result = engine.search(SearchQuery(text="hello", mode="smart"))
         assert result.is_ok
 
+    def test_smart_mode_batches_semantic_subqueries(self):
+        kw = _make_keyword_strategy([])
+        sem = MagicMock()
+        sem.search_many.return_value = Success([[(_mem("orig"), 0.9)], [(_mem("tea"), 0.8)], [(_mem("cake"), 0.7)]])
+        engine = SearchEngine(keyword_search=kw, semantic_search=sem)
+        result = engine.search(SearchQuery(text="tea cake", mode="smart", date_range="7d"))
+
+        sem.search.assert_not_called()
+        sem.search_many.assert_called_once()
+        args, kwargs = sem.search_many.call_args
+        assert args[0] == ["tea cake", "tea", "cake"]
+        assert kwargs["date_from"] is not None
+        assert {r.memory.key for r in result.value} == {"orig", "tea", "cake"}
+
+    def test_smart_mode_batch_failure_keeps_keyword_results(self):
+        kw = _make_keyword_strategy([(_mem("kw"), 0.5)])
+        sem = MagicMock()
+        sem.search_many.side_effect = RuntimeError("qdrant down")
+        engine = SearchEngine(keyword_search=kw, semantic_search=sem)
+        result = engine.search(SearchQuery(text="tea cake", mode="smart"))
+        assert [r.memory.key for r in result.value] == ["kw"]
+
     def test_hybrid_empty_results(self):
         kw = _make_keyword_strategy([])
         sem = _make_semantic_strategy([])
@@ -312,6 +345,55 @@ class TestSearchEngineSearch:
         assert result.is_ok
         assert len(result.value) <= 3
 
+    def test_hybrid_overlaps_semantic_with_fts(self):
+        """The semantic branch runs on a worker thread while the FTS query runs here."""
+        started = threading.Event()
+        repo = MagicMock()
+
+        def fts(*args, **kwargs):
+            # Only returns once the semantic search is already in flight
+            assert started.wait(timeout=5)
+            return Success([(_mem("fts_key"), 0.7)])
+
+        def semantic(*args, **kwargs):
+            started.set()
+            return Success([(_mem("sem_key"), 0.9)])
+
+        repo.search_fts.side_effect = fts
+        sem = MagicMock()
+        sem.search.side_effect = semantic
+        kw = _make_keyword_strategy([(_mem("kw_key"), 0.7)])
+        engine = SearchEngine(keyword_search=kw, semantic_search=sem, memory_repo=repo)
+        result = engine.search(SearchQuery(text="hello", mode="hybrid", top_k=10))
+        assert {r.memory.key for r in result.value} == {"kw_key", "fts_key", "sem_key"}
+
+    def test_hybrid_skips_keyword_scan_when_semantic_is_confident(self):
+        kw = _make_keyword_strategy([(_mem("kw_key"), 0.7)])
+        sem = MagicMock()
+        sem.search.return_value = Success([(_mem("s1"), 0.95), (_mem("s2"), 0.9)])
+        engine = SearchEngine(keyword_search=kw, semantic_search=sem)
+        result = engine.search(SearchQuery(text="hello", mode="hybrid", top_k=2))
+        kw.search.assert_not_called()
+        assert [r.memory.key for r in result.value] == ["s1", "s2"]
+
+    def test_hybrid_runs_keyword_scan_when_semantic_is_weak_or_short(self):
+        for hits in ([(_mem("s1"), 0.95), (_mem("s2"), 0.5)], [(_mem("s1"), 0.95)]):
+            kw = _make_keyword_strategy([(_mem("kw_key"), 0.7)])
+            sem = MagicMock()
+            sem.search.return_value = Success(hits)
+            engine = SearchEngine(keyword_search=kw, semantic_search=sem)
+            result = engine.search(SearchQuery(text="hello", mode="hybrid", top_k=2))
+            kw.search.assert_called_once()
+            assert "kw_key" in {r.memory.key for r in result.value}
+
+    def test_hybrid_semantic_exception_keeps_keyword_results(self):
+        kw = _make_keyword_strategy([(_mem("kw_key"), 0.7)])
+        sem = MagicMock()
+        sem.search.side_effect = RuntimeError("qdrant down")
+        engine = SearchEngine(keyword_search=kw, semantic_search=sem)
+        result = engine.search(SearchQuery(text="hello", mode="hybrid"))
+        assert [r.memory.key for r in result.value] == ["kw_key"]
+
 
 class TestSearchEngineFilterByEmotion:
     def test_no_emotion_filter_returns_all(self):
@@ -343,6 +425,105 @@ class TestSearchEngineFilterByEmotion:
         out = SearchEngine._filter_by_emotion(results, "joy")
         assert len(out) == 1
 
+    def test_each_distinct_label_normalized_once(self):
+        results = [_result(f"k{i}", score=1.0, emotion="happy" if i % 2 else "sadness") for i in range(10)]
+        with patch("nous.domain.search.engine.normalize_emotion", wraps=normalize_emotion) as norm:
+            out = SearchEngine._filter_by_emotion(results, "joy")
+        assert [r.memory.key for r in out] == ["k1", "k3", "k5", "k7", "k9"]
+        assert norm.call_count == 3  # target + two distinct labels
+
+
+class TestSearchEngineImportanceFilter:
+    def test_filter_by_importance_drops_low(self):
+        results = [_result("k1", score=1.0, importance=0.9), _result("k2", score=0.9, importance=0.2)]
+        out = SearchEngine._filter_by_importance(results, 0.5)
+        assert [r.memory.key for r in out] == ["k1"]
+
+    def test_semantic_receives_pushdown_filters(self):
+        sem = MagicMock()
+        sem.search.return_value = Success([(_mem("k1", importance=0.8, emotion="joy"), 0.9)])
+        kw = MagicMock()
+        kw.search.return_value = Success([])
+        engine = SearchEngine(keyword_search=kw, semantic_search=sem)
+        result = engine.search(SearchQuery(text="hello", mode="semantic", min_importance=0.5, emotion="joy"))
+        assert result.is_ok
+        sem.search.assert_called_once_with(
+            "hello", limit=5, date_from=None, date_to=None, min_importance=0.5, emotion="joy"
+        )
+
+    def test_semantic_call_unchanged_without_filters(self):
+        sem = MagicMock()
+        sem.search.return_value = Success([])
+        engine = SearchEngine(keyword_search=MagicMock(), semantic_search=sem)
+        engine.search(SearchQuery(text="hello", mode="semantic"))
+        sem.search.assert_called_once_with("hello", limit=5, date_from=None, date_to=None)
+
+
+class TestSearchEngineRecentBrowse:
+    def test_empty_query_served_from_find_recent(self):
+        kw = MagicMock()
+        repo = MagicMock()
+        repo.find_recent.return_value = Success([_mem("k1"), _mem("k2")])
+        engine = SearchEngine(keyword_search=kw, memory_repo=repo)
+        result = engine.search(SearchQuery(text="  ", top_k=2))
+        assert [r.memory.key for r in result.value] == ["k1", "k2"]
+        assert all(r.source == "recent" for r in result.value)
+        repo.find_recent.assert_called_once_with(limit=2)
+        kw.search.assert_not_called()
+
+    def test_empty_query_with_filter_uses_strategies(self):
+        kw = MagicMock()
+        kw.search.return_value = Success([])
+        repo = MagicMock()
+        engine = SearchEngine(keyword_search=kw, memory_repo=repo)
+        engine.search(SearchQuery(text="", mode="keyword", date_range="7d"))
+        repo.find_recent.assert_not_called()
+        kw.search.assert_called_once()
+
+
+class TestSearchEngineTagFilter:
+    def _tagged(self, key: str, tags: list[str]) -> Memory:
+        m = _mem(key)
+        m.tags = tags
+        return m
+
+    def test_empty_query_with_tags_served_from_get_by_tags(self):
+        kw = MagicMock()
+        repo = MagicMock()
+        repo.get_by_tags.return_value = Success([self._tagged(f"k{i}", ["promise"]) for i in range(5)])
+        engine = SearchEngine(keyword_search=kw, memory_repo=repo)
+        result = engine.search(SearchQuery(text="", tags=["promise"], top_k=3))
+        repo.get_by_tags.assert_called_once_with(["promise"])
+        kw.search.assert_not_called()
+        assert [r.memory.key for r in result.value] == ["k0", "k1", "k2"]
+        assert all(r.source == "tags" for r in result.value)
+
+    def test_text_query_drops_results_missing_a_tag(self):
+        kw = MagicMock()
+        kw.search.return_value = Success(
+            [(self._tagged("k1", ["goal", "active"]), 1.0), (self._tagged("k2", ["goal"]), 1.0)]
+        )
+        engine = SearchEngine(keyword_search=kw)
+        result = engine.search(SearchQuery(text="goals", mode="keyword", tags=["goal", "active"]))
+        assert [r.memory.key for r in result.value] == ["k1"]
+
+    def test_tags_pushed_to_semantic_strategy(self):
+        kw = MagicMock()
+        sem = MagicMock()
+        sem.search.return_value = Success([])
+        engine = SearchEngine(keyword_search=kw, semantic_search=sem)
+        engine.search(SearchQuery(text="goals", mode="semantic", tags=["goal"]))
+        sem.search.assert_called_once_with("goals", limit=5, date_from=None, date_to=None, tags=["goal"])
+
+    def test_tags_pushed_to_keyword_and_fts(self):
+        kw = _make_keyword_strategy([])
+        repo = MagicMock()
+        repo.search_fts.return_value = Success([])
+        engine = SearchEngine(keyword_search=kw, memory_repo=repo)
+        engine.search(SearchQuery(text="goals", mode="hybrid", tags=["goal"]))
+        kw.search.assert_called_once_with("goals", limit=5, date_from=None, date_to=None, tags=["goal"])
+        assert repo.search_fts.call_args.kwargs["tags"] == ["goal"]
+
 
 # ---------------------------------------------------------------------------
 # SearchEngine date_range integration tests (P1)
@@ -534,3 +715,33 @@ class TestMemoRAGSearchFallback:
         query = SearchQuery(text="test", mode="memorag", top_k=5)
         result = engine.search(query)
         assert result.is_ok
+
+
+class TestDedupeTop:
+    def test_keeps_best_score_per_key(self):
+        results = [_result("k1", score=0.2), _result("k2", score=0.5), _result("k1", score=0.9)]
+        out = _dedupe_top(results)
+        assert [(r.memory.key, r.score) for r in out] == [("k1", 0.9), ("k2", 0.5)]
+
+    def test_top_k_matches_full_sort_slice(self):
+        results = [_result(f"k{i % 7}", score=(i * 37 % 11) / 10) for i in range(40)]
+        full = _dedupe_top(results)
+        assert [r.memory.key for r in _dedupe_top(results, 3)] == [r.memory.key for r in full[:3]]
+
+
+class TestExpandQuery:
+    def test_splits_on_whitespace_and_japanese_punctuation(self):
+        text = "猫の名前、好きな食べ物　(趣味) x"
+        assert _expand_query(text) == (text, "猫の名前", "好きな食べ物", "趣味")
+
+    def test_caps_at_four_queries(self):
+        assert _expand_query("aa bb cc dd ee") == ("aa bb cc dd ee", "aa", "bb", "cc")
+
+    def test_single_segment_is_not_repeated(self):
+        assert _expand_query("記憶") == ("記憶",)
+
+    def test_repeated_query_is_served_from_cache(self):
+        first = _expand_query("いつもの あれ")
+        hits = _expand_query.cache_info().hits
+        assert _expand_query("いつもの あれ") is first
+        assert _expand_query.cache_info().hits == hits + 1
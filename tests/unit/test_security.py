@@ -21,7 +21,7 @@ from nous.api.mcp.middleware import resolve_persona_from_headers
 from nous.domain.shared.errors import MigrationError
 from nous.domain.shared.result import Failure
 from nous.infrastructure.sqlite.connection import SQLiteConnection
-from nous.migration.importers.legacy_importer import LegacyImporter
+from nous.migration.importers.legacy_importer import LegacyImporter, _open_source_db
 
 pytestmark = pytest.mark.unit
 
@@ -229,6 +229,25 @@ class TestZipSlipPrevention:
         assert isinstance(result, Failure)
         assert isinstance(result.error, MigrationError)
 
+    def test_source_db_opened_read_only(self, tmp_path, sqlite_conn):
+        """Legacy source databases are opened read-only and still import."""
+        source_dir = tmp_path / "legacy"
+        source_dir.mkdir()
+        db_path = source_dir / "memory.sqlite"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE memory_blocks (block_name TEXT)")
+        conn.close()
+
+        src = _open_source_db(db_path)
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                src.execute("CREATE TABLE injected (x)")
+        finally:
+            src.close()
+
+        importer = LegacyImporter(target_connection=sqlite_conn, persona="test")
+        assert importer.import_from_directory(str(source_dir)).is_ok
+
 
 # =========================================================================
 # Group 3: Query Parameter Validation
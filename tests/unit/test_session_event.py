@@ -112,6 +112,15 @@ class TestSessionEventRepository:
         assert found.summary == "memory_create: hello"
         assert found.id == row_id
 
+    def test_insert_returns_each_rows_id(self, repo: SessionEventRepository, sqlite_conn):
+        row_ids = [
+            repo.insert(SessionEvent(session_id="sess_001", persona="p", event_type="tool_call", summary=f"e{i}"))
+            for i in range(3)
+        ]
+        rows = sqlite_conn.get_memory_db().execute("SELECT id, summary FROM session_events ORDER BY id").fetchall()
+        assert row_ids == [r["id"] for r in rows]
+        assert [r["summary"] for r in rows] == ["e0", "e1", "e2"]
+
     def test_get_by_session_orders_by_timestamp_desc(self, repo: SessionEventRepository):
         ts1 = datetime(2026, 1, 1, 10, 0, 0)
         ts2 = datetime(2026, 1, 1, 11, 0, 0)
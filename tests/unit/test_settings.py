@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
 from nous.config.settings import (
     EmbeddingConfig,
     ForgettingConfig,
@@ -88,6 +93,16 @@ class TestSettings:
         assert s.timezone == "UTC"
         assert s.log_level == "DEBUG"
 
+    def test_timezone_validated_against_cached_zone_list(self, monkeypatch):
+        Settings()
+        with patch("zoneinfo.available_timezones") as scan:
+            monkeypatch.setenv("NOUS_TIMEZONE", "Mars/Olympus")
+            with pytest.raises(ValidationError, match="Invalid timezone"):
+                Settings()
+            monkeypatch.setenv("NOUS_TIMEZONE", "Europe/Paris")
+            assert Settings().timezone == "Europe/Paris"
+        scan.assert_not_called()
+
     def test_env_override_nested(self, monkeypatch):
         monkeypatch.setenv("NOUS_SERVER__PORT", "9999")
         s = Settings()
@@ -226,6 +226,14 @@ Body content
         # invalid JSON metadata is ignored, stays None
         assert result["metadata"] is None
 
+    def test_frontmatter_ignores_unknown_and_indented_keys_are_read(self):
+        raw = "---\n  name: indented\nnames: not-a-field\nauthor: someone\r\ndescription: crlf\r\n---\nBody"
+        result = _parse_skill_md("dir", raw)
+        assert result["name"] == "indented"
+        assert result["description"] == "crlf"
+        assert result["license"] is None
+        assert result["content"] == "Body"
+
     def test_name_validation_valid(self):
         raw = "---\nname: valid-name-123\n---\nBody"
         result = _parse_skill_md("dir", raw)
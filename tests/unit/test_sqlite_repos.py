@@ -50,6 +50,43 @@ def equipment_repo(sqlite_conn):
 # ---------------------------------------------------------------------------
 
 
+class TestSQLiteConnection:
+    def test_connection_is_reused_with_pragmas(self, sqlite_conn: SQLiteConnection):
+        db = sqlite_conn.get_memory_db()
+        assert sqlite_conn.get_memory_db() is db
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert db.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert db.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_fts_reindexes_only_on_content_change(self, sqlite_conn: SQLiteConnection):
+        repo = SQLiteMemoryRepository(sqlite_conn)
+        now = get_now()
+        repo.save(Memory(key="memory_20250101120000", content="green tea", created_at=now, updated_at=now))
+        db = sqlite_conn.get_memory_db()
+        before = db.total_changes
+        repo.update("memory_20250101120000", importance=0.9)
+        # Only the memories row itself changes; the FTS copy is untouched
+        assert db.total_changes - before == 1
+        repo.update("memory_20250101120000", content="black coffee")
+        assert [m.key for m, _ in repo.search_fts("coffee").unwrap()] == ["memory_20250101120000"]
+        assert repo.search_fts("tea").unwrap() == []
+
+    def test_global_skills_db_opened_once_under_concurrency(self, tmp_path, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from nous.infrastructure.sqlite import connection
+
+        monkeypatch.setattr(connection, "_global_skills_conn", None)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            conns = list(pool.map(lambda _: connection.get_global_skills_db(str(tmp_path)), range(16)))
+        try:
+            assert all(c is conns[0] for c in conns)
+            assert conns[0].execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conns[0].close()
+
+
 class TestSQLiteMemoryRepo:
     def _make_memory(self, key: str = "memory_20250101120000", content: str = "test") -> Memory:
         now = get_now()
@@ -146,6 +183,26 @@ class TestSQLiteMemoryRepo:
         assert s.stability == 2.0
         assert s.recall_count == 3
 
+    def test_save_strengths_batch(self, memory_repo: SQLiteMemoryRepository):
+        keys = [f"memory_2025010100000{i}" for i in range(3)]
+        for key in keys:
+            memory_repo.save(self._make_memory(key))
+        memory_repo.save_strength(MemoryStrength(memory_key=keys[0], strength=1.0))
+        batch = [MemoryStrength(memory_key=k, strength=0.4, recall_count=i) for i, k in enumerate(keys)]
+        assert memory_repo.save_strengths(batch).unwrap() == 3
+        assert memory_repo.save_strengths([]).unwrap() == 0
+        saved = {s.memory_key: s for s in memory_repo.get_all_strengths().unwrap()}
+        assert [(saved[k].strength, saved[k].recall_count) for k in keys] == [(0.4, 0), (0.4, 1), (0.4, 2)]
+
+    def test_get_strength_values_batch(self, memory_repo: SQLiteMemoryRepository):
+        keys = [f"memory_2025010100000{i}" for i in range(2)]
+        for key in keys:
+            memory_repo.save(self._make_memory(key))
+        memory_repo.save_strengths([MemoryStrength(memory_key=k, strength=0.25 * (i + 1)) for i, k in enumerate(keys)])
+        values = memory_repo.get_strength_values([*keys, "memory_missing"]).unwrap()
+        assert values == {keys[0]: 0.25, keys[1]: 0.5}
+        assert memory_repo.get_strength_values([]).unwrap() == {}
+
     def test_save_and_get_block(self, memory_repo: SQLiteMemoryRepository):
         memory_repo.save_block("test_block", "block content", block_type="system")
         result = memory_repo.get_block("test_block")
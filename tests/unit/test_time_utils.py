@@ -11,7 +11,9 @@ from nous.domain.shared.time_utils import (
     get_now,
     parse_date_range,
     parse_iso,
+    parse_iso_or_none,
     relative_time_str,
+    to_epoch,
 )
 
 TZ = ZoneInfo("Asia/Tokyo")
@@ -35,6 +37,18 @@ class TestGetNow:
         now = get_now("UTC")
         assert str(now.tzinfo) == "UTC"
 
+    def test_default_zone_not_rebuilt_per_call(self):
+        with patch("nous.domain.shared.time_utils.ZoneInfo") as zone_info:
+            get_now()
+            format_iso(datetime(2025, 1, 1))
+        zone_info.assert_not_called()
+
+    def test_custom_zone_resolved_once(self):
+        get_now("Europe/Paris")
+        with patch("nous.domain.shared.time_utils.ZoneInfo") as zone_info:
+            assert str(get_now("Europe/Paris").tzinfo) == "Europe/Paris"
+        zone_info.assert_not_called()
+
 
 class TestFormatIso:
     def test_aware_datetime(self):
@@ -50,6 +64,18 @@ class TestFormatIso:
         assert "+09:00" in result
 
 
+class TestToEpoch:
+    def test_aware_datetime(self):
+        dt = datetime(2025, 1, 1, 12, 0, 0, tzinfo=TZ)
+        assert to_epoch(dt) == dt.timestamp()
+
+    def test_naive_datetime_treated_as_tokyo(self):
+        assert (
+            to_epoch(datetime(2025, 1, 1, 12, 0, 0))
+            == datetime(2025, 1, 1, 3, 0, 0, tzinfo=ZoneInfo("UTC")).timestamp()
+        )
+
+
 class TestParseIso:
     def test_roundtrip(self):
         dt = datetime(2025, 3, 20, 15, 45, 0, tzinfo=TZ)
@@ -66,6 +92,22 @@ class TestParseIso:
         assert dt.day == 1
 
 
+class TestParseIsoOrNone:
+    def test_none_returns_none(self):
+        assert parse_iso_or_none(None) is None
+
+    def test_empty_string_returns_none(self):
+        assert parse_iso_or_none("") is None
+
+    def test_valid_iso_string(self):
+        result = parse_iso_or_none("2025-01-01T00:00:00+09:00")
+        assert result is not None
+        assert result.year == 2025
+
+    def test_invalid_string_returns_none(self):
+        assert parse_iso_or_none("not-a-date") is None
+
+
 class TestGenerateMemoryKey:
     def test_default_prefix(self):
         key = generate_memory_key()
@@ -94,6 +136,11 @@ class TestGenerateMemoryKey:
         key = generate_memory_key()
         assert key
 
+    def test_uses_given_time(self):
+        now = datetime(2025, 6, 15, 4, 5, 6, 7, tzinfo=TZ)
+        key = generate_memory_key(now=now)
+        assert key.startswith("memory_20250615040506_000007_")
+
 
 class TestRelativeTimeStr:
     def test_just_now(self):
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from nous.domain.memory.type_classifier import TYPE_TAGS, auto_tags, classify
+from nous.domain.memory.type_classifier import TYPE_TAGS, _has_resolution, _is_code_line, auto_tags, classify
 
 # ---------------------------------------------------------------------------
 # classify() — English
@@ -107,6 +107,17 @@ class TestCodeFiltering:
         )
         assert classify(content) == "milestone"
 
+    def test_code_line_detection(self):
+        for line in ("```js", "import os", "$ ls -la", "git status", "for x in items:", "obj.method(1)"):
+            assert _is_code_line(line), line
+        for line in ("important notes", "I decided to use SQLite", ""):
+            assert not _is_code_line(line), line
+
+    def test_resolution_phrases(self):
+        assert _has_resolution("Finally FIGURED it OUT after hours")
+        assert _has_resolution("やっと動いた")
+        assert not _has_resolution("the prefix was unresolved")
+
 
 # ---------------------------------------------------------------------------
 # Edge cases
@@ -124,6 +135,9 @@ class TestEdgeCases:
         # Completely neutral content with no markers
         assert classify("The sky is blue today and the weather is nice") is None
 
+    def test_uppercase_content_still_matches(self):
+        assert classify("WE DECIDED TO GO WITH THE NEW ARCHITECTURE") == "decision"
+
     def test_type_tags_constant(self):
         assert frozenset({"decision", "preference", "milestone", "problem", "emotional"}) == TYPE_TAGS
 
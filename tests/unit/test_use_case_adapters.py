@@ -48,7 +48,7 @@ class TestSQLiteKeywordSearch:
 
         adapter = SQLiteKeywordSearch(repo)
         adapter.search("query", limit=5)
-        repo.search_keyword.assert_called_once_with("query", 5, date_from=None, date_to=None)
+        repo.search_keyword.assert_called_once_with("query", 5, date_from=None, date_to=None, tags=None)
 
 
 class TestQdrantSemanticSearch:
@@ -75,7 +75,7 @@ class TestQdrantSemanticSearch:
         vs.search.return_value = Success([("mem_001", 0.9)])
 
         repo = MagicMock()
-        repo.find_by_key.return_value = Success(memory)
+        repo.find_by_keys.return_value = Success({"mem_001": memory})
 
         adapter = QdrantSemanticSearch(vs, repo)
         adapter.persona = "test"
@@ -90,13 +90,91 @@ class TestQdrantSemanticSearch:
         vs.search.return_value = Success([("mem_missing", 0.9)])
 
         repo = MagicMock()
-        repo.find_by_key.return_value = Success(None)  # not found
+        repo.find_by_keys.return_value = Success({})  # not found
 
         adapter = QdrantSemanticSearch(vs, repo)
         result = adapter.search("query")
         assert result.is_ok
         assert result.value == []
 
+    def test_search_hydrates_hits_in_one_call(self):
+        vs = MagicMock()
+        vs.search.return_value = Success([("mem_b", 0.9), ("mem_a", 0.8)])
+        repo = MagicMock()
+        repo.find_by_keys.return_value = Success({"mem_a": _make_memory("mem_a"), "mem_b": _make_memory("mem_b")})
+
+        adapter = QdrantSemanticSearch(vs, repo)
+        result = adapter.search("query")
+        repo.find_by_keys.assert_called_once_with(["mem_b", "mem_a"], date_from=None, date_to=None)
+        repo.find_by_key.assert_not_called()
+        assert [m.key for m, _ in result.value] == ["mem_b", "mem_a"]
+
+    def test_search_pushes_filters_to_vector_store(self):
+        vs = MagicMock()
+        vs.search.return_value = Success([("mem_hi", 0.9), ("mem_lo", 0.8)])
+        repo = MagicMock()
+        hi, lo = _make_memory("mem_hi"), _make_memory("mem_lo")
+        hi.importance, lo.importance = 0.9, 0.1
+        repo.find_by_keys.return_value = Success({"mem_hi": hi, "mem_lo": lo})
+
+        adapter = QdrantSemanticSearch(vs, repo)
+        adapter.persona = "p"
+        result = adapter.search("query", min_importance=0.5, emotion="joy")
+        vs.build_filter.assert_called_once_with(
+            min_importance=0.5, emotion="joy", tags=None, date_from=None, date_to=None
+        )
+        vs.search.assert_called_once_with("p", "query", 10, query_filter=vs.build_filter.return_value)
+        # Legacy points without payload still get post-filtered on importance
+        assert [m.key for m, _ in result.value] == ["mem_hi"]
+
+    def test_search_pushes_tags_and_post_filters_legacy_points(self):
+        vs = MagicMock()
+        vs.search.return_value = Success([("mem_goal", 0.9), ("mem_other", 0.8)])
+        repo = MagicMock()
+        goal, other = _make_memory("mem_goal"), _make_memory("mem_other")
+        goal.tags, other.tags = ["goal", "active"], ["goal"]
+        repo.find_by_keys.return_value = Success({"mem_goal": goal, "mem_other": other})
+
+        adapter = QdrantSemanticSearch(vs, repo)
+        adapter.persona = "p"
+        result = adapter.search("query", limit=5, tags=["goal", "active"])
+        vs.build_filter.assert_called_once_with(
+            min_importance=None, emotion=None, tags=["goal", "active"], date_from=None, date_to=None
+        )
+        # Over-fetched to make room for payload-less points the filter lets through
+        vs.search.assert_called_once_with("p", "query", 10, query_filter=vs.build_filter.return_value)
+        assert [m.key for m, _ in result.value] == ["mem_goal"]
+
+    def test_search_many_hydrates_all_queries_once(self):
+        vs = MagicMock()
+        vs.search_batch.return_value = Success([[("mem_a", 0.9), ("mem_b", 0.8)], [("mem_b", 0.7)]])
+        repo = MagicMock()
+        repo.find_by_keys.return_value = Success({"mem_a": _make_memory("mem_a"), "mem_b": _make_memory("mem_b")})
+
+        adapter = QdrantSemanticSearch(vs, repo)
+        adapter.persona = "p"
+        result = adapter.search_many(["first", "second"], limit=5)
+        vs.search_batch.assert_called_once_with("p", ["first", "second"], 5, query_filter=None)
+        repo.find_by_keys.assert_called_once_with(["mem_a", "mem_b"], date_from=None, date_to=None)
+        assert [[m.key for m, _ in hits] for hits in result.value] == [["mem_a", "mem_b"], ["mem_b"]]
+
+    def test_vector_store_search_batch_is_one_request(self):
+        import numpy as np
+
+        from nous.infrastructure.qdrant.adapter import QdrantVectorStore
+
+        embedding = MagicMock()
+        embedding.encode_batch.return_value = np.zeros((2, 4))
+        store = QdrantVectorStore(MagicMock(), embedding)
+        hit = MagicMock(payload={"key": "mem_a"}, score=0.9)
+        store.client_manager.client.query_batch_points.return_value = [MagicMock(points=[hit]), MagicMock(points=[])]
+
+        result = store.search_batch("p", ["first", "second"], limit=3)
+        embedding.encode_batch.assert_called_once_with(["first", "second"], is_query=True)
+        requests = store.client_manager.client.query_batch_points.call_args.kwargs["requests"]
+        assert len(requests) == 2
+        assert result.value == [[("mem_a", 0.9)], []]
+
     def test_search_uses_persona(self):
         vs = MagicMock()
         vs.search.return_value = Success([])
@@ -109,7 +187,7 @@ class TestQdrantSemanticSearch:
 
 
 class TestQdrantSemanticSearchDateFiltering:
-    """Tests for date-based post-filtering in QdrantSemanticSearch.search()."""
+    """Tests for date-range handling in QdrantSemanticSearch.search()."""
 
     def _make_naive_memory(self, key: str, content: str, days_ago: int):
         """Create a memory with a timezone-naive created_at (simulating SQLite return)."""
@@ -118,87 +196,50 @@ class TestQdrantSemanticSearchDateFiltering:
         naive_dt = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days_ago)
         return Memory(key=key, content=content, created_at=naive_dt, updated_at=naive_dt)
 
-    def test_date_from_filters_older_memories(self):
-        """date_from should exclude memories created before that date."""
-        old_mem = self._make_naive_memory("mem_old", "old", days_ago=10)
-        new_mem = self._make_naive_memory("mem_new", "new", days_ago=1)
-
-        vs = MagicMock()
-        vs.search.return_value = Success([("mem_old", 0.8), ("mem_new", 0.9)])
-
-        repo = MagicMock()
-
-        def find_by_key(key: str):
-            return Success(old_mem if key == "mem_old" else new_mem)
-
-        repo.find_by_key.side_effect = find_by_key
-
-        adapter = QdrantSemanticSearch(vs, repo)
-        adapter.persona = "test"
-        # date_from = 5 days ago (timezone-aware, as parse_date_range returns)
+    def test_date_range_pushed_into_hydration_query(self):
+        """date_from/date_to are applied by find_by_keys, not re-checked per row."""
         from datetime import datetime
 
-        date_from = datetime.now(UTC) - timedelta(days=5)
-        result = adapter.search("query", date_from=date_from)
-        assert result.is_ok
-        assert len(result.value) == 1
-        assert result.value[0][0].key == "mem_new"
-
-    def test_date_to_filters_newer_memories(self):
-        """date_to should exclude memories created after that date."""
-        old_mem = self._make_naive_memory("mem_old", "old", days_ago=10)
-        new_mem = self._make_naive_memory("mem_new", "new", days_ago=1)
-
+        kept = self._make_naive_memory("mem_new", "new", days_ago=1)
         vs = MagicMock()
         vs.search.return_value = Success([("mem_old", 0.8), ("mem_new", 0.9)])
-
         repo = MagicMock()
-
-        def find_by_key(key: str):
-            return Success(old_mem if key == "mem_old" else new_mem)
-
-        repo.find_by_key.side_effect = find_by_key
+        # The repository drops out-of-range keys
+        repo.find_by_keys.return_value = Success({"mem_new": kept})
 
         adapter = QdrantSemanticSearch(vs, repo)
         adapter.persona = "test"
+        date_from = datetime.now(UTC) - timedelta(days=15)
+        date_to = datetime.now(UTC) - timedelta(days=5)
+        result = adapter.search("query", date_from=date_from, date_to=date_to)
+        repo.find_by_keys.assert_called_once_with(["mem_old", "mem_new"], date_from=date_from, date_to=date_to)
+        assert [m.key for m, _ in result.value] == ["mem_new"]
+
+    def test_date_range_against_sqlite(self, tmp_path):
+        """End-to-end with a real repository: only memories inside the range survive."""
         from datetime import datetime
 
-        date_to = datetime.now(UTC) - timedelta(days=5)
-        result = adapter.search("query", date_to=date_to)
-        assert result.is_ok
-        assert len(result.value) == 1
-        assert result.value[0][0].key == "mem_old"
+        from nous.infrastructure.sqlite.connection import SQLiteConnection
+        from nous.infrastructure.sqlite.memory_repo import SQLiteMemoryRepository
 
-    def test_date_from_and_to_together(self):
-        """Both date_from and date_to should filter in the correct range."""
-        old = self._make_naive_memory("mem_old", "old", days_ago=20)
-        mid = self._make_naive_memory("mem_mid", "mid", days_ago=10)
-        new = self._make_naive_memory("mem_new", "new", days_ago=1)
+        conn = SQLiteConnection(data_dir=str(tmp_path), persona="test")
+        conn.initialize_schema()
+        repo = SQLiteMemoryRepository(conn)
+        now = datetime.now(UTC)
+        for key, days_ago in (("mem_old", 20), ("mem_mid", 10), ("mem_new", 1)):
+            created = now - timedelta(days=days_ago)
+            repo.save(Memory(key=key, content=key, created_at=created, updated_at=created))
 
         vs = MagicMock()
         vs.search.return_value = Success([("mem_old", 0.7), ("mem_mid", 0.8), ("mem_new", 0.9)])
-
-        repo = MagicMock()
-
-        def find_by_key(key: str):
-            mapping = {"mem_old": old, "mem_mid": mid, "mem_new": new}
-            return Success(mapping[key])
-
-        repo.find_by_key.side_effect = find_by_key
-
         adapter = QdrantSemanticSearch(vs, repo)
         adapter.persona = "test"
-        from datetime import datetime
+        result = adapter.search("query", date_from=now - timedelta(days=15), date_to=now - timedelta(days=5))
+        conn.close()
+        assert [m.key for m, _ in result.value] == ["mem_mid"]
 
-        date_from = datetime.now(UTC) - timedelta(days=15)
-        date_to = datetime.now(UTC) - timedelta(days=5)
-        result = adapter.search("query", date_from=date_from, date_to=date_to)
-        assert result.is_ok
-        assert len(result.value) == 1
-        assert result.value[0][0].key == "mem_mid"
-
-    def test_date_filter_increases_fetch_limit(self):
-        """When date filter is active, fetch_limit should be 3x the requested limit."""
+    def test_date_filter_pushed_to_vector_store(self):
+        """The date range goes into the Qdrant filter; over-fetch covers payload-less points."""
         vs = MagicMock()
         vs.search.return_value = Success([])
         repo = MagicMock()
@@ -207,9 +248,12 @@ class TestQdrantSemanticSearchDateFiltering:
         adapter.persona = "test"
         from datetime import datetime
 
-        adapter.search("query", limit=5, date_from=datetime.now(UTC))
-        # fetch_limit = 5 * 3 = 15
-        vs.search.assert_called_once_with("test", "query", 15)
+        date_from = datetime.now(UTC)
+        adapter.search("query", limit=5, date_from=date_from)
+        vs.build_filter.assert_called_once_with(
+            min_importance=None, emotion=None, tags=None, date_from=date_from, date_to=None
+        )
+        vs.search.assert_called_once_with("test", "query", 10, query_filter=vs.build_filter.return_value)
 
     def test_date_filter_no_dates_uses_normal_limit(self):
         """Without date filter, fetch_limit should equal the requested limit."""
@@ -232,12 +276,7 @@ class TestQdrantSemanticSearchDateFiltering:
         vs.search.return_value = Success([(f"mem_{i}", 0.9 - i * 0.1) for i in range(4)])
 
         repo = MagicMock()
-
-        def find_by_key(key: str):
-            idx = int(key.split("_")[1])
-            return Success(memories[idx])
-
-        repo.find_by_key.side_effect = find_by_key
+        repo.find_by_keys.return_value = Success({m.key: m for m in memories})
 
         adapter = QdrantSemanticSearch(vs, repo)
         adapter.persona = "test"
@@ -247,6 +286,134 @@ class TestQdrantSemanticSearchDateFiltering:
         assert len(result.value) == 2  # Should break at limit=2
 
 
+class TestQdrantPayloadFilter:
+    """Tests for the payload filter/metadata helpers on the Qdrant adapter."""
+
+    def test_no_conditions_returns_none(self):
+        from nous.infrastructure.qdrant.adapter import QdrantVectorStore
+
+        assert QdrantVectorStore.build_filter() is None
+
+    def test_conditions_allow_points_without_payload(self):
+        from nous.infrastructure.qdrant.adapter import QdrantVectorStore
+
+        query_filter = QdrantVectorStore.build_filter(min_importance=0.5, emotion="joy")
+        dumped = query_filter.model_dump(exclude_none=True)
+        importance, emotion = dumped["must"]
+        assert importance["should"][0] == {"key": "importance", "range": {"gte": 0.5}}
+        assert importance["should"][1] == {"is_empty": {"key": "importance"}}
+        assert emotion["should"][0]["match"] == {"value": "joy"}
+
+    def test_decay_query_carries_score_threshold(self):
+        import numpy as np
+
+        from nous.infrastructure.qdrant.adapter import QdrantVectorStore
+
+        store = QdrantVectorStore.__new__(QdrantVectorStore)
+        store.quantization = False
+        request = store._build_decay_query(np.zeros(4), 5, score_threshold=0.85)
+        assert request.score_threshold == 0.85
+        assert store._build_decay_query(np.zeros(4), 5).score_threshold is None
+
+    def test_quantization_rescores_with_oversampling(self):
+        import numpy as np
+
+        from nous.infrastructure.qdrant.adapter import QdrantVectorStore
+
+        store = QdrantVectorStore(MagicMock(), MagicMock())
+        assert store._quantization_config().scalar.type == "int8"
+        prefetch = store._build_decay_query(np.zeros(4), 5).prefetch[0]
+        assert prefetch.params.quantization.rescore is True
+        assert prefetch.params.quantization.oversampling == 2.0
+
+        store = QdrantVectorStore(MagicMock(), MagicMock(), quantization=False)
+        assert store._quantization_config() is None
+        assert store._build_decay_query(np.zeros(4), 5).prefetch[0].params is None
+
+    def test_existing_collection_gains_quantization_and_missing_indexes(self):
+        from nous.infrastructure.qdrant.adapter import QdrantVectorStore
+
+        store = QdrantVectorStore(MagicMock(), MagicMock())
+        client = store.client_manager.client
+        existing = MagicMock()
+        existing.name = "memory_p"
+        client.get_collections.return_value.collections = [existing]
+        info = client.get_collection.return_value
+        info.config.quantization_config = None
+        info.payload_schema = {"importance": {}, "emotion": {}, "tag_list": {}}
+
+        assert store.ensure_collection("p").is_ok
+        client.create_collection.assert_not_called()
+        assert client.update_collection.call_args.kwargs["quantization_config"].scalar.type == "int8"
+        (index_call,) = client.create_payload_index.call_args_list
+        assert index_call.kwargs["field_name"] == "created_at_ts"
+
+    def test_upgrade_skipped_when_collection_current(self):
+        from nous.infrastructure.qdrant.adapter import _PAYLOAD_INDEXES, QdrantVectorStore
+
+        store = QdrantVectorStore(MagicMock(), MagicMock(), quantization=False)
+        client = store.client_manager.client
+        client.get_collection.return_value.payload_schema = dict.fromkeys(_PAYLOAD_INDEXES, {})
+        store._upgrade_collection("memory_p")
+        client.update_collection.assert_not_called()
+        client.create_payload_index.assert_not_called()
+
+    def test_memory_payload_normalizes_emotion(self):
+        from nous.infrastructure.qdrant.adapter import memory_payload
+
+        m = _make_memory()
+        m.importance = 0.7
+        m.emotion = "happy"
+        m.tags = ["goal", "active"]
+        assert memory_payload(m) == {
+            "importance": 0.7,
+            "emotion": "joy",
+            "tag_list": ["goal", "active"],
+            "created_at_ts": m.created_at.timestamp(),
+        }
+
+    def test_tags_filter_requires_every_tag(self):
+        from nous.infrastructure.qdrant.adapter import QdrantVectorStore
+
+        dumped = QdrantVectorStore.build_filter(tags=["goal", "active"]).model_dump(exclude_none=True)
+        (tag_condition,) = dumped["must"]
+        all_tags, missing_payload = tag_condition["should"]
+        assert [c["match"]["value"] for c in all_tags["must"]] == ["goal", "active"]
+        assert missing_payload == {"is_empty": {"key": "created_at_ts"}}
+
+    def test_tags_filter_excludes_untagged_memories(self):
+        from qdrant_client import QdrantClient
+        from qdrant_client.models import Distance, PointStruct, VectorParams
+
+        from nous.infrastructure.qdrant.adapter import QdrantVectorStore
+
+        client = QdrantClient(":memory:")
+        client.create_collection("memory_p", vectors_config=VectorParams(size=2, distance=Distance.COSINE))
+        client.upsert(
+            "memory_p",
+            [
+                PointStruct(id=1, vector=[1.0, 0.0], payload={"tag_list": ["goal"], "created_at_ts": 1.0}),
+                PointStruct(id=2, vector=[1.0, 0.0], payload={"tag_list": [], "created_at_ts": 1.0}),
+                PointStruct(id=3, vector=[1.0, 0.0], payload={"tag_list": ["other"], "created_at_ts": 1.0}),
+                PointStruct(id=4, vector=[1.0, 0.0], payload={"content": "legacy"}),
+            ],
+        )
+        points, _ = client.scroll("memory_p", scroll_filter=QdrantVectorStore.build_filter(tags=["goal"]))
+        assert sorted(p.id for p in points) == [1, 4]
+
+    def test_date_range_filters_on_created_at_ts(self):
+        from datetime import datetime
+
+        from nous.infrastructure.qdrant.adapter import QdrantVectorStore
+
+        date_from = datetime(2026, 1, 1, tzinfo=UTC)
+        dumped = QdrantVectorStore.build_filter(date_from=date_from).model_dump(exclude_none=True)
+        (date_condition,) = dumped["must"]
+        in_range, missing_payload = date_condition["should"]
+        assert in_range == {"key": "created_at_ts", "range": {"gte": date_from.timestamp()}}
+        assert missing_payload == {"is_empty": {"key": "created_at_ts"}}
+
+
 # ──────────────────────────────────────────────
 # AppContext / AppContextRegistry tests
 # ──────────────────────────────────────────────
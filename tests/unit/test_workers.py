@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
 
 from nous.application.workers.cleanup_worker import CleanupWorker
+from nous.application.workers.consolidation_worker import ConsolidationWorker
 from nous.application.workers.rebuild_worker import RebuildWorker
 from nous.domain.memory.entities import Memory
 from nous.domain.shared.errors import VectorStoreError
@@ -56,9 +60,9 @@ class TestRebuildWorker:
         assert result.is_ok
         assert result.unwrap() == 0
 
-    def test_rebuild_upserts_all_memories(self):
+    def test_rebuild_upserts_all_memories_in_one_batch(self):
         vs = MagicMock()
-        vs.upsert.return_value = Success(None)
+        vs.upsert_batch.return_value = Success(3)
         memories = [_make_memory(f"mem_{i:03d}", f"content {i}") for i in range(3)]
         ctx = _make_context(memories=memories, vs=vs)
 
@@ -66,26 +70,24 @@ class TestRebuildWorker:
         result = worker.rebuild()
         assert result.is_ok
         assert result.unwrap() == 3
-        assert vs.upsert.call_count == 3
+        vs.upsert_batch.assert_called_once()
+        vs.upsert.assert_not_called()
+        assert vs.upsert_batch.call_args[0][1] == [(m.key, m.content) for m in memories]
 
-    def test_rebuild_skips_failed_upserts(self):
+    def test_rebuild_fails_when_batch_upsert_fails(self):
         vs = MagicMock()
-        vs.upsert.side_effect = [
-            Success(None),
-            Failure(VectorStoreError("upsert error")),
-            Success(None),
-        ]
+        vs.upsert_batch.return_value = Failure(VectorStoreError("upsert error"))
         memories = [_make_memory(f"mem_{i:03d}") for i in range(3)]
         ctx = _make_context(memories=memories, vs=vs)
 
         worker = RebuildWorker(ctx)
         result = worker.rebuild()
-        assert result.is_ok
-        assert result.unwrap() == 2  # Only 2 successful upserts
+        assert not result.is_ok
+        assert isinstance(result.error, VectorStoreError)
 
     def test_rebuild_passes_correct_metadata(self):
         vs = MagicMock()
-        vs.upsert.return_value = Success(None)
+        vs.upsert_batch.return_value = Success(1)
         m = _make_memory("mem_001", "hello world")
         m.importance = 0.8
         m.emotion = "joy"
@@ -94,11 +96,10 @@ class TestRebuildWorker:
 
         RebuildWorker(ctx).rebuild()
 
-        call_args = vs.upsert.call_args
+        call_args = vs.upsert_batch.call_args
         assert call_args[0][0] == "test"  # persona
-        assert call_args[0][1] == "mem_001"  # key
-        assert call_args[0][2] == "hello world"  # content
-        metadata = call_args[0][3]
+        assert call_args[0][1] == [("mem_001", "hello world")]
+        metadata = call_args.kwargs["metadata"][0]
         assert metadata["importance"] == 0.8
         assert metadata["emotion"] == "joy"
         assert "tag1" in metadata["tags"]
@@ -132,59 +133,92 @@ class TestCleanupWorker:
         ctx = _make_context(find_all_fails=True, vs=vs)
         worker = CleanupWorker(ctx)
         worker._cleanup_cycle()
-        # find_all was called but vs.search was not (early return)
-        vs.search.assert_not_called()
+        # find_all was called but nothing was embedded (early return)
+        ctx.embedding_model.encode_batch.assert_not_called()
 
-    def test_cleanup_cycle_with_no_duplicates(self):
-        vs = MagicMock()
-        # search returns results with score below threshold
-        vs.search.return_value = Success([("mem_002", 0.5)])
-        memories = [_make_memory("mem_001", "unique content")]
-        ctx = _make_context(memories=memories, vs=vs)
+    def test_cleanup_cycle_embeds_all_memories_in_one_batch(self):
+        memories = [_make_memory("mem_001", "tea"), _make_memory("mem_002", "coffee")]
+        ctx = _make_context(memories=memories, vs=MagicMock())
+        ctx.embedding_model.encode_batch.return_value = np.array([[1.0, 0.0], [0.0, 1.0]])
 
         worker = CleanupWorker(ctx)
-        worker._cleanup_cycle()
-        vs.search.assert_called_once()
+        with patch("nous.application.workers.cleanup_worker.logger") as log:
+            worker._cleanup_cycle()
+        ctx.embedding_model.encode_batch.assert_called_once_with(["tea", "coffee"])
+        ctx.vector_store.search.assert_not_called()
+        log.info.assert_not_called()
 
-    def test_cleanup_cycle_detects_duplicate(self):
-        vs = MagicMock()
-        # Return a near-duplicate with high score
-        vs.search.return_value = Success([("mem_002", 0.99)])
-        memories = [_make_memory("mem_001", "content")]
-        ctx = _make_context(memories=memories, vs=vs)
+    def test_cleanup_cycle_detects_duplicate_once_per_pair(self):
+        memories = [_make_memory(k) for k in ("mem_001", "mem_002", "mem_003")]
+        ctx = _make_context(memories=memories, vs=MagicMock())
+        ctx.embedding_model.encode_batch.return_value = np.array([[1.0, 0.0], [0.99, 0.141], [0.0, 1.0]])
 
         worker = CleanupWorker(ctx)
-        worker._cleanup_cycle()
-        # Should have searched for the memory
-        vs.search.assert_called_once()
-
-    def test_cleanup_cycle_skips_already_seen_keys(self):
-        vs = MagicMock()
-
-        # mem_001 returns mem_002 as duplicate; then mem_002 is in seen_keys
-        def fake_search(persona, content, limit):
-            if "first" in content:
-                return Success([("mem_002", 0.99)])
-            return Success([])
-
-        vs.search.side_effect = fake_search
-        memories = [
-            _make_memory("mem_001", "first content"),
-            _make_memory("mem_002", "second content"),
-        ]
-        ctx = _make_context(memories=memories, vs=vs)
+        with patch("nous.application.workers.cleanup_worker.logger") as log:
+            worker._cleanup_cycle()
+        # mem_002 is flagged by mem_001 and then skipped, so the pair is reported once
+        pairs = [call.args[1:3] for call in log.info.call_args_list]
+        assert pairs == [("mem_001", "mem_002")]
+
+    def test_cleanup_cycle_handles_embedding_failure(self):
+        ctx = _make_context(memories=[_make_memory("mem_001")], vs=MagicMock())
+        ctx.embedding_model.encode_batch.side_effect = RuntimeError("model unavailable")
         worker = CleanupWorker(ctx)
-        worker._cleanup_cycle()
-
-        # mem_002 was in seen_keys so second call wasn't made
-        assert vs.search.call_count == 1
-
-    def test_cleanup_cycle_handles_failed_search(self):
-        vs = MagicMock()
-        vs.search.return_value = Failure(VectorStoreError("search error"))
-        memories = [_make_memory("mem_001")]
-        ctx = _make_context(memories=memories, vs=vs)
+        worker._cleanup_cycle()  # Should not raise
+
+
+class TestConsolidationGrouping:
+    def test_groups_by_shared_entities(self):
+        worker = ConsolidationWorker(MagicMock())
+        mems = [_make_memory(k) for k in ("a", "b", "c", "d")]
+        entities = {"a": {"e1"}, "b": {"e2"}, "c": {"e1", "e2"}, "d": set()}
+        groups = worker._group_by_entities(mems, entities)
+        assert {k: [m.key for m in v] for k, v in groups.items()} == {"a": ["a", "c"], "b": ["b"], "d": ["d"]}
+
+    def test_group_entities_grow_as_members_join(self):
+        worker = ConsolidationWorker(MagicMock())
+        mems = [_make_memory(k) for k in ("a", "b", "c")]
+        # "c" only shares e2, which "a"'s group gained when "b" joined
+        entities = {"a": {"e1"}, "b": {"e1", "e2"}, "c": {"e2"}}
+        groups = worker._group_by_entities(mems, entities)
+        assert [m.key for m in groups["a"]] == ["a", "b", "c"]
+
+    def test_tie_goes_to_earliest_group(self):
+        worker = ConsolidationWorker(MagicMock())
+        mems = [_make_memory(k) for k in ("a", "b", "c")]
+        entities = {"a": {"e1"}, "b": {"e2"}, "c": {"e2", "e1"}}
+        groups = worker._group_by_entities(mems, entities)
+        assert [m.key for m in groups["a"]] == ["a", "c"]
+        assert [m.key for m in groups["b"]] == ["b"]
+
+    def test_consolidate_loads_only_archived_memories(self):
+        worker = ConsolidationWorker(MagicMock())
+        ctx = MagicMock()
+        ctx.memory_repo.find_by_lifecycle_status.return_value = Success([_make_memory("a")])
+        worker._consolidate_persona(ctx, "p")
+        ctx.memory_repo.find_by_lifecycle_status.assert_called_once_with("archived")
+        ctx.memory_repo.find_all.assert_not_called()
 
-        worker = CleanupWorker(ctx)
-        worker._cleanup_cycle()
-        vs.search.assert_called_once()
+    def test_build_consolidated_lists_newest_twenty(self):
+        worker = ConsolidationWorker(MagicMock())
+        base = get_now()
+        mems = [_make_memory(f"m{i:02d}", f"content {i}") for i in range(25)]
+        for i, mem in enumerate(mems):
+            mem.created_at = base - timedelta(days=i)
+        lines = worker._build_consolidated(mems).splitlines()
+        assert lines[0] == "## Consolidated Memory Group (25 merged)"
+        assert len(lines) == 21
+        assert lines[1] == f"- [{base:%Y-%m-%d}] content 0"
+        assert lines[-1].endswith("content 19")
+
+    def test_consolidates_largest_groups_up_to_cap(self):
+        worker = ConsolidationWorker(MagicMock())
+        worker.max_consolidated = 1
+        ctx = MagicMock()
+        mems = [_make_memory(k) for k in ("a", "b", "c", "d", "e", "f", "g")]
+        ctx.memory_repo.find_by_lifecycle_status.return_value = Success(mems)
+        shared = {"a": "e1", "b": "e1", "c": "e1", "d": "e2", "e": "e2", "f": "e2", "g": "e2"}
+        ctx.entity_repo.get_memory_entities.side_effect = lambda key: Success([MagicMock(id=shared[key])])
+        worker._consolidate_persona(ctx, "p")
+        ctx.memory_service.create_memory.assert_called_once()
+        assert ctx.memory_service.create_memory.call_args.kwargs["related_keys"] == ["d", "e", "f", "g"]